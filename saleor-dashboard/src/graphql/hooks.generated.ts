@@ -14113,29 +14113,39 @@ export type ProductReviewModerateMutationHookResult = ReturnType<typeof useProdu
 export type ProductReviewModerateMutationResult = Apollo.MutationResult<Types.ProductReviewModerateMutation>;
 export type ProductReviewModerateMutationOptions = Apollo.BaseMutationOptions<Types.ProductReviewModerateMutation, Types.ProductReviewModerateMutationVariables>;
 export const ProductReviewsPendingDocument = gql`
-    query ProductReviewsPending {
-  productReviewsPending {
-    id
-    product {
-      id
-      name
-      slug
-      thumbnail {
-        url
+    query ProductReviewsPending($first: Int, $after: String, $last: Int, $before: String) {
+  productReviewsPending(first: $first, after: $after, last: $last, before: $before) {
+    edges {
+      node {
+        id
+        product {
+          id
+          name
+          slug
+          thumbnail {
+            url
+          }
+        }
+        user {
+          id
+          email
+          firstName
+          lastName
+        }
+        rating
+        text
+        image1
+        image2
+        createdAt
+        isPublished
       }
     }
-    user {
-      id
-      email
-      firstName
-      lastName
-    }
-    rating
-    text
-    image1
-    image2
-    createdAt
-    isPublished
+    pageInfo {
+      endCursor
+      hasNextPage
+      hasPreviousPage
+      startCursor
+    }
   }
 }
     `;
@@ -14152,10 +14162,14 @@ export const ProductReviewsPendingDocument = gql`
  * @example
  * const { data, loading, error } = useProductReviewsPendingQuery({
  *   variables: {
+ *      first: // value for 'first'
+ *      after: // value for 'after'
+ *      last: // value for 'last'
+ *      before: // value for 'before'
  *   },
  * });
  */
-export function useProductReviewsPendingQuery(baseOptions?: ApolloReactHooks.QueryHookOptions<Types.ProductReviewsPendingQuery, Types.ProductReviewsPendingQueryVariables>) {
+export function useProductReviewsPendingQuery(baseOptions: ApolloReactHooks.QueryHookOptions<Types.ProductReviewsPendingQuery, Types.ProductReviewsPendingQueryVariables>) {
         const options = {...defaultOptions, ...baseOptions}
         return ApolloReactHooks.useQuery<Types.ProductReviewsPendingQuery, Types.ProductReviewsPendingQueryVariables>(ProductReviewsPendingDocument, options);
       }
@@ -14167,34 +14181,44 @@ export type ProductReviewsPendingQueryHookResult = ReturnType<typeof useProductR
 export type ProductReviewsPendingLazyQueryHookResult = ReturnType<typeof useProductReviewsPendingLazyQuery>;
 export type ProductReviewsPendingQueryResult = Apollo.QueryResult<Types.ProductReviewsPendingQuery, Types.ProductReviewsPendingQueryVariables>;
 export const ProductReviewsPublishedDocument = gql`
-    query ProductReviewsPublished {
-  productReviewsPublished {
-    id
-    product {
-      id
-      name
-      slug
-      thumbnail {
-        url
+    query ProductReviewsPublished($first: Int, $after: String, $last: Int, $before: String) {
+  productReviewsPublished(first: $first, after: $after, last: $last, before: $before) {
+    edges {
+      node {
+        id
+        product {
+          id
+          name
+          slug
+          thumbnail {
+            url
+          }
+        }
+        user {
+          id
+          email
+          firstName
+          lastName
+        }
+        rating
+        text
+        image1
+        image2
+        createdAt
+        isPublished
+        moderatedBy {
+          id
+          email
+        }
+        moderatedAt
       }
     }
-    user {
-      id
-      email
-      firstName
-      lastName
-    }
-    rating
-    text
-    image1
-    image2
-    createdAt
-    isPublished
-    moderatedBy {
-      id
-      email
+    pageInfo {
+      endCursor
+      hasNextPage
+      hasPreviousPage
+      startCursor
     }
-    moderatedAt
   }
 }
     `;
@@ -14211,10 +14235,14 @@ export const ProductReviewsPublishedDocument = gql`
  * @example
  * const { data, loading, error } = useProductReviewsPublishedQuery({
  *   variables: {
+ *      first: // value for 'first'
+ *      after: // value for 'after'
+ *      last: // value for 'last'
+ *      before: // value for 'before'
  *   },
  * });
  */
-export function useProductReviewsPublishedQuery(baseOptions?: ApolloReactHooks.QueryHookOptions<Types.ProductReviewsPublishedQuery, Types.ProductReviewsPublishedQueryVariables>) {
+export function useProductReviewsPublishedQuery(baseOptions: ApolloReactHooks.QueryHookOptions<Types.ProductReviewsPublishedQuery, Types.ProductReviewsPublishedQueryVariables>) {
         const options = {...defaultOptions, ...baseOptions}
         return ApolloReactHooks.useQuery<Types.ProductReviewsPublishedQuery, Types.ProductReviewsPublishedQueryVariables>(ProductReviewsPublishedDocument, options);
       }
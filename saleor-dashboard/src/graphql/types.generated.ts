@@ -11454,15 +11454,25 @@ export type ProductReviewModerateMutationVariables = Exact<{
 
 export type ProductReviewModerateMutation = { __typename: 'Mutation', productReviewModerate: { __typename: 'ProductReviewModerate', review: { __typename: 'ProductReview', id: string, isPublished: boolean, moderatedAt: any | null, moderatedBy: { __typename: 'User', id: string, email: string } | null } | null, errors: Array<{ __typename: 'ProductError', field: string | null, code: ProductErrorCode, message: string | null }> } | null };
 
-export type ProductReviewsPendingQueryVariables = Exact<{ [key: string]: never; }>;
+export type ProductReviewsPendingQueryVariables = Exact<{
+  first?: InputMaybe<Scalars['Int']>;
+  after?: InputMaybe<Scalars['String']>;
+  last?: InputMaybe<Scalars['Int']>;
+  before?: InputMaybe<Scalars['String']>;
+}>;
 
 
-export type ProductReviewsPendingQuery = { __typename: 'Query', productReviewsPending: Array<{ __typename: 'ProductReview', id: string, rating: number, text: string, image1: string | null, image2: string | null, createdAt: any, isPublished: boolean, product: { __typename: 'Product', id: string, name: string, slug: string, thumbnail: { __typename: 'Image', url: string } | null } | null, user: { __typename: 'User', id: string, email: string, firstName: string, lastName: string } | null }> };
+export type ProductReviewsPendingQuery = { __typename: 'Query', productReviewsPending: { __typename: 'ProductReviewCountableConnection', edges: Array<{ __typename: 'ProductReviewCountableEdge', node: { __typename: 'ProductReview', id: string, rating: number, text: string, image1: string | null, image2: string | null, createdAt: any, isPublished: boolean, product: { __typename: 'Product', id: string, name: string, slug: string, thumbnail: { __typename: 'Image', url: string } | null } | null, user: { __typename: 'User', id: string, email: string, firstName: string, lastName: string } | null } }>, pageInfo: { __typename: 'PageInfo', endCursor: string | null, hasNextPage: boolean, hasPreviousPage: boolean, startCursor: string | null } } | null };
 
-export type ProductReviewsPublishedQueryVariables = Exact<{ [key: string]: never; }>;
+export type ProductReviewsPublishedQueryVariables = Exact<{
+  first?: InputMaybe<Scalars['Int']>;
+  after?: InputMaybe<Scalars['String']>;
+  last?: InputMaybe<Scalars['Int']>;
+  before?: InputMaybe<Scalars['String']>;
+}>;
 
 
-export type ProductReviewsPublishedQuery = { __typename: 'Query', productReviewsPublished: Array<{ __typename: 'ProductReview', id: string, rating: number, text: string, image1: string | null, image2: string | null, createdAt: any, isPublished: boolean, moderatedAt: any | null, product: { __typename: 'Product', id: string, name: string, slug: string, thumbnail: { __typename: 'Image', url: string } | null } | null, user: { __typename: 'User', id: string, email: string, firstName: string, lastName: string } | null, moderatedBy: { __typename: 'User', id: string, email: string } | null }> };
+export type ProductReviewsPublishedQuery = { __typename: 'Query', productReviewsPublished: { __typename: 'ProductReviewCountableConnection', edges: Array<{ __typename: 'ProductReviewCountableEdge', node: { __typename: 'ProductReview', id: string, rating: number, text: string, image1: string | null, image2: string | null, createdAt: any, isPublished: boolean, moderatedAt: any | null, product: { __typename: 'Product', id: string, name: string, slug: string, thumbnail: { __typename: 'Image', url: string } | null } | null, user: { __typename: 'User', id: string, email: string, firstName: string, lastName: string } | null, moderatedBy: { __typename: 'User', id: string, email: string } | null } }>, pageInfo: { __typename: 'PageInfo', endCursor: string | null, hasNextPage: boolean, hasPreviousPage: boolean, startCursor: string | null } } | null };
 
 export type ProductTypeDeleteMutationVariables = Exact<{
   id: Scalars['ID'];
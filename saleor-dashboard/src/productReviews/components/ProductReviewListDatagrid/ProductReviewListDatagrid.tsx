@@ -5,6 +5,7 @@ import {
 } from "@dashboard/components/Datagrid/hooks/useDatagridChange";
 import { readonlyTextCell } from "@dashboard/components/Datagrid/customCells/cells";
 import { AvailableColumn } from "@dashboard/components/Datagrid/types";
+import { TablePaginationWithContext } from "@dashboard/components/TablePagination";
 import { GridCell, Item } from "@glideapps/glide-data-grid";
 import { Box } from "@saleor/macaw-ui-next";
 import { useMemo, useCallback } from "react";
@@ -213,6 +214,9 @@ export const ProductReviewListDatagrid = ({
           selectionActions={() => null}
         />
       </Box>
+      <Box paddingX={6}>
+        <TablePaginationWithContext component="div" disabled={loading} />
+      </Box>
     </DatagridChangeStateContext.Provider>
   );
 };
@@ -1,5 +1,5 @@
 // Тип будет импортирован из GraphQL
 export type ProductReviewFragment = NonNullable<
   import("@dashboard/graphql").ProductReviewsPendingQuery["productReviewsPending"]
->[0];
+>["edges"][0]["node"];
 
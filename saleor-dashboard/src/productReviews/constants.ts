@@ -0,0 +1,2 @@
+// The API returns at most 100 reviews per page.
+export const PRODUCT_REVIEWS_PAGE_SIZE = 100;
@@ -1,19 +1,28 @@
 import { Route } from "@dashboard/components/Router";
 import { sectionNames } from "@dashboard/intl";
+import { parse as parseQs } from "qs";
 import { useIntl } from "react-intl";
 import { RouteComponentProps, Switch } from "react-router-dom";
 
 import { WindowTitle } from "../components/WindowTitle";
-import { productReviewListPath, productReviewPublishedPath } from "./urls";
+import {
+  productReviewListPath,
+  ProductReviewListUrlQueryParams,
+  productReviewPublishedPath,
+} from "./urls";
 import { ProductReviewList } from "./views/ProductReviewList";
 import { ProductReviewPublished } from "./views/ProductReviewPublished";
 
 const ProductReviewListRoute = ({ location }: RouteComponentProps) => {
-  return <ProductReviewList />;
+  const params: ProductReviewListUrlQueryParams = parseQs(location.search.substr(1));
+
+  return <ProductReviewList params={params} />;
 };
 
 const ProductReviewPublishedRoute = ({ location }: RouteComponentProps) => {
-  return <ProductReviewPublished />;
+  const params: ProductReviewListUrlQueryParams = parseQs(location.search.substr(1));
+
+  return <ProductReviewPublished params={params} />;
 };
 
 const Component = () => {
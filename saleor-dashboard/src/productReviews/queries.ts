@@ -1,62 +1,92 @@
 import { gql } from "@apollo/client";
 
 export const productReviewsPendingQuery = gql`
-  query ProductReviewsPending {
-    productReviewsPending {
-      id
-      product {
-        id
-        name
-        slug
-        thumbnail {
-          url
+  query ProductReviewsPending(
+    $first: Int
+    $after: String
+    $last: Int
+    $before: String
+  ) {
+    productReviewsPending(first: $first, after: $after, last: $last, before: $before) {
+      edges {
+        node {
+          id
+          product {
+            id
+            name
+            slug
+            thumbnail {
+              url
+            }
+          }
+          user {
+            id
+            email
+            firstName
+            lastName
+          }
+          rating
+          text
+          image1
+          image2
+          createdAt
+          isPublished
         }
       }
-      user {
-        id
-        email
-        firstName
-        lastName
+      pageInfo {
+        endCursor
+        hasNextPage
+        hasPreviousPage
+        startCursor
       }
-      rating
-      text
-      image1
-      image2
-      createdAt
-      isPublished
     }
   }
 `;
 
 export const productReviewsPublishedQuery = gql`
-  query ProductReviewsPublished {
-    productReviewsPublished {
-      id
-      product {
-        id
-        name
-        slug
-        thumbnail {
-          url
+  query ProductReviewsPublished(
+    $first: Int
+    $after: String
+    $last: Int
+    $before: String
+  ) {
+    productReviewsPublished(first: $first, after: $after, last: $last, before: $before) {
+      edges {
+        node {
+          id
+          product {
+            id
+            name
+            slug
+            thumbnail {
+              url
+            }
+          }
+          user {
+            id
+            email
+            firstName
+            lastName
+          }
+          rating
+          text
+          image1
+          image2
+          createdAt
+          isPublished
+          moderatedBy {
+            id
+            email
+          }
+          moderatedAt
         }
       }
-      user {
-        id
-        email
-        firstName
-        lastName
+      pageInfo {
+        endCursor
+        hasNextPage
+        hasPreviousPage
+        startCursor
       }
-      rating
-      text
-      image1
-      image2
-      createdAt
-      isPublished
-      moderatedBy {
-        id
-        email
-      }
-      moderatedAt
     }
   }
 `;
@@ -1,5 +1,6 @@
 import urlJoin from "url-join";
 
+import { Pagination } from "../types";
 import { stringifyQs } from "../utils/urls";
 
 const productReviewsSection = "/product-reviews/";
@@ -9,7 +10,7 @@ export const productReviewPublishedPath = urlJoin(
   productReviewsSection,
   "published"
 );
-export type ProductReviewListUrlQueryParams = {};
+export type ProductReviewListUrlQueryParams = Pagination;
 export const productReviewListUrl = (params?: ProductReviewListUrlQueryParams): string =>
   productReviewListPath + (params ? "?" + stringifyQs(params) : "");
 export const productReviewPublishedUrl = (params?: ProductReviewListUrlQueryParams): string =>
@@ -1,4 +1,8 @@
 import useNotifier from "@dashboard/hooks/useNotifier";
+import usePaginator, {
+  createPaginationState,
+  PaginatorContext,
+} from "@dashboard/hooks/usePaginator";
 import { commonMessages } from "@dashboard/intl";
 import { FormattedMessage } from "react-intl";
 
@@ -9,23 +13,35 @@ import {
 import { ProductReviewListPage } from "../components/ProductReviewListPage";
 import { ProductReviewDetailDialog } from "../components/ProductReviewDetailDialog";
 import { useState } from "react";
+import { mapEdgesToItems } from "@dashboard/utils/maps";
+import { PRODUCT_REVIEWS_PAGE_SIZE } from "../constants";
+import { ProductReviewListUrlQueryParams } from "../urls";
 
-export const ProductReviewList = () => {
+interface ProductReviewListProps {
+  params: ProductReviewListUrlQueryParams;
+}
+
+export const ProductReviewList = ({ params }: ProductReviewListProps) => {
   const notify = useNotifier();
   const [selectedReviewId, setSelectedReviewId] = useState<string | null>(null);
 
+  const paginationState = createPaginationState(PRODUCT_REVIEWS_PAGE_SIZE, params);
   const { data, loading, error, refetch } = useProductReviewsPendingQuery({
     displayLoader: true,
     errorPolicy: "all",
+    variables: paginationState,
     onError: error => {
       console.error("Error loading product reviews:", error);
       // Ошибка будет показана через ErrorBoundary или можно показать уведомление
     },
   });
 
-  const reviews = Array.isArray(data?.productReviewsPending) 
-    ? data.productReviewsPending 
-    : [];
+  const reviews = mapEdgesToItems(data?.productReviewsPending) ?? [];
+  const paginationValues = usePaginator({
+    pageInfo: data?.productReviewsPending?.pageInfo,
+    paginationState,
+    queryString: params,
+  });
 
   const [moderateReview, moderateReviewOpts] = useProductReviewModerateMutation({
     onCompleted: data => {
@@ -78,7 +94,7 @@ export const ProductReviewList = () => {
   };
 
   return (
-    <>
+    <PaginatorContext.Provider value={paginationValues}>
       <ProductReviewListPage
         reviews={reviews}
         loading={loading || moderateReviewOpts.loading}
@@ -93,7 +109,7 @@ export const ProductReviewList = () => {
         onApprove={handleApprove}
         onReject={handleReject}
       />
-    </>
+    </PaginatorContext.Provider>
   );
 };
 
@@ -1,4 +1,8 @@
 import useNotifier from "@dashboard/hooks/useNotifier";
+import usePaginator, {
+  createPaginationState,
+  PaginatorContext,
+} from "@dashboard/hooks/usePaginator";
 import { commonMessages } from "@dashboard/intl";
 import { FormattedMessage } from "react-intl";
 
@@ -9,22 +13,34 @@ import {
 import { ProductReviewPublishedPage } from "../components/ProductReviewPublishedPage";
 import { ProductReviewDetailDialog } from "../components/ProductReviewDetailDialog";
 import { useState } from "react";
+import { mapEdgesToItems } from "@dashboard/utils/maps";
+import { PRODUCT_REVIEWS_PAGE_SIZE } from "../constants";
+import { ProductReviewListUrlQueryParams } from "../urls";
 
-export const ProductReviewPublished = () => {
+interface ProductReviewPublishedProps {
+  params: ProductReviewListUrlQueryParams;
+}
+
+export const ProductReviewPublished = ({ params }: ProductReviewPublishedProps) => {
   const notify = useNotifier();
   const [selectedReviewId, setSelectedReviewId] = useState<string | null>(null);
 
+  const paginationState = createPaginationState(PRODUCT_REVIEWS_PAGE_SIZE, params);
   const { data, loading, error, refetch } = useProductReviewsPublishedQuery({
     displayLoader: true,
     errorPolicy: "all",
+    variables: paginationState,
     onError: error => {
       console.error("Error loading published product reviews:", error);
     },
   });
 
-  const reviews = Array.isArray(data?.productReviewsPublished)
-    ? data.productReviewsPublished
-    : [];
+  const reviews = mapEdgesToItems(data?.productReviewsPublished) ?? [];
+  const paginationValues = usePaginator({
+    pageInfo: data?.productReviewsPublished?.pageInfo,
+    paginationState,
+    queryString: params,
+  });
 
   const [moderateReview, moderateReviewOpts] = useProductReviewModerateMutation({
     onCompleted: data => {
@@ -71,7 +87,7 @@ export const ProductReviewPublished = () => {
   };
 
   return (
-    <>
+    <PaginatorContext.Provider value={paginationValues}>
       <ProductReviewPublishedPage
         reviews={reviews}
         loading={loading || moderateReviewOpts.loading}
@@ -86,7 +102,7 @@ export const ProductReviewPublished = () => {
         onApprove={handleApprove}
         onReject={handleReject}
       />
-    </>
+    </PaginatorContext.Provider>
   );
 };
 
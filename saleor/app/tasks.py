@@ -10,7 +10,7 @@ from .. import celeryconf
 from ..core import JobStatus
 from ..core.db.connection import allow_writer
 from ..core.models import EventDelivery, EventDeliveryAttempt, EventPayload
-from ..core.tasks import delete_files_from_private_storage_task
+from ..core.tasks import delete_event_payload_files_task
 from ..webhook.models import Webhook
 from .installation_utils import AppInstallationError, install_app
 from .models import App, AppExtension, AppInstallation, AppToken
@@ -79,11 +79,11 @@ def _raw_remove_deliveries(deliveries_ids):
         for event_payload in payloads.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
         if event_payload.payload_file
     ]
-    delete_files_from_private_storage_task.delay(files_to_delete)
 
     attempts._raw_delete(attempts.db)
     deliveries._raw_delete(deliveries.db)
     payloads._raw_delete(payloads.db)
+    delete_event_payload_files_task.delay(files_to_delete)
 
 
 @celeryconf.app.task
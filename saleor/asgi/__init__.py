@@ -12,8 +12,8 @@ import os
 from django.core.asgi import get_asgi_application
 
 from ..core.telemetry import initialize_telemetry
+from .compression import compression
 from .cors_handler import cors_handler
-from .gzip_compression import gzip_compression
 from .health_check import health_check
 from .telemetry import telemetry_middleware
 
@@ -36,7 +36,7 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "saleor.settings")
 
 application = get_asgi_application()
 application = health_check(application, "/health/")  # type: ignore[arg-type] # Django's ASGI app is less strict than the spec # noqa: E501
-application = gzip_compression(application)
+application = compression(application)
 application = cors_handler(application)
 application = telemetry_middleware(application)
 
@@ -0,0 +1,272 @@
+# adapted from Starlette's GZipMiddleware
+# Starlette does not work with Django's case-sensitive headers
+
+import asyncio
+import gzip
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Protocol
+
+import brotli
+import zstandard
+from asgiref.typing import (
+    ASGI3Application,
+    ASGIReceiveCallable,
+    ASGISendCallable,
+    ASGISendEvent,
+    HTTPResponseStartEvent,
+    Scope,
+)
+
+from .metrics import record_response_compression
+
+# Compression levels by the minimum body size they apply to, largest size first;
+# small responses are cheap to compress well, large ones are compressed faster.
+COMPRESSION_LEVELS = {
+    "zstd": ((1_048_576, 3), (65_536, 6), (0, 10)),
+    "br": ((1_048_576, 4), (65_536, 5), (0, 7)),
+    "gzip": ((1_048_576, 4), (65_536, 6), (0, 9)),
+}
+
+# Compressing releases the GIL, so large bodies are compressed in threads to keep
+# the event loop responsive.
+_executor = ThreadPoolExecutor(thread_name_prefix="compression")
+
+
+class Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class GzipCompressor:
+    def __init__(self, level: int):
+        self.buffer = io.BytesIO()
+        self.file = gzip.GzipFile(mode="wb", fileobj=self.buffer, compresslevel=level)
+
+    def compress(self, data: bytes) -> bytes:
+        self.file.write(data)
+        return self._read()
+
+    def finish(self) -> bytes:
+        self.file.close()
+        data = self._read()
+        self.buffer.close()
+        return data
+
+    def _read(self) -> bytes:
+        data = self.buffer.getvalue()
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        return data
+
+
+class BrotliCompressor:
+    def __init__(self, level: int):
+        self.compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.process(data)
+
+    def finish(self) -> bytes:
+        return self.compressor.finish()
+
+
+class ZstdCompressor:
+    def __init__(self, level: int):
+        self.compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self.compressor.flush()
+
+
+def get_available_compressors() -> dict[str, type[Compressor]]:
+    """Return compressors in order of preference."""
+    return {
+        "zstd": ZstdCompressor,
+        "br": BrotliCompressor,
+        "gzip": GzipCompressor,
+    }
+
+
+def get_compression_level(encoding: str, size: int) -> int:
+    for minimum_size, level in COMPRESSION_LEVELS[encoding]:
+        if size >= minimum_size:
+            return level
+    raise ValueError(f"No compression level for {encoding}.")
+
+
+def parse_accept_encoding(accept_encoding: bytes) -> set[str]:
+    """Return encodings accepted by the client, skipping those with `q=0`."""
+    encodings = set()
+    for item in accept_encoding.decode("latin-1").lower().split(","):
+        encoding, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if encoding.strip() and quality > 0:
+            encodings.add(encoding.strip())
+    return encodings
+
+
+def negotiate_encoding(
+    accept_encoding: bytes, compressors: dict[str, type[Compressor]]
+) -> str | None:
+    accepted = parse_accept_encoding(accept_encoding)
+    return next((encoding for encoding in compressors if encoding in accepted), None)
+
+
+def compress_body(body: bytes, compressor_class: type[Compressor], level: int) -> bytes:
+    compressor = compressor_class(level)
+    return compressor.compress(body) + compressor.finish()
+
+
+def _set_content_encoding(
+    headers, encoding: str, content_length: int | None = None
+) -> list[tuple[bytes, bytes]]:
+    headers = [
+        (key, value)
+        for key, value in headers
+        if key.lower() not in (b"content-length", b"content-encoding")
+    ]
+    headers.append((b"content-encoding", encoding.encode("latin-1")))
+    if content_length is not None:
+        headers.append((b"content-length", str(content_length).encode("latin-1")))
+    for index, (key, value) in enumerate(headers):
+        if key.lower() == b"vary" and b"accept-encoding" not in value.lower():
+            headers[index] = (key, value + b", Accept-Encoding")
+    return headers
+
+
+def compression(
+    app: ASGI3Application, minimum_size: int = 500, offload_size: int = 262_144
+) -> ASGI3Application:
+    """Compress responses with the best encoding accepted by the client.
+
+    Responses smaller than `minimum_size` bytes are sent as they are. Bodies of at
+    least `offload_size` bytes are compressed in a thread pool.
+    """
+    compressors = get_available_compressors()
+
+    async def compression_wrapper(
+        scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable
+    ) -> None:
+        if scope["type"] != "http":
+            await app(scope, receive, send)
+            return
+        accepted_encoding = next(
+            (
+                value
+                for key, value in scope["headers"]
+                if key.lower() == b"accept-encoding"
+            ),
+            b"",
+        )
+        encoding = negotiate_encoding(accepted_encoding, compressors)
+        if encoding is None:
+            await app(scope, receive, send)
+            return
+
+        compressor_class = compressors[encoding]
+        loop = asyncio.get_running_loop()
+        start_message: HTTPResponseStartEvent | None = None
+        content_encoding_set = False
+        started = False
+        compressor: Compressor | None = None
+        original_size = 0
+        compressed_size = 0
+        duration = 0
+
+        async def run_compression(func, body: bytes, *args) -> bytes:
+            nonlocal duration
+            start = time.monotonic_ns()
+            if len(body) >= offload_size:
+                result = await loop.run_in_executor(_executor, func, body, *args)
+            else:
+                result = func(body, *args)
+            duration += time.monotonic_ns() - start
+            return result
+
+        async def send_compressed(message: ASGISendEvent) -> None:
+            nonlocal compressed_size
+            nonlocal compressor
+            nonlocal content_encoding_set
+            nonlocal original_size
+            nonlocal start_message
+            nonlocal started
+            if message["type"] == "http.response.start":
+                start_message = message
+                content_encoding_set = any(
+                    value
+                    for key, value in start_message["headers"]
+                    if key.lower() == b"content-encoding"
+                )
+            elif message["type"] == "http.response.body" and content_encoding_set:
+                if not started:
+                    assert start_message is not None
+                    started = True
+                    await send(start_message)
+                await send(message)
+            elif message["type"] == "http.response.body" and not started:
+                assert start_message is not None
+                started = True
+                body = message.get("body", b"")
+                more_body = message.get("more_body", False)
+                level = get_compression_level(encoding, len(body))
+                if len(body) < minimum_size and not more_body:
+                    # Don't compress small outgoing responses.
+                    await send(start_message)
+                    await send(message)
+                elif not more_body:
+                    compressed_body = await run_compression(
+                        compress_body, body, compressor_class, level
+                    )
+                    record_response_compression(
+                        encoding, len(body), len(compressed_body), duration
+                    )
+                    start_message["headers"] = _set_content_encoding(
+                        start_message["headers"], encoding, len(compressed_body)
+                    )
+                    message["body"] = compressed_body
+                    await send(start_message)
+                    await send(message)
+                else:
+                    # Initial body in streaming response.
+                    start_message["headers"] = _set_content_encoding(
+                        start_message["headers"], encoding
+                    )
+                    compressor = compressor_class(level)
+                    message["body"] = await run_compression(compressor.compress, body)
+                    original_size += len(body)
+                    compressed_size += len(message["body"])
+                    await send(start_message)
+                    await send(message)
+            elif message["type"] == "http.response.body":
+                # Remaining body in streaming response.
+                assert compressor is not None
+                body = message.get("body", b"")
+                more_body = message.get("more_body", False)
+                compressed_body = await run_compression(compressor.compress, body)
+                if not more_body:
+                    compressed_body += compressor.finish()
+                original_size += len(body)
+                compressed_size += len(compressed_body)
+                if not more_body:
+                    record_response_compression(
+                        encoding, original_size, compressed_size, duration
+                    )
+                message["body"] = compressed_body
+                await send(message)
+
+        await app(scope, receive, send_compressed)
+
+    return compression_wrapper
@@ -0,0 +1,39 @@
+from ..core.telemetry import DEFAULT_DURATION_BUCKETS, MetricType, Scope, Unit, meter
+
+COMPRESSION_RATIO_BUCKETS = [1, 1.5, 2, 3, 5, 10, 20, 50]
+
+# Initialize metrics
+METRIC_RESPONSE_COMPRESSION_DURATION = meter.create_metric(
+    "saleor.http.response.compression.duration",
+    scope=Scope.CORE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.SECOND,
+    description="Time spent compressing HTTP responses.",
+    bucket_boundaries=DEFAULT_DURATION_BUCKETS,
+)
+METRIC_RESPONSE_COMPRESSION_RATIO = meter.create_metric(
+    "saleor.http.response.compression.ratio",
+    scope=Scope.CORE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.RATIO,
+    description="Ratio of original to compressed size of HTTP responses.",
+    bucket_boundaries=COMPRESSION_RATIO_BUCKETS,
+)
+
+
+def record_response_compression(
+    encoding: str, original_size: int, compressed_size: int, duration: int
+) -> None:
+    attributes = {"http.response.content_encoding": encoding}
+    meter.record(
+        METRIC_RESPONSE_COMPRESSION_DURATION,
+        duration,
+        unit=Unit.NANOSECOND,
+        attributes=attributes,
+    )
+    meter.record(
+        METRIC_RESPONSE_COMPRESSION_RATIO,
+        original_size / max(compressed_size, 1),
+        unit=Unit.RATIO,
+        attributes=attributes,
+    )
@@ -0,0 +1,244 @@
+import gzip
+from unittest.mock import patch
+
+import brotli
+import pytest
+import zstandard
+from asgiref.typing import (
+    ASGI3Application,
+    ASGIReceiveCallable,
+    ASGIReceiveEvent,
+    ASGISendCallable,
+    HTTPResponseBodyEvent,
+    HTTPResponseStartEvent,
+    HTTPScope,
+    Scope,
+)
+
+from ..compression import (
+    BrotliCompressor,
+    GzipCompressor,
+    ZstdCompressor,
+    compression,
+    get_compression_level,
+    negotiate_encoding,
+)
+
+
+def build_scope(origin: str, encodings: bytes) -> HTTPScope:
+    return {
+        "type": "http",
+        "asgi": {"spec_version": "2.1", "version": "3.0"},
+        "http_version": "2",
+        "method": "OPTIONS",
+        "scheme": "https",
+        "path": "/",
+        "raw_path": b"/",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"accept-encoding", encodings),
+            (b"hostname", b"localhost:3000"),
+            (b"origin", origin.encode("latin1")),
+        ],
+        "client": ("127.0.0.1", 80),
+        "server": None,
+        "extensions": {},
+    }
+
+
+async def run_app(app: ASGI3Application, scope: HTTPScope) -> list[dict]:
+    events = []
+
+    async def send(event) -> None:
+        events.append(event)
+
+    async def receive() -> ASGIReceiveEvent:
+        raise NotImplementedError()
+
+    await app(scope, receive, send)
+    return events
+
+
+async def test_no_compression(large_asgi_app: ASGI3Application, settings):
+    settings.ALLOWED_GRAPHQL_ORIGINS = ["*"]
+    cors_app = compression(large_asgi_app)
+    events = await run_app(cors_app, build_scope("http://localhost:3000", b"identity"))
+    assert events == [
+        HTTPResponseStartEvent(
+            type="http.response.start",
+            status=200,
+            headers=[
+                (b"content-length", b"10000"),
+                (b"content-type", b"text/plain"),
+            ],
+            trailers=False,
+        ),
+        HTTPResponseBodyEvent(
+            type="http.response.body", body=10000 * b"x", more_body=False
+        ),
+    ]
+
+
+async def test_with_supported_compression(large_asgi_app: ASGI3Application, settings):
+    settings.ALLOWED_GRAPHQL_ORIGINS = ["*"]
+    cors_app = compression(large_asgi_app)
+    events = await run_app(cors_app, build_scope("http://localhost:3000", b"gzip"))
+    expected_payload = gzip.compress(10000 * b"x", compresslevel=9)
+    assert events == [
+        HTTPResponseStartEvent(
+            type="http.response.start",
+            status=200,
+            headers=[
+                (b"content-type", b"text/plain"),
+                (b"content-encoding", b"gzip"),
+                (b"content-length", str(len(expected_payload)).encode("latin1")),
+            ],
+            trailers=False,
+        ),
+        HTTPResponseBodyEvent(
+            type="http.response.body", body=expected_payload, more_body=False
+        ),
+    ]
+
+
+def zstd_decompress(data: bytes) -> bytes:
+    # streamed frames don't store the content size required by `decompress`
+    return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+
+@pytest.mark.parametrize(
+    ("encoding", "decompress"),
+    [("br", brotli.decompress), ("zstd", zstd_decompress)],
+)
+async def test_compression_round_trip(
+    large_asgi_app: ASGI3Application, encoding, decompress
+):
+    # given
+    app = compression(large_asgi_app)
+
+    # when
+    events = await run_app(
+        app, build_scope("http://localhost:3000", encoding.encode("latin1"))
+    )
+
+    # then
+    headers = dict(events[0]["headers"])
+    assert headers[b"content-encoding"] == encoding.encode("latin1")
+    assert decompress(events[1]["body"]) == 10000 * b"x"
+
+
+@pytest.mark.parametrize(
+    ("compressor_class", "decompress"),
+    [(BrotliCompressor, brotli.decompress), (ZstdCompressor, zstd_decompress)],
+)
+def test_compressor_round_trip_in_chunks(compressor_class, decompress):
+    # given
+    compressor = compressor_class(level=5)
+    chunks = [1000 * b"x", 1000 * b"y", 1000 * b"z"]
+
+    # when
+    body = b"".join(compressor.compress(chunk) for chunk in chunks)
+    body += compressor.finish()
+
+    # then
+    assert decompress(body) == b"".join(chunks)
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected_encoding"),
+    [
+        (b"gzip, deflate, br", "gzip"),
+        (b"GZIP", "gzip"),
+        (b"gzip;q=0", None),
+        (b"deflate, gzip;q=0.5", "gzip"),
+        (b"identity", None),
+        (b"", None),
+    ],
+)
+def test_negotiate_encoding(accept_encoding, expected_encoding):
+    # when
+    encoding = negotiate_encoding(accept_encoding, {"gzip": GzipCompressor})
+
+    # then
+    assert encoding == expected_encoding
+
+
+def test_negotiate_encoding_prefers_first_compressor():
+    # given
+    compressors = {"br": GzipCompressor, "gzip": GzipCompressor}
+
+    # when
+    encoding = negotiate_encoding(b"gzip, br", compressors)
+
+    # then
+    assert encoding == "br"
+
+
+def test_get_compression_level_decreases_with_size():
+    # when
+    levels = [
+        get_compression_level("gzip", size) for size in [1_000, 100_000, 2_000_000]
+    ]
+
+    # then
+    assert levels == [9, 6, 4]
+
+
+async def test_compression_in_thread_pool(large_asgi_app: ASGI3Application):
+    # given
+    app = compression(large_asgi_app, offload_size=1000)
+
+    # when
+    with patch("saleor.asgi.compression.record_response_compression") as mocked_record:
+        events = await run_app(app, build_scope("http://localhost:3000", b"gzip"))
+
+    # then
+    assert gzip.decompress(events[1]["body"]) == 10000 * b"x"
+    mocked_record.assert_called_once()
+    encoding, original_size, compressed_size, _duration = mocked_record.call_args.args
+    assert encoding == "gzip"
+    assert original_size == 10000
+    assert compressed_size == len(events[1]["body"])
+
+
+async def test_compression_streaming_response():
+    # given
+    chunks = [1000 * b"x", 1000 * b"y", b""]
+
+    async def streaming_app(
+        scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable
+    ) -> None:
+        await send(
+            HTTPResponseStartEvent(
+                type="http.response.start",
+                status=200,
+                headers=[
+                    (b"content-type", b"text/plain"),
+                    (b"vary", b"Origin"),
+                ],
+                trailers=False,
+            )
+        )
+        for index, chunk in enumerate(chunks):
+            await send(
+                HTTPResponseBodyEvent(
+                    type="http.response.body",
+                    body=chunk,
+                    more_body=index < len(chunks) - 1,
+                )
+            )
+
+    app = compression(streaming_app)
+
+    # when
+    events = await run_app(app, build_scope("http://localhost:3000", b"gzip"))
+
+    # then
+    assert events[0]["headers"] == [
+        (b"content-type", b"text/plain"),
+        (b"vary", b"Origin, Accept-Encoding"),
+        (b"content-encoding", b"gzip"),
+    ]
+    body = b"".join(event["body"] for event in events[1:])
+    assert gzip.decompress(body) == 1000 * b"x" + 1000 * b"y"
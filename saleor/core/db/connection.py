@@ -2,10 +2,12 @@ import logging
 import traceback
 from contextlib import contextmanager
 
+from asgiref.sync import iscoroutinefunction
 from django.conf import settings
 from django.core.management.color import color_style
 from django.db import connections
 from django.db.backends.base.base import BaseDatabaseWrapper
+from django.utils.decorators import sync_and_async_middleware
 
 from ...graphql.core.context import SaleorContext, get_database_connection_name
 
@@ -94,21 +96,48 @@ def restrict_writer(execute, sql, params, many, context):
     return execute(sql, params, many, context)
 
 
+@sync_and_async_middleware
 def log_writer_usage_middleware(get_response):
     """Middleware that logs write access to the default database connection.
 
     This is similar to the `restrict_writer_middleware` middleware, but instead of
     raising an error, it logs a message when a write operation is attempted on the
     default database connection.
+
+    Database connections are thread-local, so in async mode the logging is enabled
+    only for the request. Views executing the request in other threads, like
+    `AsyncGraphQLView`, enable it with `log_writer_usage_for_request`.
     """
+    if iscoroutinefunction(get_response):
+
+        async def async_middleware(request):
+            request.log_writer_usage = True
+            return await get_response(request)
+
+        return async_middleware
 
     def middleware(request):
+        request.log_writer_usage = True
         with connections[writer].execute_wrapper(log_writer_usage):
             return get_response(request)
 
     return middleware
 
 
+@contextmanager
+def log_writer_usage_for_request(request):
+    """Log write access to the default database connection in the current thread.
+
+    Logging is enabled only for requests passed through the
+    `log_writer_usage_middleware` middleware.
+    """
+    if not getattr(request, "log_writer_usage", False):
+        yield
+        return
+    with connections[writer].execute_wrapper(log_writer_usage):
+        yield
+
+
 def log_writer_usage(execute, sql, params, many, context):
     conn: BaseDatabaseWrapper = context["connection"]
     allow_writer = getattr(conn, "_allow_writer", False)
@@ -2,7 +2,9 @@ import datetime
 import logging
 from typing import TYPE_CHECKING, Union
 
+from asgiref.sync import iscoroutinefunction
 from django.conf import settings
+from django.utils.decorators import sync_and_async_middleware
 
 from .jwt import JWT_REFRESH_TOKEN_COOKIE_NAME, jwt_decode_with_exception_handler
 
@@ -15,30 +17,42 @@ Requestor = Union["User", "App"]
 logger = logging.getLogger(__name__)
 
 
+@sync_and_async_middleware
 def jwt_refresh_token_middleware(get_response):
+    """Append generated refresh_token to response object."""
+    if iscoroutinefunction(get_response):
+
+        async def async_middleware(request):
+            response = await get_response(request)
+            set_jwt_refresh_token_cookie(request, response)
+            return response
+
+        return async_middleware
+
     def middleware(request):
-        """Append generated refresh_token to response object."""
         response = get_response(request)
-        jwt_refresh_token = getattr(request, "refresh_token", None)
-        if jwt_refresh_token:
-            expires = None
-            secure = not settings.DEBUG
-            if settings.JWT_EXPIRE:
-                refresh_token_payload = jwt_decode_with_exception_handler(
-                    jwt_refresh_token
-                )
-                if refresh_token_payload and refresh_token_payload.get("exp"):
-                    expires = datetime.datetime.fromtimestamp(
-                        refresh_token_payload["exp"], tz=datetime.UTC
-                    )
-            response.set_cookie(
-                JWT_REFRESH_TOKEN_COOKIE_NAME,
-                jwt_refresh_token,
-                expires=expires,
-                httponly=True,  # protects token from leaking
-                secure=secure,
-                samesite="None" if secure else "Lax",
-            )
+        set_jwt_refresh_token_cookie(request, response)
         return response
 
     return middleware
+
+
+def set_jwt_refresh_token_cookie(request, response):
+    jwt_refresh_token = getattr(request, "refresh_token", None)
+    if jwt_refresh_token:
+        expires = None
+        secure = not settings.DEBUG
+        if settings.JWT_EXPIRE:
+            refresh_token_payload = jwt_decode_with_exception_handler(jwt_refresh_token)
+            if refresh_token_payload and refresh_token_payload.get("exp"):
+                expires = datetime.datetime.fromtimestamp(
+                    refresh_token_payload["exp"], tz=datetime.UTC
+                )
+        response.set_cookie(
+            JWT_REFRESH_TOKEN_COOKIE_NAME,
+            jwt_refresh_token,
+            expires=expires,
+            httponly=True,  # protects token from leaking
+            secure=secure,
+            samesite="None" if secure else "Lax",
+        )
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.1 on 2026-10-17 09:00
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("core", "0011_eventpayload_payload_file"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="eventpayload",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["created_at"], name="payload_created_at_brin_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="eventdelivery",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["created_at"], name="delivery_created_at_brin_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="eventdelivery",
+            index=django.contrib.postgres.indexes.BTreeIndex(
+                fields=["webhook", "status", "created_at"],
+                name="delivery_webhook_status_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="eventdeliveryattempt",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["created_at"], name="attempt_created_at_brin_idx"
+            ),
+        ),
+    ]
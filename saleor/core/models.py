@@ -1,17 +1,30 @@
 import datetime
+import hashlib
 from collections.abc import Iterable
 from typing import Any, TypeVar
 
-from django.contrib.postgres.indexes import GinIndex, PostgresIndex
+from django.conf import settings
+from django.contrib.postgres.indexes import (
+    BrinIndex,
+    BTreeIndex,
+    GinIndex,
+    PostgresIndex,
+)
+from django.core.exceptions import ImproperlyConfigured
 from django.core.files.base import ContentFile
 from django.db import models, transaction
 from django.db.models import F, JSONField, Max, Q
-from django.utils.crypto import get_random_string
+from django.utils import timezone
 from storages.utils import safe_join
 
 from . import EventDeliveryStatus, JobStatus, private_storage
 from .utils.json_serializer import CustomJsonEncoder
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 
 class SortableModel(models.Model):
     sort_order = models.IntegerField(editable=False, db_index=True, null=True)
@@ -150,26 +163,47 @@ class Job(models.Model):
         abstract = True
 
 
+def get_payload_file_age(storage, path: str) -> datetime.timedelta | None:
+    """Return the time since the payload file was written, None if it is missing."""
+    if not storage.exists(path):
+        return None
+    return timezone.now() - storage.get_modified_time(path)
+
+
 class EventPayloadManager(models.Manager["EventPayload"]):
     @transaction.atomic
-    def create_with_payload_file(self, payload: str) -> "EventPayload":
+    def create_with_payload_file(self, payload: str | bytes) -> "EventPayload":
         obj = super().create()
         obj.save_payload_file(payload)
         return obj
 
     @transaction.atomic
     def bulk_create_with_payload_files(
-        self, objs: Iterable["EventPayload"], payloads=Iterable[str]
+        self, objs: Iterable["EventPayload"], payloads=Iterable[str | bytes]
     ) -> list["EventPayload"]:
         created_objs = self.bulk_create(objs)
         for obj, payload_data in zip(created_objs, payloads, strict=False):
             obj.save_payload_file(payload_data, save_instance=False)
-        self.bulk_update(created_objs, ["payload_file"])
+        self.bulk_update(created_objs, ["payload", "payload_file"])
         return created_objs
 
 
 class EventPayload(models.Model):
+    """Payload of webhook event deliveries.
+
+    Payloads smaller than `EVENT_PAYLOAD_INLINE_SIZE_LIMIT` bytes are stored in
+    the `payload` column, others in private storage. Files are named after the
+    SHA-256 digest of their content, so identical payloads share a single file,
+    optionally compressed with zstd when `EVENT_PAYLOAD_COMPRESSION` is enabled.
+
+    A file may be removed only when no payload references it and it is older than
+    `EVENT_PAYLOAD_FILE_GRACE_PERIOD`. An existing file is reused only during the
+    first half of that period, so a payload referencing it is committed before
+    the file can be removed.
+    """
+
     PAYLOADS_DIR = "payloads"
+    COMPRESSED_FILE_SUFFIX = ".zst"
 
     payload = models.TextField(default="")
     payload_file = models.FileField(
@@ -179,22 +213,57 @@ class EventPayload(models.Model):
 
     objects = EventPayloadManager()
 
-    # TODO (PE-568): change typing of return payload to `bytes` to avoid unnecessary decoding.
-    def get_payload(self):
-        if self.payload_file:
-            with self.payload_file.open("rb") as f:
-                payload_data = f.read()
-                return payload_data.decode("utf-8")
-        return self.payload
-
-    def save_payload_file(self, payload_data: str, save_instance=True):
-        payload_bytes = payload_data.encode("utf-8")
-        prefix = get_random_string(length=12)
-        file_name = f"{self.pk}.json"
-        file_path = safe_join(prefix, file_name)
-        self.payload_file.save(
-            file_path, ContentFile(payload_bytes), save=save_instance
+    class Meta:
+        indexes = [
+            BrinIndex(fields=["created_at"], name="payload_created_at_brin_idx"),
+        ]
+
+    def get_payload(self) -> str:
+        return self.get_payload_bytes().decode("utf-8")
+
+    def get_payload_bytes(self) -> bytes:
+        if not self.payload_file:
+            return self.payload.encode("utf-8")
+        with self.payload_file.open("rb") as f:
+            payload_data = f.read()
+        if self.payload_file.name.endswith(self.COMPRESSED_FILE_SUFFIX):
+            if zstandard is None:
+                raise ImproperlyConfigured(
+                    "The zstandard package is required to read compressed payloads."
+                )
+            return zstandard.ZstdDecompressor().decompress(payload_data)
+        return payload_data
+
+    def save_payload_file(self, payload_data: str | bytes, save_instance=True):
+        payload_bytes = (
+            payload_data.encode("utf-8")
+            if isinstance(payload_data, str)
+            else payload_data
         )
+        if len(payload_bytes) < settings.EVENT_PAYLOAD_INLINE_SIZE_LIMIT:
+            self.payload = (
+                payload_data
+                if isinstance(payload_data, str)
+                else payload_data.decode("utf-8")
+            )
+            self.payload_file = None
+            if save_instance:
+                self.save(update_fields=["payload", "payload_file"])
+            return
+
+        digest = hashlib.sha256(payload_bytes).hexdigest()
+        file_path = safe_join(self.PAYLOADS_DIR, digest[:2], f"{digest}.json")
+        if settings.EVENT_PAYLOAD_COMPRESSION and zstandard is not None:
+            file_path += self.COMPRESSED_FILE_SUFFIX
+            payload_bytes = zstandard.ZstdCompressor().compress(payload_bytes)
+        storage = self.payload_file.storage
+        file_age = get_payload_file_age(storage, file_path)
+        if file_age is None or file_age > settings.EVENT_PAYLOAD_FILE_GRACE_PERIOD / 2:
+            file_path = storage.save(file_path, ContentFile(payload_bytes))
+        self.payload = ""
+        self.payload_file.name = file_path
+        if save_instance:
+            self.save(update_fields=["payload", "payload_file"])
 
     def save_as_file(self):
         payload_data = self.payload
@@ -218,6 +287,15 @@ class EventDelivery(models.Model):
 
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            # Rows are appended in creation order, which keeps BRIN indexes tiny
+            # while still allowing range scans over old rows during pruning.
+            BrinIndex(fields=["created_at"], name="delivery_created_at_brin_idx"),
+            BTreeIndex(
+                fields=["webhook", "status", "created_at"],
+                name="delivery_webhook_status_idx",
+            ),
+        ]
 
 
 class EventDeliveryAttempt(models.Model):
@@ -239,3 +317,6 @@ class EventDeliveryAttempt(models.Model):
 
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            BrinIndex(fields=["created_at"], name="attempt_created_at_brin_idx"),
+        ]
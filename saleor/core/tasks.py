@@ -11,7 +11,12 @@ from django.utils import timezone
 from ..celeryconf import app
 from ..core.db.connection import allow_writer
 from . import private_storage
-from .models import EventDelivery, EventPayload
+from .models import (
+    EventDelivery,
+    EventDeliveryAttempt,
+    EventPayload,
+    get_payload_file_age,
+)
 
 task_logger: logging.Logger = get_task_logger(__name__)
 
@@ -64,32 +69,63 @@ def delete_from_storage_task(path):
 
 @app.task
 def delete_event_payloads_task(expiration_date=None):
+    """Delete event deliveries and payloads older than `EVENT_PAYLOAD_DELETE_PERIOD`.
+
+    Expired deliveries are deleted with their attempts first, then old payloads that
+    are no longer referenced. Rows are removed in batches of the oldest primary keys
+    without loading them into memory; the task reschedules itself until nothing is
+    left to delete or the time limit is reached.
+    """
     expiration_date = (
         expiration_date
         or timezone.now() + settings.EVENT_PAYLOAD_DELETE_TASK_TIME_LIMIT
     )
     delete_period = timezone.now() - settings.EVENT_PAYLOAD_DELETE_PERIOD
-    valid_deliveries = EventDelivery.objects.filter(created_at__gt=delete_period)
-    payloads_to_delete = (
+    delivery_ids = list(
+        EventDelivery.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        .filter(created_at__lte=delete_period)
+        .order_by("pk")
+        .values_list("pk", flat=True)[:BATCH_SIZE]
+    )
+    payload_ids = list(
         EventPayload.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-        .filter(~Exists(valid_deliveries.filter(payload_id=OuterRef("id"))))
-        .order_by("-pk")
+        .filter(
+            ~Exists(
+                EventDelivery.objects.filter(
+                    payload_id=OuterRef("id"), created_at__gt=delete_period
+                )
+            ),
+            created_at__lte=delete_period,
+        )
+        .order_by("pk")
+        .values_list("pk", flat=True)[:BATCH_SIZE]
     )
-    ids = list(payloads_to_delete.values_list("pk", flat=True)[:BATCH_SIZE])
-    if ids:
-        if expiration_date > timezone.now():
-            qs = EventPayload.objects.filter(pk__in=ids)
-            files_to_delete = [
-                event_payload.payload_file.name
-                for event_payload in qs.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-                if event_payload.payload_file
-            ]
-            with allow_writer():
-                qs.delete()
-            delete_files_from_private_storage_task.delay(files_to_delete)
-            delete_event_payloads_task.delay(expiration_date)
-        else:
-            task_logger.error("Task invocation time limit reached, aborting task")
+    if not delivery_ids and not payload_ids:
+        return
+    if expiration_date <= timezone.now():
+        task_logger.error("Task invocation time limit reached, aborting task")
+        return
+
+    with allow_writer():
+        attempts = EventDeliveryAttempt.objects.filter(delivery_id__in=delivery_ids)
+        attempts._raw_delete(attempts.db)
+        deliveries = EventDelivery.objects.filter(pk__in=delivery_ids)
+        deliveries._raw_delete(deliveries.db)
+
+        # Payloads still referenced by deliveries, e.g. not yet deleted ones from
+        # further batches, are deleted in the following runs.
+        payloads = EventPayload.objects.filter(
+            ~Exists(EventDelivery.objects.filter(payload_id=OuterRef("id"))),
+            pk__in=payload_ids,
+        )
+        files_to_delete = [
+            path for path in payloads.values_list("payload_file", flat=True) if path
+        ]
+        payloads._raw_delete(payloads.db)
+
+    if files_to_delete:
+        delete_event_payload_files_task.delay(files_to_delete)
+    delete_event_payloads_task.delay(expiration_date)
 
 
 @app.task
@@ -102,3 +138,40 @@ def delete_files_from_storage_task(paths):
 def delete_files_from_private_storage_task(paths):
     for path in paths:
         private_storage.delete(path)
+
+
+@app.task
+@allow_writer()
+def delete_event_payload_files_task(paths):
+    """Delete payload files unless they are still referenced by event payloads.
+
+    Payload files are shared by payloads with identical content and an existing
+    file is reused during the first half of `EVENT_PAYLOAD_FILE_GRACE_PERIOD`.
+    Files younger than the grace period are retried once it passes. References
+    of older files are checked on the writer database right before deleting.
+    """
+    grace_period = settings.EVENT_PAYLOAD_FILE_GRACE_PERIOD
+    recent_paths = []
+    expired_paths = []
+    for path in paths:
+        file_age = get_payload_file_age(private_storage, path)
+        if file_age is None:
+            continue
+        if file_age < grace_period:
+            recent_paths.append(path)
+        else:
+            expired_paths.append(path)
+
+    referenced_paths = set(
+        EventPayload.objects.filter(payload_file__in=expired_paths).values_list(
+            "payload_file", flat=True
+        )
+    )
+    for path in expired_paths:
+        if path not in referenced_paths:
+            private_storage.delete(path)
+
+    if recent_paths:
+        delete_event_payload_files_task.apply_async(
+            args=[recent_paths], countdown=grace_period.total_seconds()
+        )
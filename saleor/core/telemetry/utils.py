@@ -35,6 +35,8 @@ class Unit(Enum):
     REQUEST = "{request}"
     BYTE = "By"
     COST = "{cost}"
+    EVENT = "{event}"
+    RATIO = "1"
 
 
 UNIT_CONVERSIONS: dict[tuple[Unit, Unit], float] = {
@@ -1,9 +1,14 @@
+import datetime
+from unittest.mock import patch
+
 import pytest
 from django.core.files.base import ContentFile
 from django.utils.crypto import get_random_string
 from storages.utils import safe_join
 
+from .. import private_storage
 from ..models import EventPayload
+from ..tasks import delete_event_payload_files_task
 
 
 @pytest.fixture
@@ -37,3 +42,110 @@ def test_reading_event_payload_saved_as_string(payload_data):
 
     # then
     assert read_payload == payload_data
+
+
+def test_reading_event_payload_bytes(payload_data):
+    # given
+    payload = EventPayload.objects.create_with_payload_file(payload_data)
+
+    # when
+    read_payload = payload.get_payload_bytes()
+
+    # then
+    assert read_payload == payload_data.encode("utf-8")
+
+
+def test_identical_event_payloads_share_file(payload_data):
+    # given
+    payload = EventPayload.objects.create_with_payload_file(payload_data)
+
+    # when
+    other_payload = EventPayload.objects.create_with_payload_file(
+        payload_data.encode("utf-8")
+    )
+
+    # then
+    assert other_payload.pk != payload.pk
+    assert other_payload.payload_file.name == payload.payload_file.name
+    assert other_payload.get_payload() == payload_data
+
+
+def test_small_event_payload_stored_inline(payload_data, settings):
+    # given
+    settings.EVENT_PAYLOAD_INLINE_SIZE_LIMIT = 1024
+
+    # when
+    payload = EventPayload.objects.create_with_payload_file(payload_data)
+
+    # then
+    payload.refresh_from_db()
+    assert not payload.payload_file
+    assert payload.payload == payload_data
+    assert payload.get_payload_bytes() == payload_data.encode("utf-8")
+
+
+def test_compressed_event_payload(payload_data, settings):
+    # given
+    pytest.importorskip("zstandard")
+    settings.EVENT_PAYLOAD_COMPRESSION = True
+
+    # when
+    payload = EventPayload.objects.create_with_payload_file(payload_data)
+
+    # then
+    payload.refresh_from_db()
+    assert payload.payload_file.name.endswith(EventPayload.COMPRESSED_FILE_SUFFIX)
+    assert payload.get_payload() == payload_data
+
+
+def test_delete_event_payload_files_task_keeps_referenced_files(payload_data, settings):
+    # given
+    payload = EventPayload.objects.create_with_payload_file(payload_data)
+    other_payload = EventPayload.objects.create_with_payload_file(payload_data)
+    unique_payload = EventPayload.objects.create_with_payload_file("unique")
+    file_path = payload.payload_file.name
+    unique_file_path = unique_payload.payload_file.name
+    payload.delete()
+    unique_payload.delete()
+    settings.EVENT_PAYLOAD_FILE_GRACE_PERIOD = datetime.timedelta(0)
+
+    # when
+    delete_event_payload_files_task([file_path, unique_file_path])
+
+    # then
+    assert private_storage.exists(file_path)
+    assert not private_storage.exists(unique_file_path)
+    assert other_payload.get_payload() == payload_data
+
+
+@patch("saleor.core.tasks.delete_event_payload_files_task.apply_async")
+def test_delete_event_payload_files_task_postpones_recent_files(
+    mock_apply_async, settings
+):
+    # given
+    settings.EVENT_PAYLOAD_FILE_GRACE_PERIOD = datetime.timedelta(hours=1)
+    payload = EventPayload.objects.create_with_payload_file("unique")
+    file_path = payload.payload_file.name
+    payload.delete()
+
+    # when
+    delete_event_payload_files_task([file_path])
+
+    # then
+    assert private_storage.exists(file_path)
+    mock_apply_async.assert_called_once_with(
+        args=[[file_path]], countdown=datetime.timedelta(hours=1).total_seconds()
+    )
+
+
+def test_event_payload_doesnt_reuse_file_close_to_deletion(payload_data, settings):
+    # given
+    payload = EventPayload.objects.create_with_payload_file(payload_data)
+    settings.EVENT_PAYLOAD_FILE_GRACE_PERIOD = datetime.timedelta(0)
+
+    # when
+    other_payload = EventPayload.objects.create_with_payload_file(payload_data)
+
+    # then
+    assert other_payload.payload_file.name != payload.payload_file.name
+    assert other_payload.get_payload() == payload_data
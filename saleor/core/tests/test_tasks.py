@@ -44,7 +44,9 @@ def test_delete_event_payloads_task(webhook, settings):
     payload_files = {}
     for creation_time in [before_delete_period, after_delete_period]:
         with freeze_time(creation_time):
-            payload = EventPayload.objects.create_with_payload_file(payload="dummy")
+            payload = EventPayload.objects.create_with_payload_file(
+                payload=f"dummy-{creation_time.isoformat()}"
+            )
             payload_files[creation_time] = payload.payload_file.name
             delivery = EventDelivery.objects.create(
                 event_type=WebhookEventAsyncType.ANY,
@@ -65,6 +67,37 @@ def test_delete_event_payloads_task(webhook, settings):
     assert not private_storage.exists(payload_files[before_delete_period])
 
 
+def test_delete_event_payloads_task_deliveries_without_payload(webhook, settings):
+    # given
+    start_time = timezone.now()
+    before_delete_period = (
+        start_time
+        - settings.EVENT_PAYLOAD_DELETE_PERIOD
+        - datetime.timedelta(seconds=1)
+    )
+    with freeze_time(before_delete_period):
+        expired_delivery = EventDelivery.objects.create(
+            event_type=WebhookEventAsyncType.ANY, webhook=webhook
+        )
+        EventDeliveryAttempt.objects.create(delivery=expired_delivery)
+        shared_payload = EventPayload.objects.create_with_payload_file(payload="dummy")
+    with freeze_time(start_time):
+        delivery = EventDelivery.objects.create(
+            event_type=WebhookEventAsyncType.ANY,
+            payload=shared_payload,
+            webhook=webhook,
+        )
+
+    # when
+    with freeze_time(start_time):
+        delete_event_payloads_task()
+
+    # then
+    assert list(EventDelivery.objects.all()) == [delivery]
+    assert not EventDeliveryAttempt.objects.exists()
+    assert list(EventPayload.objects.all()) == [shared_payload]
+
+
 def test_delete_files_from_storage_task(
     product_with_image, variant_with_image, media_root
 ):
@@ -1,20 +1,173 @@
-import collections
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator, MutableMapping
+from typing import Any
 
+from ..telemetry import MetricType, Scope, Unit, meter
 
-class CacheDict(collections.OrderedDict):
-    def __init__(self, capacity: int):
+METRIC_CACHE_HITS = meter.create_metric(
+    "saleor.cache.local.hits",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.REQUEST,
+    description="Number of process-local cache hits.",
+)
+METRIC_CACHE_MISSES = meter.create_metric(
+    "saleor.cache.local.misses",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.REQUEST,
+    description="Number of process-local cache misses.",
+)
+METRIC_CACHE_EVICTIONS = meter.create_metric(
+    "saleor.cache.local.evictions",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.REQUEST,
+    description="Number of entries evicted from process-local caches.",
+)
+
+_MISSING = object()
+
+
+def approximate_size(obj: Any) -> int:
+    """Return an approximate deep size of the object in bytes.
+
+    Containers, instance dictionaries and slots are followed; objects reachable
+    through several references are counted once.
+    """
+    seen: set[int] = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        if isinstance(current, str | bytes | bytearray | int | float | bool):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, list | tuple | set | frozenset):
+            stack.extend(current)
+        if hasattr(current, "__dict__"):
+            stack.append(current.__dict__)
+        for cls in type(current).__mro__:
+            for slot in getattr(cls, "__slots__", ()):
+                value = getattr(current, slot, _MISSING)
+                if value is not _MISSING:
+                    stack.append(value)
+    return size
+
+
+class CacheDict(MutableMapping):
+    """Thread-safe LRU mapping bounded by the number of entries and their size.
+
+    The size of each entry is estimated with `get_size` when it is stored; it
+    should be cheap compared to computing the cached value. When `name` is given,
+    hits, misses and evictions are reported as telemetry counters with the
+    `cache.name` attribute.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        *,
+        max_size: int | None = None,
+        get_size: Callable[[Any], int] = sys.getsizeof,
+        name: str | None = None,
+    ):
         self.capacity = capacity
-        super().__init__()
+        self.max_size = max_size
+        self.get_size = get_size
+        self.name = name
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def _record(self, metric_name: str, amount: int = 1):
+        if self.name and amount:
+            meter.record(
+                metric_name,
+                amount,
+                unit=Unit.REQUEST,
+                attributes={"cache.name": self.name},
+            )
 
     def __getitem__(self, key):
-        value = super().__getitem__(key)
-        super().move_to_end(key)
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
         return value
 
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if entry is None:
+            self._record(METRIC_CACHE_MISSES)
+            return default
+        self._record(METRIC_CACHE_HITS)
+        return entry[0]
+
     def __setitem__(self, key, value):
-        super().__setitem__(key, value)
-        super().move_to_end(key)
+        entry_size = self.get_size(value) if self.max_size is not None else 0
+        if self.max_size is not None and entry_size > self.max_size:
+            # Storing the value would evict everything else from the cache.
+            return
+        evicted = 0
+        with self._lock:
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self.size -= previous[1]
+            self._data[key] = (value, entry_size)
+            self.size += entry_size
+            while len(self._data) > self.capacity or (
+                self.max_size is not None and self.size > self.max_size
+            ):
+                _, (_, surplus_size) = self._data.popitem(last=False)
+                self.size -= surplus_size
+                evicted += 1
+            self.evictions += evicted
+        self._record(METRIC_CACHE_EVICTIONS, evicted)
+
+    def __delitem__(self, key):
+        with self._lock:
+            _, entry_size = self._data.pop(key)
+            self.size -= entry_size
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __iter__(self) -> Iterator:
+        with self._lock:
+            return iter(list(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.size = 0
 
-        while len(self) > self.capacity:
-            surplus = next(iter(self))
-            super().__delitem__(surplus)
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._data),
+                "size": self.size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -1,4 +1,12 @@
-from ..cache import CacheDict
+from unittest.mock import patch
+
+from ..cache import (
+    METRIC_CACHE_EVICTIONS,
+    METRIC_CACHE_HITS,
+    METRIC_CACHE_MISSES,
+    CacheDict,
+    approximate_size,
+)
 
 
 def test_capacity():
@@ -42,3 +50,86 @@ def test_eviction_order():
     assert 1 in cache
     assert 2 not in cache
     assert 3 in cache
+
+
+def test_max_size():
+    # given
+    cache = CacheDict(10, max_size=10, get_size=len)
+    cache[1] = "abcd"
+    cache[2] = "efgh"
+
+    # when
+    cache[3] = "ijkl"
+
+    # then
+    assert 1 not in cache
+    assert 2 in cache
+    assert 3 in cache
+    assert cache.size == 8
+
+
+def test_value_exceeding_max_size_is_not_stored():
+    # given
+    cache = CacheDict(10, max_size=3, get_size=len)
+    cache[1] = "abc"
+
+    # when
+    cache[2] = "abcd"
+
+    # then
+    assert 1 in cache
+    assert 2 not in cache
+
+
+def test_stats():
+    # given
+    cache = CacheDict(1)
+    cache[1] = "a"
+
+    # when
+    cache.get(1)
+    cache.get(2)
+    cache[2] = "b"
+
+    # then
+    assert cache.stats() == {
+        "entries": 1,
+        "size": 0,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 1,
+    }
+
+
+@patch("saleor.core.utils.cache.meter.record")
+def test_metrics_recorded_for_named_cache(record_mock):
+    # given
+    cache = CacheDict(1, name="test")
+    cache[1] = "a"
+
+    # when
+    cache.get(1)
+    cache.get(2)
+    cache[2] = "b"
+
+    # then
+    assert [call.args for call in record_mock.call_args_list] == [
+        (METRIC_CACHE_HITS, 1),
+        (METRIC_CACHE_MISSES, 1),
+        (METRIC_CACHE_EVICTIONS, 1),
+    ]
+    assert all(
+        call.kwargs["attributes"] == {"cache.name": "test"}
+        for call in record_mock.call_args_list
+    )
+
+
+def test_approximate_size_counts_nested_objects():
+    # given
+    value = ["a" * 100]
+
+    # when
+    size = approximate_size({"key": value})
+
+    # then
+    assert size > approximate_size({"key": []}) + 100
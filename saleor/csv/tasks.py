@@ -1,3 +1,4 @@
+from celery.exceptions import Ignore
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.core.files.storage import default_storage
@@ -12,15 +13,33 @@ from ..core.tasks import RestrictWriterDBTask
 from . import events
 from .models import ExportEvent, ExportFile
 from .notifications import send_export_failed_info
-from .utils.export import export_gift_cards, export_products, export_voucher_codes
+from .utils.export import (
+    delete_export_shard,
+    delete_export_shards,
+    export_gift_cards,
+    export_products,
+    export_products_shard,
+    export_shards_completed,
+    export_voucher_codes,
+    get_export_shards_dir,
+    get_product_export_shards,
+    merge_products_export_shards,
+)
 
 task_logger = get_task_logger(__name__)
 
+# The merge task waits for the shard files for up to 24 hours.
+MERGE_EXPORT_SHARDS_RETRY_DELAY = 30
+MERGE_EXPORT_SHARDS_MAX_RETRIES = 2880
+
 
 class ExportTask(RestrictWriterDBTask):
     # should be updated when new export task is added
     TASK_NAME_TO_DATA_TYPE_MAPPING = {
         "export-products": "products",
+        "export-products-in-shards": "products",
+        "export-products-shard": "products",
+        "merge-products-export-shards": "products",
         "export-gift-cards": "gift cards",
         "export-voucher-codes": "voucher codes",
     }
@@ -74,6 +93,124 @@ def export_products_task(
     export_products(export_file, scope, export_info, file_type, delimiter)
 
 
+class ExportShardTask(ExportTask):
+    """Task doing a part of an export.
+
+    The export is completed by the task merging the shards, and it is failed only
+    by the first shard task that fails.
+    """
+
+    def on_failure(self, exc, task_id, args, kwargs, einfo):
+        export_file_id = args[0]
+        failed = (
+            ExportFile.objects.filter(pk=export_file_id)
+            .exclude(status=JobStatus.FAILED)
+            .update(status=JobStatus.FAILED, updated_at=timezone.now())
+        )
+        if failed:
+            super().on_failure(exc, task_id, args, kwargs, einfo)
+
+    def on_success(self, retval, task_id, args, kwargs):
+        pass
+
+
+class MergeExportShardsTask(ExportTask):
+    """Task merging the shards of an export, which deletes them when it fails."""
+
+    def on_failure(self, exc, task_id, args, kwargs, einfo):
+        _, shards_dir, shards_count, _, file_type = args[:5]
+        delete_export_shards(shards_dir, shards_count, file_type)
+        super().on_failure(exc, task_id, args, kwargs, einfo)
+
+
+@app.task(name="export-products-in-shards", base=ExportShardTask)
+def export_products_in_shards_task(
+    export_file_id: int,
+    scope: dict[str, str | dict],
+    export_info: dict[str, list],
+    file_type: str,
+    delimiter: str = ",",
+):
+    """Split the products export into shards exported by concurrent tasks."""
+    shards = get_product_export_shards(scope, settings.EXPORT_PRODUCTS_SHARD_SIZE)
+    shards_dir = get_export_shards_dir(export_file_id)
+    for shard_index, pk_range in enumerate(shards):
+        export_products_shard_task.delay(
+            export_file_id,
+            shards_dir,
+            shard_index,
+            pk_range,
+            scope,
+            export_info,
+            file_type,
+            delimiter,
+        )
+    merge_products_export_shards_task.delay(
+        export_file_id, shards_dir, len(shards), export_info, file_type, delimiter
+    )
+
+
+@app.task(name="export-products-shard", base=ExportShardTask)
+def export_products_shard_task(
+    export_file_id: int,
+    shards_dir: str,
+    shard_index: int,
+    pk_range: tuple[int, int],
+    scope: dict[str, str | dict],
+    export_info: dict[str, list],
+    file_type: str,
+    delimiter: str = ",",
+):
+    with allow_writer():
+        failed = ExportFile.objects.filter(
+            pk=export_file_id, status=JobStatus.FAILED
+        ).exists()
+    if failed:
+        return
+    export_products_shard(
+        shards_dir, shard_index, pk_range, scope, export_info, file_type, delimiter
+    )
+    with allow_writer():
+        failed = ExportFile.objects.filter(
+            pk=export_file_id, status=JobStatus.FAILED
+        ).exists()
+    if failed:
+        # The merge task may have already cleaned up the shards of the export.
+        delete_export_shard(shards_dir, shard_index, file_type)
+
+
+@app.task(
+    name="merge-products-export-shards",
+    base=MergeExportShardsTask,
+    bind=True,
+    default_retry_delay=MERGE_EXPORT_SHARDS_RETRY_DELAY,
+    max_retries=MERGE_EXPORT_SHARDS_MAX_RETRIES,
+)
+def merge_products_export_shards_task(
+    self,
+    export_file_id: int,
+    shards_dir: str,
+    shards_count: int,
+    export_info: dict[str, list],
+    file_type: str,
+    delimiter: str = ",",
+):
+    """Merge the shard files once all shards are exported."""
+    with allow_writer():
+        export_file = ExportFile.objects.select_related("app", "user").get(
+            pk=export_file_id
+        )
+    if export_file.status == JobStatus.FAILED:
+        # The failure was already handled by the shard task that failed.
+        delete_export_shards(shards_dir, shards_count, file_type)
+        raise Ignore()
+    if not export_shards_completed(shards_dir, shards_count):
+        raise self.retry()
+    merge_products_export_shards(
+        export_file, shards_dir, shards_count, export_info, file_type, delimiter
+    )
+
+
 @app.task(name="export-gift-cards", base=ExportTask)
 def export_gift_cards_task(
     export_file_id: int,
@@ -772,6 +772,34 @@ def test_prepare_variants_relations_data_channel_ids(
     assert result == expected_result
 
 
+def test_prepare_relations_data_constant_queries(
+    product_list, collection_list, channel_PLN, channel_USD, django_assert_num_queries
+):
+    # given
+    for product in product_list:
+        collection_list[0].products.add(product)
+        collection_list[1].products.add(product)
+
+    qs = Product.objects.all()
+    product_fields = set(
+        ProductExportFields.HEADERS_TO_FIELDS_MAPPING["product_many_to_many"].values()
+    )
+    variant_fields = {"variants__media__image"}
+    attribute_ids = [str(attr.pk) for attr in Attribute.objects.all()]
+    warehouse_ids = [str(w.pk) for w in Warehouse.objects.all()]
+    channel_ids = [str(channel_PLN.pk), str(channel_USD.pk)]
+
+    # when & then
+    # one query per relation: collections, media, channel listings and attributes
+    with django_assert_num_queries(4):
+        prepare_products_relations_data(qs, product_fields, attribute_ids, channel_ids)
+    # one query per relation: media, stocks, channel listings and attributes
+    with django_assert_num_queries(4):
+        prepare_variants_relations_data(
+            qs, variant_fields, attribute_ids, warehouse_ids, channel_ids
+        )
+
+
 def test_add_collection_info_to_data(product):
     # given
     pk = product.pk
@@ -19,7 +19,6 @@ from ....graphql.product.filters.product import ProductFilter
 from ....product.models import Product, ProductChannelListing
 from ... import FileTypes
 from ...utils.export import (
-    append_to_file,
     create_file_with_headers,
     export_gift_cards,
     export_gift_cards_in_batches,
@@ -32,6 +31,7 @@ from ...utils.export import (
     parse_input,
     save_csv_file_in_export_file,
 )
+from ...utils.writers import open_export_writer
 
 
 @pytest.mark.parametrize(
@@ -615,7 +615,7 @@ def test_save_csv_file_in_export_file(user_export_file, tmpdir, media_root):
     shutil.rmtree(tmpdir)
 
 
-def test_append_to_file_for_csv(user_export_file, tmpdir, media_root):
+def test_open_export_writer_for_csv(user_export_file, tmpdir, media_root):
     # given
     export_data = [
         {"id": "123", "name": "test1", "collections": "coll1"},
@@ -630,7 +630,8 @@ def test_append_to_file_for_csv(user_export_file, tmpdir, media_root):
     etl.tocsv(table, temp_file.name, delimiter=delimiter)
 
     # when
-    append_to_file(export_data, headers, temp_file, FileTypes.CSV, delimiter)
+    with open_export_writer(temp_file, headers, FileTypes.CSV, delimiter) as writer:
+        writer.write_rows(export_data)
 
     # then
     user_export_file.refresh_from_db()
@@ -644,7 +645,7 @@ def test_append_to_file_for_csv(user_export_file, tmpdir, media_root):
     shutil.rmtree(tmpdir)
 
 
-def test_append_to_file_for_xlsx(user_export_file, tmpdir, media_root):
+def test_open_export_writer_for_xlsx(user_export_file, tmpdir, media_root):
     # given
     export_data = [
         {"id": "123", "name": "test1", "collections": "coll1"},
@@ -660,7 +661,8 @@ def test_append_to_file_for_xlsx(user_export_file, tmpdir, media_root):
     etl.io.xlsx.toxlsx(table, temp_file.name)
 
     # when
-    append_to_file(export_data, expected_headers, temp_file, FileTypes.XLSX, ",")
+    with open_export_writer(temp_file, expected_headers, FileTypes.XLSX, ",") as writer:
+        writer.write_rows(export_data)
 
     # then
     user_export_file.refresh_from_db()
@@ -858,6 +860,38 @@ def test_export_gift_cards_in_batches_to_csv(
     shutil.rmtree(tmpdir)
 
 
+@patch("saleor.csv.utils.export.PROGRESS_UPDATE_INTERVAL", 0)
+@patch("saleor.csv.utils.export.BATCH_SIZE", 1)
+def test_export_gift_cards_in_batches_reports_progress(
+    gift_card,
+    gift_card_expiry_date,
+    user_export_file,
+    tmpdir,
+):
+    # given
+    gift_cards = GiftCard.objects.order_by("pk")
+
+    table = etl.wrap([["code"]])
+    temp_file = NamedTemporaryFile()
+    etl.tocsv(table, temp_file.name, delimiter=",")
+
+    # when
+    export_gift_cards_in_batches(
+        gift_cards,
+        ["code"],
+        ",",
+        temp_file,
+        "csv",
+        export_file=user_export_file,
+    )
+
+    # then
+    user_export_file.refresh_from_db()
+    assert user_export_file.message == "Exported 2 rows."
+
+    shutil.rmtree(tmpdir)
+
+
 @patch("saleor.csv.utils.export.BATCH_SIZE", 1)
 def test_export_gift_cards_in_batches_to_xlsx(
     gift_card,
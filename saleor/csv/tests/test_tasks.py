@@ -1,20 +1,30 @@
 import datetime
 from unittest.mock import ANY, MagicMock, Mock, patch
 
+import graphene
+import pytest
+from celery.exceptions import Retry
 from django.core.files import File
+from django.core.files.base import ContentFile
 from django.test import override_settings
 from django.utils import timezone
 from freezegun import freeze_time
 
-from ...core import JobStatus
+from ...core import JobStatus, private_storage
+from ...graphql.csv.enums import ProductFieldEnum
+from ...product.models import Product
 from .. import ExportEvents, FileTypes
 from ..models import ExportEvent, ExportFile
 from ..tasks import (
     ExportTask,
     delete_old_export_files,
     export_gift_cards_task,
+    export_products_in_shards_task,
+    export_products_shard_task,
     export_products_task,
+    merge_products_export_shards_task,
 )
+from ..utils.export import get_export_shard_done_path, get_export_shard_path
 
 
 @patch("saleor.csv.tasks.export_products")
@@ -57,6 +67,154 @@ def test_export_products_task_failed(
     send_export_failed_info_mock.assert_called_once_with(user_export_file, "products")
 
 
+@patch("saleor.csv.tasks.get_export_shards_dir")
+@patch("saleor.csv.utils.export.send_export_download_link_notification")
+def test_export_products_in_shards_task(
+    send_notification_mock,
+    get_export_shards_dir_mock,
+    product_list,
+    user_export_file,
+    media_root,
+    settings,
+):
+    # given
+    settings.EXPORT_PRODUCTS_SHARD_SIZE = 1
+    shards_dir = f"export_files/shards/{user_export_file.id}-token"
+    get_export_shards_dir_mock.return_value = shards_dir
+    export_info = {"fields": [ProductFieldEnum.NAME.value]}
+
+    # when
+    export_products_in_shards_task(
+        user_export_file.id, {"all": ""}, export_info, FileTypes.CSV
+    )
+
+    # then
+    user_export_file.refresh_from_db()
+    assert user_export_file.status == JobStatus.SUCCESS
+    file_content = user_export_file.content_file.read().decode().splitlines()
+    assert file_content == ["id,name"] + [
+        f"{graphene.Node.to_global_id('Product', product.pk)},{product.name}"
+        for product in Product.objects.order_by("pk")
+    ]
+    assert not private_storage.exists(
+        get_export_shard_path(shards_dir, 0, FileTypes.CSV)
+    )
+    assert not private_storage.exists(get_export_shard_done_path(shards_dir, 0))
+    send_notification_mock.assert_called_once_with(user_export_file, "products")
+
+
+@patch("saleor.csv.tasks.merge_products_export_shards")
+def test_merge_products_export_shards_task_waits_for_completed_shards(
+    merge_products_export_shards_mock, user_export_file, media_root
+):
+    # given
+    shards_dir = f"export_files/shards/{user_export_file.id}-token"
+    # shard file being written, without the completion marker
+    private_storage.save(
+        get_export_shard_path(shards_dir, 0, FileTypes.CSV), ContentFile(b"id")
+    )
+
+    # when
+    with pytest.raises(Retry):
+        merge_products_export_shards_task(
+            user_export_file.id, shards_dir, 1, {"fields": []}, FileTypes.CSV
+        )
+
+    # then
+    merge_products_export_shards_mock.assert_not_called()
+
+
+@patch("saleor.csv.tasks.send_export_failed_info")
+@patch("saleor.csv.tasks.merge_products_export_shards")
+def test_merge_products_export_shards_task_failed_deletes_shards(
+    merge_products_export_shards_mock,
+    send_export_failed_info_mock,
+    user_export_file,
+    media_root,
+):
+    # given
+    shards_dir = f"export_files/shards/{user_export_file.id}-token"
+    shard_path = get_export_shard_path(shards_dir, 0, FileTypes.CSV)
+    done_path = get_export_shard_done_path(shards_dir, 0)
+    private_storage.save(shard_path, ContentFile(b"id"))
+    private_storage.save(done_path, ContentFile(b""))
+    merge_products_export_shards_mock.side_effect = Exception("Test error")
+
+    # when
+    merge_products_export_shards_task.delay(
+        user_export_file.id, shards_dir, 1, {"fields": []}, FileTypes.CSV
+    )
+
+    # then
+    user_export_file.refresh_from_db()
+    assert user_export_file.status == JobStatus.FAILED
+    assert not private_storage.exists(shard_path)
+    assert not private_storage.exists(done_path)
+    send_export_failed_info_mock.assert_called_once_with(user_export_file, "products")
+
+
+@patch("saleor.csv.tasks.export_products_shard")
+def test_export_products_shard_task_export_failed_meanwhile(
+    export_products_shard_mock, user_export_file, media_root
+):
+    # given
+    shards_dir = f"export_files/shards/{user_export_file.id}-token"
+    shard_path = get_export_shard_path(shards_dir, 0, FileTypes.CSV)
+    done_path = get_export_shard_done_path(shards_dir, 0)
+
+    def export_shard_while_other_shard_fails(*args):
+        private_storage.save(shard_path, ContentFile(b"id"))
+        private_storage.save(done_path, ContentFile(b""))
+        ExportFile.objects.filter(pk=user_export_file.pk).update(
+            status=JobStatus.FAILED
+        )
+
+    export_products_shard_mock.side_effect = export_shard_while_other_shard_fails
+
+    # when
+    export_products_shard_task(
+        user_export_file.id,
+        shards_dir,
+        0,
+        (1, 10),
+        {"all": ""},
+        {"fields": []},
+        FileTypes.CSV,
+    )
+
+    # then
+    export_products_shard_mock.assert_called_once()
+    assert not private_storage.exists(shard_path)
+    assert not private_storage.exists(done_path)
+
+
+@patch("saleor.csv.tasks.send_export_failed_info")
+@patch("saleor.csv.tasks.export_products_shard")
+def test_export_products_in_shards_task_shard_failed(
+    export_products_shard_mock,
+    send_export_failed_info_mock,
+    product_list,
+    user_export_file,
+    media_root,
+    settings,
+):
+    # given
+    settings.EXPORT_PRODUCTS_SHARD_SIZE = 1
+    export_products_shard_mock.side_effect = Exception("Test error")
+
+    # when
+    export_products_in_shards_task.delay(
+        user_export_file.id, {"all": ""}, {"fields": []}, FileTypes.CSV
+    )
+
+    # then
+    user_export_file.refresh_from_db()
+    assert user_export_file.status == JobStatus.FAILED
+    assert not user_export_file.content_file
+    assert export_products_shard_mock.call_count == 1
+    send_export_failed_info_mock.assert_called_once_with(user_export_file, "products")
+
+
 @patch("saleor.csv.tasks.export_gift_cards")
 def test_export_gift_cards_task(export_gift_cards_mock, user_export_file):
     # given
@@ -27,23 +27,23 @@ class ProductExportFields:
     }
 
     PRODUCT_ATTRIBUTE_FIELDS = {
-        "value_slug": "attributevalues__value__slug",
-        "value_name": "attributevalues__value__name",
-        "file_url": "attributevalues__value__file_url",
-        "rich_text": "attributevalues__value__rich_text",
-        "value": "attributevalues__value__value",
-        "boolean": "attributevalues__value__boolean",
-        "date_time": "attributevalues__value__date_time",
-        "slug": "attributevalues__value__attribute__slug",
-        "input_type": "attributevalues__value__attribute__input_type",
-        "entity_type": "attributevalues__value__attribute__entity_type",
-        "unit": "attributevalues__value__attribute__unit",
-        "attribute_pk": "attributevalues__value__attribute__pk",
-        "reference_page": "attributevalues__value__reference_page",
-        "reference_product": "attributevalues__value__reference_product",
-        "reference_variant": "attributevalues__value__reference_variant",
-        "reference_category": "attributevalues__value__reference_category",
-        "reference_collection": "attributevalues__value__reference_collection",
+        "value_slug": "value__slug",
+        "value_name": "value__name",
+        "file_url": "value__file_url",
+        "rich_text": "value__rich_text",
+        "value": "value__value",
+        "boolean": "value__boolean",
+        "date_time": "value__date_time",
+        "slug": "value__attribute__slug",
+        "input_type": "value__attribute__input_type",
+        "entity_type": "value__attribute__entity_type",
+        "unit": "value__attribute__unit",
+        "attribute_pk": "value__attribute__pk",
+        "reference_page": "value__reference_page",
+        "reference_product": "value__reference_product",
+        "reference_variant": "value__reference_variant",
+        "reference_category": "value__reference_category",
+        "reference_collection": "value__reference_collection",
     }
 
     PRODUCT_CHANNEL_LISTING_FIELDS = {
@@ -58,9 +58,9 @@ class ProductExportFields:
     }
 
     WAREHOUSE_FIELDS = {
-        "slug": "variants__stocks__warehouse__slug",
-        "quantity": "variants__stocks__quantity",
-        "warehouse_pk": "variants__stocks__warehouse__id",
+        "slug": "warehouse__slug",
+        "quantity": "quantity",
+        "warehouse_pk": "warehouse_id",
     }
 
     VARIANT_ATTRIBUTE_FIELDS = {
@@ -1,12 +1,17 @@
 import datetime
+import itertools
+import time
 import uuid
 from tempfile import NamedTemporaryFile
 from typing import IO, TYPE_CHECKING, Any
 
 import petl as etl
 from django.conf import settings
+from django.core.files.base import ContentFile
 from django.utils import timezone
+from django.utils.crypto import get_random_string
 
+from ...core import private_storage
 from ...core.db.connection import allow_writer
 from ...core.utils.batches import queryset_in_batches
 from ...discount.models import VoucherCode
@@ -16,6 +21,7 @@ from .. import FileTypes
 from ..notifications import send_export_download_link_notification
 from .product_headers import get_product_export_fields_and_headers_info
 from .products_data import get_products_data
+from .writers import open_export_writer
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -24,6 +30,30 @@ if TYPE_CHECKING:
 
 
 BATCH_SIZE = 1000
+# Minimal interval in seconds between saving the export progress.
+PROGRESS_UPDATE_INTERVAL = 10
+
+
+class ExportProgress:
+    """Report the number of exported rows in the message of the export file."""
+
+    def __init__(self, export_file: "ExportFile | None"):
+        self.export_file = export_file
+        self.rows_count = 0
+        self.saved_at = time.monotonic()
+
+    def update(self, rows_count: int):
+        self.rows_count += rows_count
+        if time.monotonic() - self.saved_at >= PROGRESS_UPDATE_INTERVAL:
+            self.save()
+
+    @allow_writer()
+    def save(self):
+        self.saved_at = time.monotonic()
+        if self.export_file is None:
+            return
+        self.export_file.message = f"Exported {self.rows_count} rows."
+        self.export_file.save(update_fields=["message", "updated_at"])
 
 
 def export_products(
@@ -54,10 +84,129 @@ def export_products(
         delimiter,
         temporary_file,
         file_type,
+        export_file=export_file,
+    )
+
+    save_csv_file_in_export_file(export_file, temporary_file, file_name)
+    temporary_file.close()
+    send_export_download_link_notification(export_file, "products")
+
+
+def get_product_export_shards(
+    scope: dict[str, str | dict], shard_size: int
+) -> list[tuple[int, int]]:
+    """Split products in the scope into pk ranges of at most `shard_size` products."""
+    from ...graphql.product.filters.product import ProductFilter
+
+    queryset = get_queryset(Product, ProductFilter, scope)
+    return [(pks[0], pks[-1]) for pks in queryset_in_batches(queryset, shard_size)]
+
+
+def get_export_shards_dir(export_file_id: int) -> str:
+    """Return a new directory for the shard files of the export.
+
+    The random token keeps the shard files of the export from being guessed.
+    """
+    token = get_random_string(length=32)
+    return f"export_files/shards/{export_file_id}-{token}"
+
+
+def get_export_shard_path(shards_dir: str, shard_index: int, file_type: str) -> str:
+    return f"{shards_dir}/{shard_index}.{file_type}"
+
+
+def get_export_shard_done_path(shards_dir: str, shard_index: int) -> str:
+    return f"{shards_dir}/{shard_index}.done"
+
+
+def export_products_shard(
+    shards_dir: str,
+    shard_index: int,
+    pk_range: tuple[int, int],
+    scope: dict[str, str | dict],
+    export_info: dict[str, list],
+    file_type: str,
+    delimiter: str = ",",
+):
+    """Export products from the pk range to a shard file without headers.
+
+    The shard file is saved in the private storage, so it can be merged by any
+    worker. Some storages write the file in place, so an empty marker file is
+    saved once the shard file is complete.
+    """
+    from ...graphql.product.filters.product import ProductFilter
+
+    start_pk, end_pk = pk_range
+    queryset = get_queryset(Product, ProductFilter, scope).filter(
+        pk__gte=start_pk, pk__lte=end_pk
+    )
+    export_fields, _, data_headers = get_product_export_fields_and_headers_info(
+        export_info
+    )
+
+    with NamedTemporaryFile("ab+", suffix=f".{file_type}") as temporary_file:
+        export_products_in_batches(
+            queryset,
+            export_info,
+            set(export_fields),
+            data_headers,
+            delimiter,
+            temporary_file,
+            file_type,
+        )
+        # Replace the files left by a previous attempt of the same shard.
+        done_path = get_export_shard_done_path(shards_dir, shard_index)
+        private_storage.delete(done_path)
+        path = get_export_shard_path(shards_dir, shard_index, file_type)
+        private_storage.delete(path)
+        private_storage.save(path, temporary_file)
+        private_storage.save(done_path, ContentFile(b""))
+
+
+def export_shards_completed(shards_dir: str, shards_count: int) -> bool:
+    return all(
+        private_storage.exists(get_export_shard_done_path(shards_dir, shard_index))
+        for shard_index in range(shards_count)
     )
 
+
+def delete_export_shard(shards_dir: str, shard_index: int, file_type: str):
+    private_storage.delete(get_export_shard_done_path(shards_dir, shard_index))
+    private_storage.delete(get_export_shard_path(shards_dir, shard_index, file_type))
+
+
+def delete_export_shards(shards_dir: str, shards_count: int, file_type: str):
+    for shard_index in range(shards_count):
+        delete_export_shard(shards_dir, shard_index, file_type)
+
+
+def merge_products_export_shards(
+    export_file: "ExportFile",
+    shards_dir: str,
+    shards_count: int,
+    export_info: dict[str, list],
+    file_type: str,
+    delimiter: str = ",",
+):
+    """Concatenate the shard files in order into the file of the export."""
+    file_name = get_filename("product", file_type)
+    _, file_headers, data_headers = get_product_export_fields_and_headers_info(
+        export_info
+    )
+
+    temporary_file = create_file_with_headers(file_headers, delimiter, file_type)
+
+    with open_export_writer(
+        temporary_file, data_headers, file_type, delimiter
+    ) as writer:
+        for shard_index in range(shards_count):
+            path = get_export_shard_path(shards_dir, shard_index, file_type)
+            with private_storage.open(path) as shard_file:
+                writer.append_file(shard_file)
+
     save_csv_file_in_export_file(export_file, temporary_file, file_name)
     temporary_file.close()
+    delete_export_shards(shards_dir, shards_count, file_type)
     send_export_download_link_notification(export_file, "products")
 
 
@@ -84,6 +233,7 @@ def export_gift_cards(
         delimiter,
         temporary_file,
         file_type,
+        export_file=export_file,
     )
 
     save_csv_file_in_export_file(export_file, temporary_file, file_name)
@@ -119,6 +269,7 @@ def export_voucher_codes(
         delimiter,
         temporary_file,
         file_type,
+        export_file=export_file,
     )
 
     save_csv_file_in_export_file(export_file, temporary_file, file_name)
@@ -197,29 +348,26 @@ def export_products_in_batches(
     delimiter: str,
     temporary_file: Any,
     file_type: str,
+    *,
+    export_file: "ExportFile | None" = None,
 ):
     warehouses = export_info.get("warehouses")
     attributes = export_info.get("attributes")
     channels = export_info.get("channels")
-
-    for batch_pks in queryset_in_batches(queryset, BATCH_SIZE):
-        product_batch = (
-            Product.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-            .filter(pk__in=batch_pks)
-            .prefetch_related(
-                "attributevalues",
-                "variants",
-                "collections",
-                "media",
-                "product_type",
-                "category",
+    progress = ExportProgress(export_file)
+
+    with open_export_writer(temporary_file, headers, file_type, delimiter) as writer:
+        for batch_pks in queryset_in_batches(queryset, BATCH_SIZE):
+            product_batch = Product.objects.using(
+                settings.DATABASE_CONNECTION_REPLICA_NAME
+            ).filter(pk__in=batch_pks)
+            export_data = get_products_data(
+                product_batch, export_fields, attributes, warehouses, channels
             )
-        )
-        export_data = get_products_data(
-            product_batch, export_fields, attributes, warehouses, channels
-        )
 
-        append_to_file(export_data, headers, temporary_file, file_type, delimiter)
+            writer.write_rows(export_data)
+            progress.update(len(export_data))
+    progress.save()
 
 
 def export_gift_cards_in_batches(
@@ -228,15 +376,12 @@ def export_gift_cards_in_batches(
     delimiter: str,
     temporary_file: Any,
     file_type: str,
+    *,
+    export_file: "ExportFile | None" = None,
 ):
-    for batch_pks in queryset_in_batches(queryset, BATCH_SIZE):
-        gift_card_batch = GiftCard.objects.using(
-            settings.DATABASE_CONNECTION_REPLICA_NAME
-        ).filter(pk__in=batch_pks)
-
-        export_data = list(gift_card_batch.values(*export_fields))
-
-        append_to_file(export_data, export_fields, temporary_file, file_type, delimiter)
+    export_values_in_batches(
+        queryset, export_fields, delimiter, temporary_file, file_type, export_file
+    )
 
 
 def export_voucher_codes_in_batches(
@@ -245,30 +390,36 @@ def export_voucher_codes_in_batches(
     delimiter: str,
     temporary_file: Any,
     file_type: str,
+    *,
+    export_file: "ExportFile | None" = None,
 ):
-    for batch_pks in queryset_in_batches(queryset, BATCH_SIZE):
-        voucher_codes_batch = VoucherCode.objects.using(
-            settings.DATABASE_CONNECTION_REPLICA_NAME
-        ).filter(pk__in=batch_pks)
-
-        export_data = list(voucher_codes_batch.values(*export_fields))
-
-        append_to_file(export_data, export_fields, temporary_file, file_type, delimiter)
+    export_values_in_batches(
+        queryset, export_fields, delimiter, temporary_file, file_type, export_file
+    )
 
 
-def append_to_file(
-    export_data: list[dict[str, str | bool]],
-    headers: list[str],
+def export_values_in_batches(
+    queryset: "QuerySet",
+    export_fields: list[str],
+    delimiter: str,
     temporary_file: Any,
     file_type: str,
-    delimiter: str,
+    export_file: "ExportFile | None",
 ):
-    table = etl.fromdicts(export_data, header=headers, missing="")
-
-    if file_type == FileTypes.CSV:
-        etl.io.csv.appendcsv(table, temporary_file.name, delimiter=delimiter)
-    else:
-        etl.io.xlsx.appendxlsx(table, temporary_file.name)
+    """Write model field values to the file, read with a server-side cursor."""
+    progress = ExportProgress(export_file)
+    rows = (
+        queryset.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        .values(*export_fields)
+        .iterator(chunk_size=BATCH_SIZE)
+    )
+    with open_export_writer(
+        temporary_file, export_fields, file_type, delimiter
+    ) as writer:
+        for batch in itertools.batched(rows, BATCH_SIZE):
+            writer.write_rows(batch)
+            progress.update(len(batch))
+    progress.save()
 
 
 @allow_writer()
@@ -5,19 +5,26 @@ from urllib.parse import urljoin
 
 import graphene
 from django.conf import settings
-from django.db.models import Case, CharField, Exists, OuterRef, When
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db.models import Case, CharField, When
 from django.db.models import Value as V
 from django.db.models.functions import Cast, Concat
 
 from ...attribute import AttributeInputType
-from ...attribute.models import AssignedVariantAttribute, Attribute, AttributeValue
+from ...attribute.models import (
+    AssignedProductAttributeValue,
+    AssignedVariantAttribute,
+)
 from ...core.utils import build_absolute_uri
 from ...core.utils.editorjs import clean_editor_js
 from ...product.models import (
+    CollectionProduct,
     ProductChannelListing,
-    ProductVariant,
+    ProductMedia,
     ProductVariantChannelListing,
+    VariantMedia,
 )
+from ...warehouse.models import Stock
 from . import ProductExportFields
 
 if TYPE_CHECKING:
@@ -137,32 +144,53 @@ def prepare_products_relations_data(
 ) -> dict[int, dict[str, str]]:
     """Prepare data about products relation fields for given queryset.
 
+    Every relation is fetched with a separate query, so the rows of different
+    relations are not multiplied by each other. Collections and media are
+    aggregated into a single row per product.
+
     It returns dict where key is a product pk, value is a dict with relation fields data.
     """
     result_data: dict[int, dict] = defaultdict(dict)
-
-    fields.add("pk")
-
-    relations_data = queryset.values(*fields)
-
-    for data in relations_data.iterator(chunk_size=1000):
-        pk = data.get("pk")
-        collection = data.get("collections__slug")
-        image = data.pop("media__image", None)
-
-        result_data = add_image_uris_to_data(pk, image, "media__image", result_data)
-        result_data = add_collection_info_to_data(pk, collection, result_data)
+    database_connection_name = queryset.db
+    product_ids = queryset.values("pk")
+
+    if "collections__slug" in fields:
+        collections = (
+            CollectionProduct.objects.using(database_connection_name)
+            .filter(product_id__in=product_ids)
+            .values("product_id")
+            .annotate(slugs=ArrayAgg("collection__slug", distinct=True))
+        )
+        for data in collections.iterator(chunk_size=1000):
+            pk = data["product_id"]
+            for collection in data["slugs"]:
+                result_data = add_collection_info_to_data(pk, collection, result_data)
+
+    if "media__image" in fields:
+        media = (
+            ProductMedia.objects.using(database_connection_name)
+            .filter(product_id__in=product_ids)
+            .values("product_id")
+            .annotate(images=ArrayAgg("image", distinct=True))
+        )
+        for data in media.iterator(chunk_size=1000):
+            pk = data["product_id"]
+            for image in data["images"]:
+                result_data = add_image_uris_to_data(
+                    pk, image, "media__image", result_data
+                )
 
     if channel_ids:
         channel_fields = ProductExportFields.PRODUCT_CHANNEL_LISTING_FIELDS
         fields_for_channel = {"product_id"}
         fields_for_channel.update(channel_fields.values())
-        listings = ProductChannelListing.objects.filter(
-            Exists(queryset.filter(id=OuterRef("product_id"))),
-            channel_id__in=channel_ids,
-        ).values(*fields_for_channel)
+        listings = (
+            ProductChannelListing.objects.using(database_connection_name)
+            .filter(product_id__in=product_ids, channel_id__in=channel_ids)
+            .values(*fields_for_channel)
+        )
 
-        for listing in listings:
+        for listing in listings.iterator(chunk_size=1000):
             pk = listing.get("product_id")
             result_data, _ = handle_channel_data(
                 pk,
@@ -173,19 +201,15 @@ def prepare_products_relations_data(
 
     if attribute_ids:
         attribute_fields = ProductExportFields.PRODUCT_ATTRIBUTE_FIELDS
-
-        fields_for_attrs = {"pk"}
-        attributes = Attribute.objects.filter(id__in=attribute_ids)
-        attr_values = AttributeValue.objects.filter(
-            Exists(attributes.filter(id=OuterRef("attribute_id"))),
-        )
-        relations_data = queryset.filter(
-            Exists(attr_values.filter(id=OuterRef("attributevalues__value_id")))
-        )
+        fields_for_attrs = {"product_id"}
         fields_for_attrs.update(attribute_fields.values())
-        relations_data = relations_data.values(*fields_for_attrs)
-        for data in relations_data.iterator(chunk_size=1000):
-            pk = data.get("pk")
+        assigned_values = (
+            AssignedProductAttributeValue.objects.using(database_connection_name)
+            .filter(product_id__in=product_ids, value__attribute_id__in=attribute_ids)
+            .values(*fields_for_attrs)
+        )
+        for data in assigned_values.iterator(chunk_size=1000):
+            pk = data.pop("product_id")
             result_data, data = handle_attribute_data(
                 pk,
                 data,
@@ -239,42 +263,59 @@ def prepare_variants_relations_data(
 ) -> dict[int, dict[str, str]]:
     """Prepare data about variants relation fields for given queryset.
 
+    Every relation is fetched with a separate query, so the rows of different
+    relations are not multiplied by each other. Media are aggregated into a single
+    row per variant.
+
     It return dict where key is a product pk, value is a dict with relation fields data.
     """
-    warehouse_fields = ProductExportFields.WAREHOUSE_FIELDS
-
     result_data: dict[int, dict] = defaultdict(dict)
-    fields.add("variants__pk")
+    database_connection_name = queryset.db
+    product_ids = queryset.values("pk")
+
+    if "variants__media__image" in fields:
+        media = (
+            VariantMedia.objects.using(database_connection_name)
+            .filter(variant__product_id__in=product_ids)
+            .values("variant_id")
+            .annotate(images=ArrayAgg("media__image", distinct=True))
+        )
+        for data in media.iterator(chunk_size=1000):
+            pk = data["variant_id"]
+            for image in data["images"]:
+                result_data = add_image_uris_to_data(
+                    pk, image, "variants__media__image", result_data
+                )
 
     if warehouse_ids:
-        fields.update(warehouse_fields.values())
-
-    relations_data = queryset.values(*fields)
-
-    for data in relations_data.iterator(chunk_size=1000):
-        pk = data.get("variants__pk")
-        image = data.pop("variants__media__image", None)
-
-        result_data = add_image_uris_to_data(
-            pk, image, "variants__media__image", result_data
-        )
-        result_data, data = handle_warehouse_data(
-            pk, data, warehouse_ids, result_data, warehouse_fields
+        warehouse_fields = ProductExportFields.WAREHOUSE_FIELDS
+        fields_for_stocks = {"product_variant_id"}
+        fields_for_stocks.update(warehouse_fields.values())
+        stocks = (
+            Stock.objects.using(database_connection_name)
+            .filter(
+                product_variant__product_id__in=product_ids,
+                warehouse_id__in=warehouse_ids,
+            )
+            .values(*fields_for_stocks)
         )
+        for data in stocks.iterator(chunk_size=1000):
+            pk = data.pop("product_variant_id")
+            result_data, data = handle_warehouse_data(
+                pk, data, warehouse_ids, result_data, warehouse_fields
+            )
 
     if channel_ids:
         channel_fields = ProductExportFields.VARIANT_CHANNEL_LISTING_FIELDS
         fields_for_channel = {"variant_id"}
         fields_for_channel.update(channel_fields.values())
-        variants = ProductVariant.objects.filter(
-            Exists(queryset.filter(id=OuterRef("product_id")))
+        listings = (
+            ProductVariantChannelListing.objects.using(database_connection_name)
+            .filter(variant__product_id__in=product_ids, channel_id__in=channel_ids)
+            .values(*fields_for_channel)
         )
-        listings = ProductVariantChannelListing.objects.filter(
-            Exists(variants.filter(id=OuterRef("variant_id"))),
-            channel_id__in=channel_ids,
-        ).values(*fields_for_channel)
 
-        for listing in listings:
+        for listing in listings.iterator(chunk_size=1000):
             pk = listing.get("variant_id")
             result_data, _ = handle_channel_data(
                 pk,
@@ -288,13 +329,15 @@ def prepare_variants_relations_data(
         fields_for_variant_attributes.update(
             ProductExportFields.VARIANT_ATTRIBUTE_FIELDS.values()
         )
-        variants = ProductVariant.objects.filter(
-            Exists(queryset.filter(id=OuterRef("product_id")))
+        assigned_variant_attrs = (
+            AssignedVariantAttribute.objects.using(database_connection_name)
+            .filter(
+                variant__product_id__in=product_ids,
+                assignment__attribute_id__in=attribute_ids,
+            )
+            .values(*fields_for_variant_attributes)
         )
-        assigned_variant_attrs = AssignedVariantAttribute.objects.filter(
-            Exists(variants.filter(id=OuterRef("variant_id"))),
-        ).values(*fields_for_variant_attributes)
-        for assigned_variant_attr in assigned_variant_attrs:
+        for assigned_variant_attr in assigned_variant_attrs.iterator(chunk_size=1000):
             pk = assigned_variant_attr.get("variant_id")
             result_data, data = handle_attribute_data(
                 pk,
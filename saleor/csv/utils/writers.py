@@ -0,0 +1,91 @@
+import csv
+import os
+import shutil
+from collections.abc import Iterable
+from contextlib import contextmanager
+from typing import IO, Any
+
+import openpyxl
+
+from .. import FileTypes
+
+# Rows are flushed to the CSV file in chunks of this size.
+CSV_WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+class CSVExportWriter:
+    """Append rows to a CSV file through a single buffered file handle."""
+
+    def __init__(self, temporary_file: IO[bytes], headers: list[str], delimiter: str):
+        self.file = open(  # noqa: SIM115
+            temporary_file.name,
+            "a",
+            encoding="utf-8",
+            newline="",
+            buffering=CSV_WRITE_BUFFER_SIZE,
+        )
+        self.writer = csv.DictWriter(
+            self.file,
+            fieldnames=headers,
+            delimiter=delimiter,
+            restval="",
+            extrasaction="ignore",
+        )
+
+    def write_rows(self, rows: Iterable[dict[str, Any]]):
+        self.writer.writerows(rows)
+
+    def append_file(self, file: IO[bytes]):
+        """Append rows of a CSV file written with the same headers and delimiter."""
+        self.file.flush()
+        shutil.copyfileobj(file, self.file.buffer)
+
+    def close(self):
+        self.file.close()
+
+
+class XLSXExportWriter:
+    """Write rows to an XLSX file with a write-only workbook.
+
+    openpyxl streams the rows of a write-only workbook to disk, and the file is
+    saved once, on close. Rows already present in the file, like the headers, are
+    copied to the new workbook first.
+    """
+
+    def __init__(self, temporary_file: IO[bytes], headers: list[str]):
+        self.path = temporary_file.name
+        self.headers = headers
+        self.workbook = openpyxl.Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet()
+        if os.path.getsize(self.path):
+            with open(self.path, "rb") as file:
+                self.append_file(file)
+
+    def write_rows(self, rows: Iterable[dict[str, Any]]):
+        for row in rows:
+            self.sheet.append([row.get(header, "") for header in self.headers])
+
+    def append_file(self, file: IO[bytes]):
+        """Append rows of the active sheet of an XLSX file."""
+        workbook = openpyxl.load_workbook(file, read_only=True)
+        for row in workbook.active.iter_rows(values_only=True):
+            self.sheet.append(row)
+        workbook.close()
+
+    def close(self):
+        self.workbook.save(self.path)
+
+
+@contextmanager
+def open_export_writer(
+    temporary_file: IO[bytes], headers: list[str], file_type: str, delimiter: str
+):
+    writer: CSVExportWriter | XLSXExportWriter
+    if file_type == FileTypes.CSV:
+        writer = CSVExportWriter(temporary_file, headers, delimiter)
+    else:
+        writer = XLSXExportWriter(temporary_file, headers)
+    try:
+        yield writer
+    finally:
+        writer.close()
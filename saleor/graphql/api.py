@@ -13,9 +13,11 @@ from graphql import (
     validate,
 )
 from graphql.backend.base import GraphQLDocument
+from graphql.error import GraphQLError
 from graphql.execution import ExecutionResult
+from graphql.language.ast import Document
 
-from ..core.utils.cache import CacheDict
+from ..core.utils.cache import CacheDict, approximate_size
 from ..graphql.notifications.schema import ExternalNotificationMutations
 from .account.schema import AccountMutations, AccountQueries
 from .app.schema import AppMutations, AppQueries
@@ -203,6 +205,22 @@ class SaleorGraphQLBackend(GraphQLCoreBackend):
         # validate eagerly so we can cache the result
         document_ast = parse(document_string)
         validation_errors = validate(schema, document_ast)
+        return self.document_from_ast(
+            schema, document_string, document_ast, validation_errors
+        )
+
+    def document_from_ast(
+        self,
+        schema: GraphQLSchema,
+        document_string: str,
+        document_ast: Document,
+        validation_errors: list[GraphQLError] | None = None,
+    ) -> GraphQLDocument:
+        """Build a document from an already parsed AST.
+
+        The AST is expected to be validated; documents loaded from the persisted
+        query store skip parsing and validation entirely.
+        """
         if validation_errors:
             return GraphQLDocument(
                 schema=schema,
@@ -219,4 +237,30 @@ class SaleorGraphQLBackend(GraphQLCoreBackend):
         )
 
 
-backend = GraphQLCachedBackend(SaleorGraphQLBackend(), cache_map=CacheDict(1000))
+class SaleorGraphQLCachedBackend(GraphQLCachedBackend):
+    def document_from_string(self, schema, request_string):
+        key = self.get_key_for_schema_and_document_string(schema, request_string)
+        document = self.cache_map.get(key)
+        if document is None:
+            document = self.backend.document_from_string(schema, request_string)
+            self.cache_map[key] = document
+        return document
+
+
+def get_document_size(document: GraphQLDocument) -> int:
+    return approximate_size(document.document_ast)
+
+
+# Upper bound of the memory used by parsed documents cached in a single process.
+DOCUMENT_CACHE_MAX_SIZE = 256 * 1024 * 1024
+
+core_backend = SaleorGraphQLBackend()
+backend = SaleorGraphQLCachedBackend(
+    core_backend,
+    cache_map=CacheDict(
+        1000,
+        max_size=DOCUMENT_CACHE_MAX_SIZE,
+        get_size=get_document_size,
+        name="graphql_documents",
+    ),
+)
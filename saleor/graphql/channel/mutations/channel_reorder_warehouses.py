@@ -6,6 +6,7 @@ from django.core.exceptions import ValidationError
 from ....channel.error_codes import ChannelErrorCode
 from ....core.tracing import traced_atomic_transaction
 from ....permission.enums import ChannelPermissions
+from ....warehouse.cache import invalidate_channel_warehouse_priority
 from ...core import ResolveInfo
 from ...core.doc_category import DOC_CATEGORY_CHANNELS
 from ...core.inputs import ReorderInput
@@ -53,6 +54,7 @@ class ChannelReorderWarehouses(BaseMutation):
 
         with traced_atomic_transaction():
             perform_reordering(warehouses_m2m, operations)
+            invalidate_channel_warehouse_priority([channel.pk])
 
         return ChannelReorderWarehouses(channel=channel)
 
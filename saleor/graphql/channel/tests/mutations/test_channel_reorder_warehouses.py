@@ -4,6 +4,7 @@ import graphene
 import pytest
 
 from .....channel.error_codes import ChannelErrorCode
+from .....warehouse.cache import get_channel_warehouse_priority
 from .....warehouse.models import ChannelWarehouse
 from ....tests.utils import get_graphql_content
 
@@ -99,6 +100,46 @@ def test_sort_warehouses_with_channel(
     ] == expected_order
 
 
+def test_sort_warehouses_with_channel_invalidates_warehouse_priority(
+    staff_api_client, permission_manage_channels, channel_USD, warehouses, warehouse
+):
+    # given
+    channel_id = graphene.Node.to_global_id("Channel", channel_USD.pk)
+    channel_warehouses = list(channel_USD.channelwarehouse.all())
+    for sort_order, channel_warehouse in enumerate(channel_warehouses):
+        channel_warehouse.sort_order = sort_order
+    ChannelWarehouse.objects.bulk_update(channel_warehouses, ["sort_order"])
+
+    warehouse_ids = [
+        channel_warehouse.warehouse_id for channel_warehouse in channel_warehouses
+    ]
+    assert list(get_channel_warehouse_priority(channel_USD.pk)) == warehouse_ids
+
+    variables = {
+        "channelId": channel_id,
+        "moves": [
+            {
+                "id": graphene.Node.to_global_id("Warehouse", warehouse_ids[0]),
+                "sortOrder": 2,
+            }
+        ],
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        CHANNEL_REORDER_WAREHOUSES, variables, permissions=[permission_manage_channels]
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["channelReorderWarehouses"]["errors"]
+    assert get_channel_warehouse_priority(channel_USD.pk) == {
+        warehouse_ids[1]: 0,
+        warehouse_ids[2]: 1,
+        warehouse_ids[0]: 2,
+    }
+
+
 def test_sort_warehouses_with_channel_invalid_channel_id(
     staff_api_client, warehouses, channel_USD, permission_manage_channels
 ):
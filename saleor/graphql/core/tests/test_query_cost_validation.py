@@ -1,9 +1,15 @@
+from unittest import mock
+
 import graphene
 import pytest
 from django.test import override_settings
 
+from ...api import backend, schema
 from ...query_cost_map import COST_MAP
+from ...utils import query_fingerprint
 from ..const import DEFAULT_NESTED_LIST_LIMIT
+from ..validators import query_cost
+from ..validators.query_cost import get_cost_variable_names, validate_query_cost
 
 
 @override_settings(GRAPHQL_QUERY_MAX_COMPLEXITY=1)
@@ -548,3 +554,52 @@ def test_query_with_not_required_limit_argument_not_provided(
     assert (
         query_cost == 100 * 1 + 100 * DEFAULT_NESTED_LIST_LIMIT
     )  # 100 attributes + 100 product types (limit value) per attribute
+
+
+def test_get_cost_variable_names():
+    # given
+    document = backend.document_from_string(schema, PRODUCTS_QUERY_WITH_FRAGMENT)
+
+    # when
+    variable_names = get_cost_variable_names(document.document_ast, COST_MAP)
+
+    # then
+    assert variable_names == ("first",)
+
+
+def test_validate_query_cost_is_cached_per_fingerprint_and_multipliers():
+    # given
+    document = backend.document_from_string(schema, PRODUCTS_QUERY)
+    fingerprint = query_fingerprint(document)
+    query_cost._query_cost_cache.clear()
+
+    cost, errors = validate_query_cost(
+        schema, document, {"first": 10, "channel": "a"}, COST_MAP, 1000, fingerprint
+    )
+    assert cost == 120
+    assert errors is None
+
+    # when
+    with mock.patch.object(
+        query_cost, "validate", wraps=query_cost.validate
+    ) as validate_mock:
+        cached_cost, cached_errors = validate_query_cost(
+            schema,
+            document,
+            {"first": 10, "channel": "b"},
+            COST_MAP,
+            100,
+            fingerprint,
+        )
+        other_cost, other_errors = validate_query_cost(
+            schema, document, {"first": 5, "channel": "a"}, COST_MAP, 1000, fingerprint
+        )
+
+    # then
+    assert cached_cost == cost
+    assert cached_errors[0].message == (
+        "The query exceeds the maximum cost of 100. Actual cost is 120"
+    )
+    assert other_cost == 35
+    assert other_errors is None
+    validate_mock.assert_called_once()
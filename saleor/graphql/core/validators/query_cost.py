@@ -1,3 +1,4 @@
+import json
 from collections import defaultdict
 from functools import reduce
 from operator import add, mul
@@ -13,17 +14,23 @@ from graphql import (
 )
 from graphql.execution.values import get_argument_values
 from graphql.language.ast import (
+    Argument,
+    Document,
     Field,
     FragmentDefinition,
     FragmentSpread,
     InlineFragment,
     OperationDefinition,
+    Variable,
 )
+from graphql.language.visitor import Visitor, visit
 from graphql.type import GraphQLField
 from graphql.validation import validate
 from graphql.validation.rules.base import ValidationRule
 from graphql.validation.validation import ValidationContext
 
+from ....core.utils.cache import CacheDict
+
 CostAwareNode = (
     Field | FragmentDefinition | FragmentSpread | InlineFragment | OperationDefinition
 )
@@ -327,13 +334,100 @@ def cost_validator(
     )
 
 
+# Costs of already analyzed documents, keyed by the document fingerprint, the cost
+# map and values of the variables that can affect the cost.
+_query_cost_cache: CacheDict = CacheDict(10000, name="graphql_query_cost")
+# Names of the variables that can affect the cost, keyed by the document fingerprint.
+_cost_variables_cache: CacheDict = CacheDict(1000, name="graphql_query_cost_variables")
+
+
+class CostVariablesCollector(Visitor):
+    """Collect variables used by arguments that act as cost multipliers."""
+
+    def __init__(self, multiplier_args: set[str]):
+        self.multiplier_args = multiplier_args
+        self.variable_names: set[str] = set()
+        self.argument_depth = 0
+
+    def enter_Argument(self, node: Argument, *_args):
+        if self.argument_depth or node.name.value in self.multiplier_args:
+            self.argument_depth += 1
+
+    def leave_Argument(self, node: Argument, *_args):
+        if self.argument_depth:
+            self.argument_depth -= 1
+
+    def enter_Variable(self, node: Variable, *_args):
+        if self.argument_depth:
+            self.variable_names.add(node.name.value)
+
+
+def get_cost_multiplier_args(cost_map: dict[str, dict[str, Any]]) -> set[str]:
+    return {
+        multiplier.split(".")[0]
+        for type_fields in cost_map.values()
+        for field_cost in type_fields.values()
+        for multiplier in field_cost.get("multipliers", [])
+    }
+
+
+def get_cost_variable_names(
+    document_ast: Document, cost_map: dict[str, dict[str, Any]]
+) -> tuple[str, ...]:
+    """Return names of the variables that can change the cost of the document.
+
+    Only arguments used as multipliers in the cost map depend on variable values,
+    the rest of the cost is determined by the document itself.
+    """
+    collector = CostVariablesCollector(get_cost_multiplier_args(cost_map))
+    visit(document_ast, collector)
+    return tuple(sorted(collector.variable_names))
+
+
+def _get_query_cost_cache_key(
+    fingerprint: str, cost_map: dict[str, dict[str, Any]], query, variables
+) -> str:
+    variables_key = (fingerprint, id(cost_map))
+    try:
+        variable_names = _cost_variables_cache[variables_key]
+    except KeyError:
+        variable_names = get_cost_variable_names(query.document_ast, cost_map)
+        _cost_variables_cache[variables_key] = variable_names
+    variables = variables if isinstance(variables, dict) else {}
+    cost_variables = [variables.get(name) for name in variable_names]
+    return json.dumps(
+        [fingerprint, id(cost_map), cost_variables], sort_keys=True, default=str
+    )
+
+
 def validate_query_cost(
     schema,
     query,
     variables,
     cost_map,
     maximum_cost,
+    fingerprint: str | None = None,
 ):
+    """Calculate the cost of the query and validate it against the maximum cost.
+
+    When the document fingerprint is provided, the cost is cached per fingerprint
+    and values of the variables that act as cost multipliers, so the AST is
+    walked only once for each distinct `first`/`last`/`limit` combination.
+    """
+    cache_key = None
+    if fingerprint and cost_map:
+        cache_key = _get_query_cost_cache_key(fingerprint, cost_map, query, variables)
+        try:
+            cost = _query_cost_cache[cache_key]
+        except KeyError:
+            pass
+        else:
+            if cost > maximum_cost:
+                validator = cost_validator(maximum_cost)
+                validator.cost = cost
+                return cost, [validator.get_cost_exceeded_error()]
+            return cost, None
+
     validator = cost_validator(
         maximum_cost,
         variables=variables,
@@ -344,6 +438,10 @@ def validate_query_cost(
         query.document_ast,
         [validator],  # type: ignore[list-item] # cost validator is an instance that pretends to be a class # noqa: E501
     )
+    # Argument errors depend on all variables, so only costs calculated without
+    # them are reusable.
+    if cache_key and all(isinstance(e, QueryCostError) for e in error):
+        _query_cost_cache[cache_key] = validator.cost
     if error:
         return validator.cost, error
     return validator.cost, None
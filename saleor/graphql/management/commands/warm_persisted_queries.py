@@ -0,0 +1,29 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...api import schema
+from ...persisted_queries import warm_up_persisted_queries
+
+
+class Command(BaseCommand):
+    help = (
+        "Stores validated GraphQL documents in the persisted query cache. "
+        "Accepts a JSON manifest with a list of queries or a mapping of "
+        "sha256 hashes to queries."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("manifest", help="Path to the JSON manifest file.")
+
+    def handle(self, *args, **options):
+        try:
+            with open(options["manifest"], encoding="utf-8") as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Unable to read the manifest: {e}") from e
+
+        queries = manifest.values() if isinstance(manifest, dict) else manifest
+        queries = list(queries)
+        stored = warm_up_persisted_queries(schema, queries)
+        self.stdout.write(f"Stored {stored} of {len(queries)} persisted queries.")
@@ -0,0 +1,143 @@
+"""Automatic persisted queries.
+
+Clients may send only the sha256 hash of a query in
+`extensions.persistedQuery.sha256Hash`. When the hash is unknown, the API responds
+with `PersistedQueryNotFound` and the client retries with both the hash and the full
+query, which is then parsed, validated and stored in the shared cache.
+
+Stored entries contain the already validated AST, so no worker has to parse or
+validate a known document again. A process-local registry keyed by hash sits in
+front of the shared cache to avoid round-trips for hot operations.
+"""
+
+import hashlib
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from graphql import GraphQLDocument, GraphQLSchema, parse, validate
+from graphql.error import GraphQLError
+from graphql.language.ast import Document
+
+from .. import __version__ as saleor_version
+from ..core.utils.cache import CacheDict
+from .api import DOCUMENT_CACHE_MAX_SIZE, core_backend, get_document_size
+
+PERSISTED_QUERY_VERSION = 1
+
+# Process-local registry of validated documents keyed by the query hash.
+_persisted_documents: CacheDict = CacheDict(
+    1000,
+    max_size=DOCUMENT_CACHE_MAX_SIZE,
+    get_size=get_document_size,
+    name="graphql_persisted_documents",
+)
+
+
+class PersistedQueryNotFound(GraphQLError):
+    def __init__(self):
+        super().__init__("PersistedQueryNotFound")
+
+
+class PersistedQueryNotSupported(GraphQLError):
+    def __init__(self):
+        super().__init__("PersistedQueryNotSupported")
+
+
+class PersistedQueryHashMismatch(GraphQLError):
+    def __init__(self):
+        super().__init__("Provided sha256Hash does not match the query.")
+
+
+def get_persisted_query_hash(data: dict) -> str | None:
+    """Return the query hash sent in the `persistedQuery` extension, if any."""
+    extensions = data.get("extensions")
+    if not isinstance(extensions, dict):
+        return None
+    persisted_query = extensions.get("persistedQuery")
+    if not isinstance(persisted_query, dict):
+        return None
+    if persisted_query.get("version", PERSISTED_QUERY_VERSION) != (
+        PERSISTED_QUERY_VERSION
+    ):
+        return None
+    query_hash = persisted_query.get("sha256Hash")
+    if not query_hash or not isinstance(query_hash, str):
+        return None
+    return query_hash.lower()
+
+
+def generate_persisted_query_cache_key(query_hash: str) -> str:
+    if settings.GRAPHQL_CACHE_SUFFIX:
+        return f"{saleor_version}-apq-{query_hash}-{settings.GRAPHQL_CACHE_SUFFIX}"
+    return f"{saleor_version}-apq-{query_hash}"
+
+
+def hash_query(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def load_persisted_document(
+    schema: GraphQLSchema, query_hash: str
+) -> GraphQLDocument | None:
+    """Return a validated document for the hash or `None` if it is not stored."""
+    try:
+        return _persisted_documents[query_hash]
+    except KeyError:
+        pass
+
+    entry = cache.get(generate_persisted_query_cache_key(query_hash))
+    if entry is None:
+        return None
+    query, document_ast = entry
+    document = core_backend.document_from_ast(schema, query, document_ast)
+    _persisted_documents[query_hash] = document
+    return document
+
+
+def persist_document(
+    schema: GraphQLSchema, query: str, query_hash: str | None = None
+) -> GraphQLDocument:
+    """Parse and validate the query and store it under its hash.
+
+    Documents with validation errors are returned but never stored.
+    """
+    expected_hash = hash_query(query)
+    if query_hash is not None and query_hash != expected_hash:
+        raise PersistedQueryHashMismatch()
+
+    document_ast = parse(query)
+    validation_errors = validate(schema, document_ast)
+    if validation_errors:
+        return core_backend.document_from_ast(
+            schema, query, document_ast, validation_errors
+        )
+    return _store_document(schema, expected_hash, query, document_ast)
+
+
+def _store_document(
+    schema: GraphQLSchema, query_hash: str, query: str, document_ast: Document
+) -> GraphQLDocument:
+    cache.set(
+        generate_persisted_query_cache_key(query_hash),
+        (query, document_ast),
+        timeout=settings.GRAPHQL_PERSISTED_QUERIES_TIMEOUT,
+    )
+    document = core_backend.document_from_ast(schema, query, document_ast)
+    _persisted_documents[query_hash] = document
+    return document
+
+
+def warm_up_persisted_queries(schema: GraphQLSchema, queries: Iterable[str]) -> int:
+    """Store the given queries as persisted documents.
+
+    Return the number of queries that passed validation and were stored.
+    """
+    stored = 0
+    for query in queries:
+        document_ast = parse(query)
+        if validate(schema, document_ast):
+            continue
+        _store_document(schema, hash_query(query), query, document_ast)
+        stored += 1
+    return stored
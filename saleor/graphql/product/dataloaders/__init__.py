@@ -40,6 +40,10 @@ from .products import (
     VariantChannelListingPromotionRuleByListingIdLoader,
     VariantsChannelListingByProductIdAndChannelSlugLoader,
 )
+from .reviews import (
+    ProductReviewSummaryByProductIdLoader,
+    PublishedReviewsByProductIdLoader,
+)
 
 __all__ = [
     "CategoryByIdLoader",
@@ -67,6 +71,8 @@ __all__ = [
     "ProductVariantChannelListingByIdLoader",
     "ProductVariantsByProductIdLoader",
     "ProductMediaByIdLoader",
+    "ProductReviewSummaryByProductIdLoader",
+    "PublishedReviewsByProductIdLoader",
     "MediaByProductVariantIdLoader",
     "ThumbnailByCategoryIdSizeAndFormatLoader",
     "ThumbnailByCollectionIdSizeAndFormatLoader",
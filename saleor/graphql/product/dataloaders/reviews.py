@@ -0,0 +1,31 @@
+from collections import defaultdict
+
+from ....product.models import ProductReview, ProductReviewSummary
+from ...core.dataloaders import DataLoader
+
+
+class PublishedReviewsByProductIdLoader(DataLoader[int, list[ProductReview]]):
+    context_key = "published_reviews_by_product"
+
+    def batch_load(self, keys):
+        reviews = (
+            ProductReview.objects.using(self.database_connection_name)
+            .filter(product_id__in=keys, is_published=True)
+            .order_by("-created_at")
+        )
+        reviews_map = defaultdict(list)
+        for review in reviews.iterator(chunk_size=1000):
+            reviews_map[review.product_id].append(review)
+        return [reviews_map.get(product_id, []) for product_id in keys]
+
+
+class ProductReviewSummaryByProductIdLoader(
+    DataLoader[int, ProductReviewSummary | None]
+):
+    context_key = "product_review_summary_by_product"
+
+    def batch_load(self, keys):
+        summaries = ProductReviewSummary.objects.using(
+            self.database_connection_name
+        ).in_bulk(keys)
+        return [summaries.get(product_id) for product_id in keys]
@@ -1,4 +1,4 @@
-from ...product import ProductMediaTypes, ProductTypeKind
+from ...product import ProductMediaTypes, ProductSearchMode, ProductTypeKind
 from ..core.doc_category import DOC_CATEGORY_PRODUCTS
 from ..core.enums import to_enum
 from ..core.types import BaseEnum
@@ -9,6 +9,9 @@ ProductTypeKindEnum.doc_category = DOC_CATEGORY_PRODUCTS
 ProductMediaType = to_enum(ProductMediaTypes, type_name="ProductMediaType")
 ProductMediaType.doc_category = DOC_CATEGORY_PRODUCTS
 
+ProductSearchModeEnum = to_enum(ProductSearchMode, type_name="ProductSearchMode")
+ProductSearchModeEnum.doc_category = DOC_CATEGORY_PRODUCTS
+
 
 class ProductAttributeType(BaseEnum):
     PRODUCT = "PRODUCT"
@@ -0,0 +1,46 @@
+import django_filters
+
+from ....product.models import ProductReview
+from ...core.doc_category import DOC_CATEGORY_PRODUCTS
+from ...core.filters import (
+    FilterInputObjectType,
+    GlobalIDMultipleChoiceFilter,
+    ObjectTypeFilter,
+)
+from ...core.types import DateTimeRangeInput, IntRangeInput
+from ...utils import resolve_global_ids_to_primary_keys
+from ...utils.filters import filter_range_field
+from .. import types as product_types
+
+
+def filter_review_created_at(qs, _, value):
+    return filter_range_field(qs, "created_at", value)
+
+
+def filter_review_rating(qs, _, value):
+    return filter_range_field(qs, "rating", value)
+
+
+def filter_review_products(qs, _, value):
+    if not value:
+        return qs
+    _, product_pks = resolve_global_ids_to_primary_keys(value, product_types.Product)
+    return qs.filter(product_id__in=product_pks)
+
+
+class ProductReviewFilter(django_filters.FilterSet):
+    created_at = ObjectTypeFilter(
+        input_class=DateTimeRangeInput, method=filter_review_created_at
+    )
+    rating = ObjectTypeFilter(input_class=IntRangeInput, method=filter_review_rating)
+    products = GlobalIDMultipleChoiceFilter(method=filter_review_products)
+
+    class Meta:
+        model = ProductReview
+        fields = ["created_at", "rating", "products"]
+
+
+class ProductReviewFilterInput(FilterInputObjectType):
+    class Meta:
+        doc_category = DOC_CATEGORY_PRODUCTS
+        filterset_class = ProductReviewFilter
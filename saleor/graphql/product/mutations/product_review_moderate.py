@@ -11,6 +11,7 @@ from ...core.utils import from_global_id_or_error
 from ....permission.enums import ProductPermissions
 from ....product import models as product_models
 from ....product.error_codes import ProductErrorCode
+from ....product.utils.product import update_product_review_summary
 from ...utils import get_user_or_app_from_context
 from ..types.product_reviews import ProductReview
 
@@ -87,11 +88,14 @@ class ProductReviewModerate(BaseMutation):
             review.moderated_by = user
             review.moderated_at = timezone.now()
             review.save(update_fields=["is_published", "moderated_by", "moderated_at"])
+            update_product_review_summary(review.product_id)
             return cls(errors=[], review=review)
 
         elif action == "reject":
             # Отклоняем отзыв - удаляем
             review.delete()
+            if review.is_published:
+                update_product_review_summary(review.product_id)
             return cls(errors=[], review=None)
 
         else:
@@ -167,6 +167,12 @@ def resolve_product_types(info: ResolveInfo):
     ).all()
 
 
+def resolve_product_reviews(info: ResolveInfo, *, is_published: bool):
+    return models.ProductReview.objects.using(
+        get_database_connection_name(info.context)
+    ).filter(is_published=is_published)
+
+
 @traced_resolver
 def resolve_variant(
     info: ResolveInfo,
@@ -4,7 +4,7 @@ from promise import Promise
 
 from ...permission.enums import ProductPermissions
 from ...permission.utils import has_one_of_permissions
-from ...product import models
+from ...product import ProductSearchMode, ProductSearchVisibility, models
 from ...product.models import ALL_PRODUCTS_PERMISSIONS
 from ...product.search import search_products
 from ..channel.dataloaders.by_self import ChannelBySlugLoader
@@ -19,6 +19,7 @@ from ..core.context import (
 from ..core.descriptions import (
     ADDED_IN_321,
     ADDED_IN_322,
+    ADDED_IN_323,
     DEFAULT_DEPRECATION_REASON,
     DEPRECATED_IN_3X_INPUT,
 )
@@ -58,9 +59,11 @@ from .bulk_mutations import (
     ProductVariantStocksUpdate,
 )
 from .dataloaders.products import CategoryByIdLoader, CategoryBySlugLoader
+from .enums import ProductSearchModeEnum
 from .filters.category import CategoryFilterInput, CategoryWhereInput
 from .filters.collection import CollectionFilterInput, CollectionWhereInput
 from .filters.product import ProductFilterInput, ProductWhereInput
+from .filters.product_review import ProductReviewFilterInput
 from .filters.product_type import ProductTypeFilterInput
 from .filters.product_variant import ProductVariantFilterInput, ProductVariantWhereInput
 from .mutations import (
@@ -123,6 +126,7 @@ from .resolvers import (
     resolve_digital_content_by_id,
     resolve_digital_contents,
     resolve_product,
+    resolve_product_reviews,
     resolve_product_type_by_id,
     resolve_product_types,
     resolve_product_variants,
@@ -134,6 +138,7 @@ from .sorters import (
     CategorySortingInput,
     CollectionSortingInput,
     ProductOrder,
+    ProductReviewSortingInput,
     ProductTypeSortingInput,
     ProductVariantSortingInput,
 )
@@ -146,7 +151,7 @@ from .types import (
     DigitalContentCountableConnection,
     Product,
     ProductCountableConnection,
-    ProductReview,
+    ProductReviewCountableConnection,
     ProductType,
     ProductTypeCountableConnection,
     ProductVariant,
@@ -275,6 +280,13 @@ class ProductQueries(graphene.ObjectType):
         where=ProductWhereInput(description="Where filtering options for products."),
         sort_by=ProductOrder(description="Sort products."),
         search=graphene.String(description="Search products."),
+        search_mode=ProductSearchModeEnum(
+            description=(
+                "Mode of the `search` argument. `FUZZY` also matches word prefixes "
+                "and product names with typos, which makes it suitable for "
+                "autocomplete. Defaults to `WEBSEARCH`." + ADDED_IN_323
+            )
+        ),
         channel=graphene.String(
             description="Slug of a channel for which the data should be returned."
         ),
@@ -366,19 +378,21 @@ class ProductQueries(graphene.ObjectType):
         doc_category=DOC_CATEGORY_PRODUCTS,
         deprecation_reason=DEFAULT_DEPRECATION_REASON,
     )
-    product_reviews_pending = PermissionsField(
-        NonNullList(ProductReview),
+    product_reviews_pending = FilterConnectionField(
+        ProductReviewCountableConnection,
+        filter=ProductReviewFilterInput(description="Фильтрация отзывов."),
+        sort_by=ProductReviewSortingInput(description="Сортировка отзывов."),
         description="Отзывы, ожидающие модерации.",
-        required=True,
         permissions=[
             ProductPermissions.MANAGE_PRODUCTS,
         ],
         doc_category=DOC_CATEGORY_PRODUCTS,
     )
-    product_reviews_published = PermissionsField(
-        NonNullList(ProductReview),
+    product_reviews_published = FilterConnectionField(
+        ProductReviewCountableConnection,
+        filter=ProductReviewFilterInput(description="Фильтрация отзывов."),
+        sort_by=ProductReviewSortingInput(description="Сортировка отзывов."),
         description="Опубликованные отзывы.",
-        required=True,
         permissions=[
             ProductPermissions.MANAGE_PRODUCTS,
         ],
@@ -544,7 +558,9 @@ class ProductQueries(graphene.ObjectType):
 
     @staticmethod
     @traced_resolver
-    def resolve_products(_root, info: ResolveInfo, *, channel=None, **kwargs):
+    def resolve_products(
+        _root, info: ResolveInfo, *, channel=None, search_mode=None, **kwargs
+    ):
         check_for_sorting_by_rank(info, kwargs)
         search = kwargs.get("search")
 
@@ -557,12 +573,25 @@ class ProductQueries(graphene.ObjectType):
             channel = get_default_channel_slug_or_graphql_error(
                 allow_replica=info.context.allow_replica
             )
+        if not has_required_permissions:
+            search_visibility = ProductSearchVisibility.PUBLISHED
+        elif limited_channel_access:
+            search_visibility = ProductSearchVisibility.CHANNEL
+        else:
+            search_visibility = ProductSearchVisibility.ALL
 
         def _resolve_products(channel_obj):
             qs = resolve_products(info, requestor, channel_obj, limited_channel_access)
             if search:
                 qs = ChannelQsContext(
-                    qs=search_products(qs.qs, search), channel_slug=channel
+                    qs=search_products(
+                        qs.qs,
+                        search,
+                        mode=search_mode or ProductSearchMode.WEBSEARCH,
+                        channel_slug=channel,
+                        visibility=search_visibility,
+                    ),
+                    channel_slug=channel,
                 )
             kwargs["channel"] = channel
             qs = filter_connection_queryset(
@@ -702,18 +731,26 @@ class ProductQueries(graphene.ObjectType):
         )
 
     @staticmethod
-    def resolve_product_reviews_pending(_root, info: ResolveInfo):
+    def resolve_product_reviews_pending(_root, info: ResolveInfo, **kwargs):
         """Возвращает отзывы, ожидающие модерации."""
-        return models.ProductReview.objects.using(
-            get_database_connection_name(info.context)
-        ).filter(is_published=False).order_by("-created_at")
+        qs = resolve_product_reviews(info, is_published=False)
+        qs = filter_connection_queryset(
+            qs, kwargs, allow_replica=info.context.allow_replica
+        )
+        return create_connection_slice(
+            qs, info, kwargs, ProductReviewCountableConnection
+        )
 
     @staticmethod
-    def resolve_product_reviews_published(_root, info: ResolveInfo):
+    def resolve_product_reviews_published(_root, info: ResolveInfo, **kwargs):
         """Возвращает опубликованные отзывы."""
-        return models.ProductReview.objects.using(
-            get_database_connection_name(info.context)
-        ).filter(is_published=True).order_by("-created_at")
+        qs = resolve_product_reviews(info, is_published=True)
+        qs = filter_connection_queryset(
+            qs, kwargs, allow_replica=info.context.allow_replica
+        )
+        return create_connection_slice(
+            qs, info, kwargs, ProductReviewCountableConnection
+        )
 
 
 class ProductMutations(graphene.ObjectType):
@@ -375,3 +375,28 @@ class MediaSortingInput(SortInputObjectType):
         doc_category = DOC_CATEGORY_PRODUCTS
         sort_enum = MediaChoicesSortField
         type_name = "media"
+
+
+class ProductReviewSortField(BaseEnum):
+    CREATED_AT = ["created_at", "pk"]
+    RATING = ["rating", "created_at", "pk"]
+
+    class Meta:
+        doc_category = DOC_CATEGORY_PRODUCTS
+
+    @property
+    def description(self):
+        descriptions = {
+            ProductReviewSortField.CREATED_AT.name: "creation date.",  # type: ignore[attr-defined] # graphene.Enum is not typed # noqa: E501
+            ProductReviewSortField.RATING.name: "rating.",  # type: ignore[attr-defined] # graphene.Enum is not typed # noqa: E501
+        }
+        if self.name in descriptions:
+            return f"Sort product reviews by {descriptions[self.name]}"
+        raise ValueError(f"Unsupported enum value: {self.value}")
+
+
+class ProductReviewSortingInput(SortInputObjectType):
+    class Meta:
+        doc_category = DOC_CATEGORY_PRODUCTS
+        sort_enum = ProductReviewSortField
+        type_name = "product reviews"
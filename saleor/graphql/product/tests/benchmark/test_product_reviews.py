@@ -0,0 +1,83 @@
+import pytest
+
+from .....product.models import ProductReview
+from .....product.utils.product import update_product_review_summary
+from ....tests.utils import get_graphql_content
+
+PRODUCTS_WITH_REVIEWS_QUERY = """
+query ProductsWithReviews($channel: String) {
+  products(first: 10, channel: $channel) {
+    edges {
+      node {
+        id
+        reviewSummary {
+          reviewCount
+          ratingAverage
+          ratingHistogram {
+            rating
+            count
+          }
+        }
+        reviews {
+          rating
+          text
+          user {
+            id
+          }
+          moderatedBy {
+            id
+          }
+          product {
+            id
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_products_with_reviews(
+    staff_api_client,
+    product_list,
+    customer_user,
+    staff_user,
+    channel_USD,
+    count_queries,
+):
+    # given
+    ProductReview.objects.bulk_create(
+        [
+            ProductReview(
+                product=product,
+                user=customer_user,
+                rating=rating,
+                text="Отличный товар, рекомендую.",
+                is_published=True,
+                moderated_by=staff_user,
+            )
+            for product in product_list
+            for rating in (4, 5)
+        ]
+    )
+    for product in product_list:
+        update_product_review_summary(product.pk)
+
+    # when
+    response = staff_api_client.post_graphql(
+        PRODUCTS_WITH_REVIEWS_QUERY, {"channel": channel_USD.slug}
+    )
+
+    # then
+    content = get_graphql_content(response)
+    edges = content["data"]["products"]["edges"]
+    assert edges
+    for edge in edges:
+        node = edge["node"]
+        assert node["reviewSummary"]["reviewCount"] == 2
+        assert node["reviewSummary"]["ratingAverage"] == 4.5
+        assert len(node["reviews"]) == 2
+        assert all(review["product"]["id"] == node["id"] for review in node["reviews"])
@@ -3,7 +3,7 @@ import pytest
 
 from .....graphql.tests.utils import get_graphql_content, get_graphql_content_from_response
 from .....product.error_codes import ProductErrorCode
-from .....product.models import ProductReview
+from .....product.models import ProductReview, ProductReviewSummary
 
 
 PRODUCT_REVIEW_MODERATE_MUTATION = """
@@ -104,6 +104,61 @@ def test_product_review_moderate_reject_success(
     assert not ProductReview.objects.filter(pk=review_pk).exists()
 
 
+def test_product_review_moderate_approve_updates_summary(
+    staff_api_client, product_review, permission_manage_products
+):
+    # given
+    product = product_review.product
+    product.rating = 3.0
+    product.save(update_fields=["rating"])
+    review_id = graphene.Node.to_global_id("ProductReview", product_review.id)
+    variables = {"input": {"id": review_id, "action": "approve"}}
+
+    # when
+    response = staff_api_client.post_graphql(
+        PRODUCT_REVIEW_MODERATE_MUTATION,
+        variables,
+        permissions=[permission_manage_products],
+    )
+
+    # then
+    get_graphql_content(response)
+    summary = ProductReviewSummary.objects.get(product=product)
+    assert summary.review_count == 1
+    assert summary.rating_avg == 5
+    assert summary.get_rating_histogram() == {1: 0, 2: 0, 3: 0, 4: 0, 5: 1}
+    # the rating set by the merchant is not overwritten
+    product.refresh_from_db()
+    assert product.rating == 3.0
+
+
+def test_product_review_moderate_reject_published_updates_summary(
+    staff_api_client, product_review, permission_manage_products
+):
+    # given
+    product_review.is_published = True
+    product_review.save(update_fields=["is_published"])
+    ProductReviewSummary.objects.create(
+        product=product_review.product, review_count=1, rating_avg=5, rating_5_count=1
+    )
+    review_id = graphene.Node.to_global_id("ProductReview", product_review.id)
+    variables = {"input": {"id": review_id, "action": "reject"}}
+
+    # when
+    response = staff_api_client.post_graphql(
+        PRODUCT_REVIEW_MODERATE_MUTATION,
+        variables,
+        permissions=[permission_manage_products],
+    )
+
+    # then
+    get_graphql_content(response)
+    summary = ProductReviewSummary.objects.get(product=product_review.product)
+    assert summary.review_count == 0
+    assert summary.rating_avg is None
+    assert summary.rating_5_count == 0
+
+
 def test_product_review_moderate_invalid_action(
     staff_api_client, product_review, permission_manage_products
 ):
@@ -0,0 +1,204 @@
+import graphene
+import pytest
+
+from .....product.models import ProductReview
+from ....tests.utils import assert_no_permission, get_graphql_content
+
+QUERY_PRODUCT_REVIEWS_PUBLISHED = """
+    query (
+        $first: Int, $after: String,
+        $filter: ProductReviewFilterInput, $sortBy: ProductReviewSortingInput
+    ) {
+        productReviewsPublished(
+            first: $first, after: $after, filter: $filter, sortBy: $sortBy
+        ) {
+            totalCount
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+            edges {
+                node {
+                    rating
+                    text
+                }
+            }
+        }
+    }
+"""
+
+QUERY_PRODUCT_REVIEWS_PENDING = """
+    query ($first: Int) {
+        productReviewsPending(first: $first) {
+            totalCount
+            edges {
+                node {
+                    text
+                    isPublished
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.fixture
+def product_reviews(product_list, customer_user):
+    return ProductReview.objects.bulk_create(
+        [
+            ProductReview(
+                product=product_list[0],
+                user=customer_user,
+                rating=5,
+                text="Review 1",
+                is_published=True,
+            ),
+            ProductReview(
+                product=product_list[0],
+                user=customer_user,
+                rating=2,
+                text="Review 2",
+                is_published=True,
+            ),
+            ProductReview(
+                product=product_list[1],
+                user=customer_user,
+                rating=4,
+                text="Review 3",
+                is_published=True,
+            ),
+            ProductReview(
+                product=product_list[1],
+                user=customer_user,
+                rating=1,
+                text="Review 4",
+                is_published=False,
+            ),
+        ]
+    )
+
+
+def test_product_reviews_published_paginated(
+    staff_api_client, permission_manage_products, product_reviews
+):
+    # given
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    variables = {"first": 2}
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_PRODUCT_REVIEWS_PUBLISHED, variables)
+    content = get_graphql_content(response)
+    first_page = content["data"]["productReviewsPublished"]
+    variables["after"] = first_page["pageInfo"]["endCursor"]
+    response = staff_api_client.post_graphql(QUERY_PRODUCT_REVIEWS_PUBLISHED, variables)
+    content = get_graphql_content(response)
+    second_page = content["data"]["productReviewsPublished"]
+
+    # then
+    assert first_page["totalCount"] == 3
+    assert first_page["pageInfo"]["hasNextPage"] is True
+    assert len(first_page["edges"]) == 2
+    assert second_page["pageInfo"]["hasNextPage"] is False
+    texts = [edge["node"]["text"] for edge in first_page["edges"]] + [
+        edge["node"]["text"] for edge in second_page["edges"]
+    ]
+    assert sorted(texts) == ["Review 1", "Review 2", "Review 3"]
+
+
+@pytest.mark.parametrize(
+    ("review_filter", "expected_texts"),
+    [
+        ({"rating": {"gte": 4}}, ["Review 1", "Review 3"]),
+        ({"rating": {"lte": 2}}, ["Review 2"]),
+    ],
+)
+def test_product_reviews_published_filter_by_rating(
+    review_filter,
+    expected_texts,
+    staff_api_client,
+    permission_manage_products,
+    product_reviews,
+):
+    # given
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    variables = {"first": 10, "filter": review_filter}
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_PRODUCT_REVIEWS_PUBLISHED, variables)
+
+    # then
+    content = get_graphql_content(response)
+    edges = content["data"]["productReviewsPublished"]["edges"]
+    assert sorted(edge["node"]["text"] for edge in edges) == expected_texts
+
+
+def test_product_reviews_published_filter_by_products(
+    staff_api_client, permission_manage_products, product_reviews, product_list
+):
+    # given
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    product_id = graphene.Node.to_global_id("Product", product_list[1].pk)
+    variables = {"first": 10, "filter": {"products": [product_id]}}
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_PRODUCT_REVIEWS_PUBLISHED, variables)
+
+    # then
+    content = get_graphql_content(response)
+    edges = content["data"]["productReviewsPublished"]["edges"]
+    assert [edge["node"]["text"] for edge in edges] == ["Review 3"]
+
+
+@pytest.mark.parametrize(
+    ("review_sort", "expected_ratings"),
+    [
+        ({"field": "RATING", "direction": "ASC"}, [2, 4, 5]),
+        ({"field": "RATING", "direction": "DESC"}, [5, 4, 2]),
+    ],
+)
+def test_product_reviews_published_sort_by_rating(
+    review_sort,
+    expected_ratings,
+    staff_api_client,
+    permission_manage_products,
+    product_reviews,
+):
+    # given
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    variables = {"first": 10, "sortBy": review_sort}
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_PRODUCT_REVIEWS_PUBLISHED, variables)
+
+    # then
+    content = get_graphql_content(response)
+    edges = content["data"]["productReviewsPublished"]["edges"]
+    assert [edge["node"]["rating"] for edge in edges] == expected_ratings
+
+
+def test_product_reviews_pending(
+    staff_api_client, permission_manage_products, product_reviews
+):
+    # given
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+
+    # when
+    response = staff_api_client.post_graphql(
+        QUERY_PRODUCT_REVIEWS_PENDING, {"first": 10}
+    )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["productReviewsPending"]
+    assert data["totalCount"] == 1
+    assert data["edges"][0]["node"] == {"text": "Review 4", "isPublished": False}
+
+
+def test_product_reviews_pending_no_permission(staff_api_client, product_reviews):
+    # when
+    response = staff_api_client.post_graphql(
+        QUERY_PRODUCT_REVIEWS_PENDING, {"first": 10}
+    )
+
+    # then
+    assert_no_permission(response)
@@ -3,6 +3,7 @@ from decimal import Decimal
 
 import graphene
 import pytest
+from django.core.cache import cache
 from django.utils.dateparse import parse_datetime
 
 from .....attribute.tests.model_helpers import get_product_attributes
@@ -1273,6 +1274,74 @@ def test_search_products_on_root_level(
     assert returned_attrs == {product_list[index].slug for index in indexes}
 
 
+@pytest.mark.parametrize(
+    ("search", "indexes"),
+    [
+        ("smal", [2]),
+        ("big oran", [1]),
+        ("prodct", [0, 1, 2]),
+        ("ABCD", []),
+    ],
+)
+def test_search_products_on_root_level_fuzzy_mode(
+    search, indexes, api_client, product_list, channel_USD, settings
+):
+    # given
+    settings.PRODUCT_SEARCH_CACHE_TIMEOUT = 0
+    query = """
+        query($search: String, $channel: String) {
+          products(first: 10, search: $search, searchMode: FUZZY, channel: $channel) {
+            edges {
+              node {
+                slug
+              }
+            }
+          }
+        }
+    """
+    variables = {"search": search, "channel": channel_USD.slug}
+
+    # when
+    response = api_client.post_graphql(query, variables)
+
+    # then
+    data = get_graphql_content(response)
+    nodes = data["data"]["products"]["edges"]
+    returned_slugs = {node["node"]["slug"] for node in nodes}
+    assert returned_slugs == {product_list[index].slug for index in indexes}
+
+
+def test_search_products_fuzzy_mode_caches_ranks(
+    api_client, product_list, channel_USD, settings, capture_queries
+):
+    # given
+    settings.PRODUCT_SEARCH_CACHE_TIMEOUT = 60
+    cache.clear()
+    query = """
+        query($search: String, $channel: String) {
+          products(first: 10, search: $search, searchMode: FUZZY, channel: $channel) {
+            edges {
+              node {
+                slug
+              }
+            }
+          }
+        }
+    """
+    variables = {"search": "big", "channel": channel_USD.slug}
+    first_response = api_client.post_graphql(query, variables)
+
+    # when
+    with capture_queries() as ctx:
+        response = api_client.post_graphql(query, variables)
+
+    # then
+    assert get_graphql_content(response) == get_graphql_content(first_response)
+    assert not [
+        captured for captured in ctx.captured_queries if "SIMILARITY" in captured["sql"]
+    ]
+
+
 def test_search_product_using_search_argument_with_sort_by(
     user_api_client, product_list, product, channel_USD
 ):
@@ -14,7 +14,11 @@ from .products import (
     ProductVariant,
     ProductVariantCountableConnection,
 )
-from .product_reviews import ProductReview
+from .product_reviews import (
+    ProductReview,
+    ProductReviewCountableConnection,
+    ProductReviewSummary,
+)
 
 __all__ = [
     "Category",
@@ -32,4 +36,6 @@ __all__ = [
     "DigitalContentCountableConnection",
     "DigitalContentUrl",
     "ProductReview",
+    "ProductReviewCountableConnection",
+    "ProductReviewSummary",
 ]
@@ -3,12 +3,15 @@ from graphene import relay
 
 from ....product import models
 from ...account import types as account_types
-from ...core.types import ModelObjectType
+from ...core.connection import CountableConnection
+from ...core.types import BaseObjectType, ModelObjectType, NonNullList
 from ...core.context import ChannelContext
 from ...core.fields import PermissionsField
 from ...core.scalars import DateTime
 from ...core.doc_category import DOC_CATEGORY_PRODUCTS
 from ....core.utils import build_absolute_uri
+from ...account.dataloaders import UserByUserIdLoader
+from ..dataloaders import ProductByIdLoader
 
 
 class ProductReview(ModelObjectType[models.ProductReview]):
@@ -66,13 +69,66 @@ class ProductReview(ModelObjectType[models.ProductReview]):
     def resolve_product(root: models.ProductReview, info):
         # Product использует ChannelContextType, поэтому нужно обернуть в ChannelContext
         # Используем None для channel_slug - дефолтный канал будет использован автоматически
-        return ChannelContext(node=root.product, channel_slug=None)
+        return (
+            ProductByIdLoader(info.context)
+            .load(root.product_id)
+            .then(lambda product: ChannelContext(node=product, channel_slug=None))
+        )
 
     @staticmethod
-    def resolve_user(root: models.ProductReview, _info):
-        return root.user
+    def resolve_user(root: models.ProductReview, info):
+        return UserByUserIdLoader(info.context).load(root.user_id)
 
     @staticmethod
-    def resolve_moderated_by(root: models.ProductReview, _info):
-        return root.moderated_by
+    def resolve_moderated_by(root: models.ProductReview, info):
+        if not root.moderated_by_id:
+            return None
+        return UserByUserIdLoader(info.context).load(root.moderated_by_id)
 
+
+class ProductReviewCountableConnection(CountableConnection):
+    class Meta:
+        doc_category = DOC_CATEGORY_PRODUCTS
+        node = ProductReview
+
+
+class ProductReviewRatingCount(BaseObjectType):
+    rating = graphene.Int(required=True, description="Рейтинг от 1 до 5 звезд.")
+    count = graphene.Int(
+        required=True, description="Количество отзывов с данным рейтингом."
+    )
+
+    class Meta:
+        description = "Количество опубликованных отзывов с заданным рейтингом."
+        doc_category = DOC_CATEGORY_PRODUCTS
+
+
+class ProductReviewSummary(BaseObjectType):
+    review_count = graphene.Int(
+        required=True, description="Количество опубликованных отзывов."
+    )
+    rating_average = graphene.Float(
+        description="Средний рейтинг опубликованных отзывов."
+    )
+    rating_histogram = NonNullList(
+        ProductReviewRatingCount,
+        required=True,
+        description="Распределение опубликованных отзывов по рейтингу.",
+    )
+
+    class Meta:
+        description = "Сводка по опубликованным отзывам товара."
+        doc_category = DOC_CATEGORY_PRODUCTS
+
+    @staticmethod
+    def resolve_rating_average(root: models.ProductReviewSummary, _info):
+        if root.rating_avg is None:
+            return None
+        return float(root.rating_avg)
+
+    @staticmethod
+    def resolve_rating_histogram(root: models.ProductReviewSummary, _info):
+        return [
+            ProductReviewRatingCount(rating=rating, count=count)
+            for rating, count in root.get_rating_histogram().items()
+        ]
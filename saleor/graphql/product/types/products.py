@@ -142,9 +142,11 @@ from ..dataloaders import (
     ProductByIdLoader,
     ProductChannelListingByProductIdAndChannelSlugLoader,
     ProductChannelListingByProductIdLoader,
+    ProductReviewSummaryByProductIdLoader,
     ProductTypeByIdLoader,
     ProductVariantByIdLoader,
     ProductVariantsByProductIdLoader,
+    PublishedReviewsByProductIdLoader,
     ThumbnailByProductMediaIdSizeAndFormatLoader,
     VariantAttributesAllByProductTypeIdLoader,
     VariantAttributesVisibleInStorefrontByProductTypeIdLoader,
@@ -1102,6 +1104,11 @@ class Product(ChannelContextType[models.Product]):
         description="Опубликованные отзывы на товар.",
         required=True,
     )
+    review_summary = graphene.Field(
+        "saleor.graphql.product.types.product_reviews.ProductReviewSummary",
+        description="Сводка по опубликованным отзывам на товар.",
+        required=True,
+    )
 
     class Meta:
         default_resolver = ChannelContextType.resolver_with_context
@@ -1670,9 +1677,20 @@ class Product(ChannelContextType[models.Product]):
         return Promise.resolve(product_type).then(resolve_tax_class)
 
     @staticmethod
-    def resolve_reviews(root: ChannelContext[models.Product], _info):
+    def resolve_reviews(root: ChannelContext[models.Product], info):
         """Возвращает опубликованные отзывы на товар."""
-        return root.node.reviews.filter(is_published=True)
+        return PublishedReviewsByProductIdLoader(info.context).load(root.node.id)
+
+    @staticmethod
+    def resolve_review_summary(root: ChannelContext[models.Product], info):
+        return (
+            ProductReviewSummaryByProductIdLoader(info.context)
+            .load(root.node.id)
+            .then(
+                lambda summary: summary
+                or models.ProductReviewSummary(product_id=root.node.id)
+            )
+        )
 
     def resolve_charge_taxes(root: ChannelContext[models.Product], info):
         # Deprecated: this field is deprecated as it only checks whether there are any
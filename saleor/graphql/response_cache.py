@@ -0,0 +1,139 @@
+"""Response cache for anonymous storefront queries.
+
+Responses of anonymous catalog queries are cached under a key built from the
+document fingerprint, operation name, variables (which carry the channel and
+the language code) and the active language. All keys include a shared version
+that is replaced whenever one of the catalog events listed in
+`RESPONSE_CACHE_INVALIDATING_EVENTS` is triggered, which invalidates every
+cached response at once.
+
+The cache is disabled unless `GRAPHQL_RESPONSE_CACHE_TIMEOUT` is set. Data that
+changes without emitting catalog events, such as stock availability, may be
+stale for at most the configured timeout.
+"""
+
+import hashlib
+import json
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest
+from django.utils import translation
+from graphql import GraphQLDocument
+from graphql.language.ast import Field, OperationDefinition
+
+from .. import __version__ as saleor_version
+from ..core.auth import get_token_from_request
+
+RESPONSE_CACHE_VERSION_KEY = "graphql-response-cache-version"
+
+RESPONSE_CACHE_ROOT_FIELDS = frozenset(
+    {
+        "__typename",
+        "categories",
+        "category",
+        "collection",
+        "collections",
+        "product",
+        "productVariant",
+        "productVariants",
+        "products",
+    }
+)
+
+RESPONSE_CACHE_INVALIDATING_EVENTS = frozenset(
+    {
+        "category_created",
+        "category_deleted",
+        "category_updated",
+        "collection_created",
+        "collection_deleted",
+        "collection_metadata_updated",
+        "collection_updated",
+        "product_created",
+        "product_deleted",
+        "product_media_created",
+        "product_media_deleted",
+        "product_media_updated",
+        "product_metadata_updated",
+        "product_updated",
+        "product_variant_back_in_stock",
+        "product_variant_created",
+        "product_variant_deleted",
+        "product_variant_metadata_updated",
+        "product_variant_out_of_stock",
+        "product_variant_stocks_updated",
+        "product_variant_updated",
+        "promotion_deleted",
+        "promotion_ended",
+        "promotion_started",
+        "promotion_updated",
+    }
+)
+
+
+def is_response_cache_enabled() -> bool:
+    return settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT > 0
+
+
+def is_response_cacheable(
+    request: HttpRequest, document: GraphQLDocument, operation_name: str | None
+) -> bool:
+    """Check if the response of the operation can be shared between requests.
+
+    Only anonymous queries that select catalog root fields are cacheable.
+    """
+    if not is_response_cache_enabled():
+        return False
+    if get_token_from_request(request) or getattr(request, "app", None):
+        return False
+
+    operation = _get_operation(document, operation_name)
+    if operation is None or operation.operation != "query":
+        return False
+    return all(
+        isinstance(selection, Field)
+        and selection.name.value in RESPONSE_CACHE_ROOT_FIELDS
+        for selection in operation.selection_set.selections
+    )
+
+
+def _get_operation(
+    document: GraphQLDocument, operation_name: str | None
+) -> OperationDefinition | None:
+    operations = [
+        definition
+        for definition in document.document_ast.definitions
+        if isinstance(definition, OperationDefinition)
+    ]
+    if not operation_name:
+        return operations[0] if len(operations) == 1 else None
+    for operation in operations:
+        if operation.name and operation.name.value == operation_name:
+            return operation
+    return None
+
+
+def get_response_cache_version() -> str:
+    version = cache.get(RESPONSE_CACHE_VERSION_KEY)
+    if version is None:
+        cache.add(RESPONSE_CACHE_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(RESPONSE_CACHE_VERSION_KEY)
+    return version
+
+
+def invalidate_response_cache():
+    cache.set(RESPONSE_CACHE_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def generate_response_cache_key(
+    fingerprint: str, operation_name: str | None, variables: dict | None
+) -> str:
+    variables_hash = hashlib.sha256(
+        json.dumps(variables or {}, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    return (
+        f"{saleor_version}-response-{get_response_cache_version()}-{fingerprint}-"
+        f"{operation_name or ''}-{translation.get_language()}-{variables_hash}"
+    )
@@ -0,0 +1,138 @@
+import hashlib
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+
+from ..api import schema
+from ..persisted_queries import (
+    _persisted_documents,
+    generate_persisted_query_cache_key,
+    get_persisted_query_hash,
+    load_persisted_document,
+    warm_up_persisted_queries,
+)
+from .utils import get_graphql_content, get_graphql_content_from_response
+
+QUERY_SHOP = """
+query Shop {
+    shop {
+        defaultCountry {
+            code
+        }
+    }
+}
+"""
+QUERY_SHOP_HASH = hashlib.sha256(QUERY_SHOP.encode("utf-8")).hexdigest()
+
+
+@pytest.fixture(autouse=True)
+def clear_persisted_queries():
+    _persisted_documents.clear()
+    cache.delete(generate_persisted_query_cache_key(QUERY_SHOP_HASH))
+    yield
+    _persisted_documents.clear()
+
+
+def _persisted_query_data(query_hash, query=None):
+    data = {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}}
+    if query:
+        data["query"] = query
+    return data
+
+
+def test_persisted_query_not_found(api_client):
+    # when
+    response = api_client.post(_persisted_query_data(QUERY_SHOP_HASH))
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert response.status_code == 400
+    assert content["errors"][0]["message"] == "PersistedQueryNotFound"
+    assert (
+        content["errors"][0]["extensions"]["exception"]["code"]
+        == "PersistedQueryNotFound"
+    )
+
+
+def test_persisted_query_registered_and_executed_by_hash(api_client, site_settings):
+    # given
+    response = api_client.post(_persisted_query_data(QUERY_SHOP_HASH, QUERY_SHOP))
+    expected_data = get_graphql_content(response)["data"]
+    _persisted_documents.clear()
+
+    # when
+    with mock.patch("saleor.graphql.persisted_queries.parse") as parse_mock:
+        response = api_client.post(_persisted_query_data(QUERY_SHOP_HASH))
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"] == expected_data
+    parse_mock.assert_not_called()
+
+
+def test_persisted_query_hash_mismatch(api_client):
+    # when
+    response = api_client.post(_persisted_query_data("invalid-hash", QUERY_SHOP))
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert response.status_code == 400
+    assert (
+        content["errors"][0]["message"]
+        == "Provided sha256Hash does not match the query."
+    )
+    assert load_persisted_document(schema, QUERY_SHOP_HASH) is None
+
+
+def test_persisted_query_with_validation_errors_is_not_stored(api_client):
+    # given
+    query = "query { shop { invalidField } }"
+    query_hash = hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+    # when
+    response = api_client.post(_persisted_query_data(query_hash, query))
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert response.status_code == 400
+    assert content["errors"]
+    assert load_persisted_document(schema, query_hash) is None
+
+
+def test_persisted_queries_disabled(api_client, settings):
+    # given
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = False
+
+    # when
+    response = api_client.post(_persisted_query_data(QUERY_SHOP_HASH, QUERY_SHOP))
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "PersistedQueryNotSupported"
+
+
+def test_warm_up_persisted_queries():
+    # when
+    stored = warm_up_persisted_queries(
+        schema, [QUERY_SHOP, "query { shop { invalidField } }"]
+    )
+
+    # then
+    assert stored == 1
+    _persisted_documents.clear()
+    document = load_persisted_document(schema, QUERY_SHOP_HASH)
+    assert document.document_string == QUERY_SHOP
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        {"extensions": None},
+        {"extensions": {"persistedQuery": {"version": 2, "sha256Hash": "abc"}}},
+        {"extensions": {"persistedQuery": {"version": 1}}},
+    ],
+)
+def test_get_persisted_query_hash_missing(data):
+    assert get_persisted_query_hash(data) is None
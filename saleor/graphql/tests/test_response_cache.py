@@ -0,0 +1,133 @@
+import graphene
+import pytest
+
+from ...plugins.manager import get_plugins_manager
+from ..api import backend, schema
+from ..response_cache import (
+    generate_response_cache_key,
+    invalidate_response_cache,
+    is_response_cacheable,
+)
+from .utils import get_graphql_content
+
+QUERY_PRODUCT = """
+query Product($id: ID!, $channel: String) {
+    product(id: $id, channel: $channel) {
+        name
+    }
+}
+"""
+
+
+@pytest.fixture
+def response_cache_enabled(settings):
+    settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT = 60
+    invalidate_response_cache()
+
+
+def test_anonymous_query_response_is_cached(
+    response_cache_enabled, api_client, product, channel_USD
+):
+    # given
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+    api_client.post_graphql(QUERY_PRODUCT, variables)
+    old_name = product.name
+    product.name = "New name"
+    product.save(update_fields=["name"])
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCT, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["product"]["name"] == old_name
+
+
+def test_cached_response_invalidated_by_product_updated_event(
+    response_cache_enabled, api_client, product, channel_USD
+):
+    # given
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+    api_client.post_graphql(QUERY_PRODUCT, variables)
+    product.name = "New name"
+    product.save(update_fields=["name"])
+
+    # when
+    get_plugins_manager(allow_replica=False).product_updated(product)
+    response = api_client.post_graphql(QUERY_PRODUCT, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["product"]["name"] == "New name"
+
+
+def test_authenticated_query_response_is_not_cached(
+    response_cache_enabled, user_api_client, product, channel_USD
+):
+    # given
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+    user_api_client.post_graphql(QUERY_PRODUCT, variables)
+    product.name = "New name"
+    product.save(update_fields=["name"])
+
+    # when
+    response = user_api_client.post_graphql(QUERY_PRODUCT, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["product"]["name"] == "New name"
+
+
+@pytest.mark.parametrize(
+    ("query", "cacheable"),
+    [
+        (QUERY_PRODUCT, True),
+        ("query { checkout(id: 1) { id } }", False),
+        ("query { products(first: 1) { totalCount } shop { name } }", False),
+        ("mutation { tokenRefresh { token } }", False),
+    ],
+)
+def test_is_response_cacheable(response_cache_enabled, rf, query, cacheable):
+    # given
+    document = backend.document_from_string(schema, query)
+    request = rf.post("/graphql/")
+
+    # when
+    result = is_response_cacheable(request, document, None)
+
+    # then
+    assert result is cacheable
+
+
+def test_is_response_cacheable_disabled(settings, rf):
+    # given
+    settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT = 0
+    document = backend.document_from_string(schema, QUERY_PRODUCT)
+
+    # when
+    result = is_response_cacheable(rf.post("/graphql/"), document, None)
+
+    # then
+    assert result is False
+
+
+def test_generate_response_cache_key_changes_after_invalidation():
+    # given
+    key = generate_response_cache_key("query:Product:hash", "Product", {"a": 1})
+
+    # when
+    invalidate_response_cache()
+
+    # then
+    assert generate_response_cache_key("query:Product:hash", "Product", {"a": 1}) != (
+        key
+    )
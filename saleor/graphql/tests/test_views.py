@@ -0,0 +1,58 @@
+import threading
+from unittest.mock import patch
+
+from django.db import connections
+from django.http import JsonResponse
+
+from ...core.db.connection import log_writer_usage, writer
+from ..api import backend, schema
+from ..views import AsyncGraphQLView
+
+
+async def test_async_graphql_view_executes_request_in_executor(rf):
+    # given
+    handled_in_threads = []
+
+    def handle_query(request):
+        handled_in_threads.append(threading.current_thread().name)
+        return JsonResponse(data={"data": {"__typename": "Query"}})
+
+    request = rf.post(
+        path="/graphql/",
+        data={"query": "{ __typename }"},
+        content_type="application/json",
+    )
+    view = AsyncGraphQLView.as_view(backend=backend, schema=schema)
+
+    # when
+    with patch.object(AsyncGraphQLView, "handle_query", side_effect=handle_query):
+        response = await view(request)
+
+    # then
+    assert response.status_code == 200
+    assert len(handled_in_threads) == 1
+    assert handled_in_threads[0].startswith("graphql")
+
+
+async def test_async_graphql_view_logs_writer_usage_in_executor(rf):
+    # given
+    execute_wrappers = []
+
+    def handle_query(request):
+        execute_wrappers.extend(connections[writer].execute_wrappers)
+        return JsonResponse(data={"data": {"__typename": "Query"}})
+
+    request = rf.post(
+        path="/graphql/",
+        data={"query": "{ __typename }"},
+        content_type="application/json",
+    )
+    request.log_writer_usage = True
+    view = AsyncGraphQLView.as_view(backend=backend, schema=schema)
+
+    # when
+    with patch.object(AsyncGraphQLView, "handle_query", side_effect=handle_query):
+        await view(request)
+
+    # then
+    assert log_writer_usage in execute_wrappers
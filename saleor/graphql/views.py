@@ -1,12 +1,16 @@
+import functools
 import hashlib
 import importlib
 import json
+from concurrent.futures import ThreadPoolExecutor
 from inspect import isclass
 from typing import Any
 from urllib.parse import urljoin
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.core.cache import cache
+from django.db import close_old_connections
 from django.http import HttpRequest, HttpResponseNotAllowed, JsonResponse
 from django.shortcuts import render
 from django.views.generic import View
@@ -28,6 +32,7 @@ from opentelemetry.trace import StatusCode
 from requests_hardened.ip_filter import InvalidIPAddress
 
 from .. import __version__ as saleor_version
+from ..core.db.connection import log_writer_usage_for_request
 from ..core.exceptions import PermissionDenied
 from ..core.telemetry import Scope, SpanKind, saleor_attributes, tracer
 from ..webhook import observability
@@ -41,7 +46,15 @@ from .metrics import (
     record_request_count,
     record_request_duration,
 )
+from .persisted_queries import (
+    PersistedQueryNotFound,
+    PersistedQueryNotSupported,
+    get_persisted_query_hash,
+    load_persisted_document,
+    persist_document,
+)
 from .query_cost_map import COST_MAP, QUERY_COST_FAILED_OPERATION
+from .response_cache import generate_response_cache_key, is_response_cacheable
 from .utils import (
     format_error,
     get_source_service_name_value,
@@ -263,6 +276,31 @@ class GraphQLView(View):
         except (ValueError, GraphQLSyntaxError) as e:
             return None, ExecutionResult(errors=[e], invalid=True)
 
+    def parse_persisted_query(
+        self, query: str | None, query_hash: str
+    ) -> tuple[GraphQLDocument | None, ExecutionResult | None]:
+        """Return the persisted document for the given hash.
+
+        When the query is sent along with the hash, it is validated and stored so
+        that subsequent requests may send only the hash.
+        """
+        if not settings.GRAPHQL_PERSISTED_QUERIES_ENABLED:
+            return None, ExecutionResult(
+                errors=[PersistedQueryNotSupported()], invalid=True
+            )
+        if query and not isinstance(query, str):
+            return self.parse_query(query)
+
+        try:
+            if query:
+                return persist_document(self.schema, query, query_hash), None
+            document = load_persisted_document(self.schema, query_hash)
+            if document is None:
+                raise PersistedQueryNotFound()
+            return document, None
+        except (ValueError, GraphQLError) as e:
+            return None, ExecutionResult(errors=[e], invalid=True)
+
     def execute_graphql_request(self, request: HttpRequest, data: dict):
         with (
             tracer.start_as_current_span(
@@ -274,7 +312,10 @@ class GraphQLView(View):
             span.set_attribute(saleor_attributes.COMPONENT, "graphql")
 
             query, variables, operation_name = self.get_graphql_params(request, data)
-            document, error = self.parse_query(query)
+            if query_hash := get_persisted_query_hash(data):
+                document, error = self.parse_persisted_query(query, query_hash)
+            else:
+                document, error = self.parse_query(query)
 
             with observability.report_gql_operation() as operation:
                 operation.query = document
@@ -356,6 +397,7 @@ class GraphQLView(View):
                 variables,
                 COST_MAP,
                 settings.GRAPHQL_QUERY_MAX_COMPLEXITY,
+                fingerprint=operation_fingerprint,
             )
             span.set_attribute(saleor_attributes.GRAPHQL_OPERATION_COST, query_cost)
 
@@ -396,6 +438,15 @@ class GraphQLView(View):
                 if should_use_cache_for_scheme:
                     key = generate_cache_key(raw_query_string)
                     response = cache.get(key)
+                should_use_response_cache = (
+                    not query_contains_schema
+                    and is_response_cacheable(request, document, operation_name)
+                )
+                if should_use_response_cache:
+                    response_cache_key = generate_response_cache_key(
+                        operation_fingerprint, operation_name, variables
+                    )
+                    response = cache.get(response_cache_key)
 
                 if not response:
                     response = document.execute(
@@ -415,6 +466,12 @@ class GraphQLView(View):
 
                     if should_use_cache_for_scheme:
                         cache.set(key, response)
+                    if should_use_response_cache and not response.errors:
+                        cache.set(
+                            response_cache_key,
+                            response,
+                            timeout=settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT,
+                        )
 
                 record_graphql_query_count(
                     operation_type=operation_type,
@@ -494,6 +551,46 @@ class GraphQLView(View):
         return None
 
 
+@functools.cache
+def get_graphql_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=settings.GRAPHQL_EXECUTOR_THREADS, thread_name_prefix="graphql"
+    )
+
+
+class AsyncGraphQLView(GraphQLView):
+    """GraphQL view for ASGI servers.
+
+    Resolvers use the database and call sync webhooks synchronously, so requests are
+    executed in a shared pool of at most `GRAPHQL_EXECUTOR_THREADS` threads. The
+    event loop only waits for the result, and the threads are reused between
+    requests instead of starting a new thread for each one. Requests above the
+    limit wait for a free thread, so it should stay above the expected number of
+    concurrent requests; lowering it caps the number of database connections.
+    """
+
+    view_is_async = True
+
+    async def dispatch(self, request, *args, **kwargs):
+        return await sync_to_async(
+            self._dispatch_in_executor,
+            thread_sensitive=False,
+            executor=get_graphql_executor(),
+        )(request, *args, **kwargs)
+
+    def _dispatch_in_executor(self, request, *args, **kwargs):
+        # Django closes stale connections only in the threads that handle the
+        # request signals, so it has to be done for the executor threads here.
+        close_old_connections()
+        try:
+            # Database connections, and their execute wrappers installed by
+            # middlewares, are thread-local.
+            with log_writer_usage_for_request(request):
+                return super().dispatch(request, *args, **kwargs)
+        finally:
+            close_old_connections()
+
+
 def get_key(key):
     try:
         int_key = int(key)
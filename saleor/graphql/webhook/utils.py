@@ -1,6 +1,11 @@
+import functools
 import hashlib
 import logging
 
+from graphql import parse
+from graphql.error import GraphQLError
+from graphql.language.printer import print_ast
+
 from ...webhook.models import Webhook
 
 logger = logging.getLogger(__name__)
@@ -10,6 +15,19 @@ def get_subscription_query_hash(subscription_query: str) -> str:
     return hashlib.md5(subscription_query.encode("utf-8")).hexdigest()
 
 
+@functools.lru_cache(maxsize=1024)
+def get_normalized_subscription_query_hash(subscription_query: str) -> str:
+    """Return a hash of the subscription query that ignores formatting differences.
+
+    Queries that differ only by whitespace, commas or comments share the same hash.
+    """
+    try:
+        normalized_query = print_ast(parse(subscription_query))
+    except GraphQLError:
+        normalized_query = subscription_query
+    return get_subscription_query_hash(normalized_query)
+
+
 def get_pregenerated_subscription_payload(
     webhook: Webhook,
     pregenerated_subscription_payloads: dict | None = None,
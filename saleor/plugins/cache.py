@@ -0,0 +1,130 @@
+"""Process-level cache of plugin configurations.
+
+Every `PluginsManager` instance needs the plugin configurations of the global
+scope and of each channel it touches. They change rarely, so rows fetched from
+the database are kept in process memory and shared between managers.
+
+Entries are tagged with a shared version stored in the Django cache, which is
+replaced once a transaction saving or deleting a `PluginConfiguration` or a
+`Channel` is committed; the version is read once per manager. Entries also expire after
+`PLUGIN_CONFIGURATIONS_CACHE_TIMEOUT` seconds to bound staleness caused by
+writes that bypass model signals, like `QuerySet.update`.
+"""
+
+import copy
+import functools
+import time
+import uuid
+from typing import TYPE_CHECKING, NamedTuple
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Model
+from django.utils.module_loading import import_string
+
+from ..channel.models import Channel
+from .models import PluginConfiguration
+
+if TYPE_CHECKING:
+    from .base_plugin import BasePlugin
+
+PLUGIN_CONFIGURATIONS_VERSION_KEY = "plugin-configurations-version"
+PLUGIN_CONFIGURATIONS_CACHE_TIMEOUT = 60
+
+
+class CachedPluginConfigurations(NamedTuple):
+    version: str
+    expires_at: float
+    channel_values: tuple | None
+    configurations_values: list[tuple]
+
+
+_cached_configurations: dict[str | None, CachedPluginConfigurations] = {}
+
+
+@functools.cache
+def import_plugin_class(plugin_path: str) -> type["BasePlugin"]:
+    return import_string(plugin_path)
+
+
+def get_plugin_configurations_version() -> str:
+    version = cache.get(PLUGIN_CONFIGURATIONS_VERSION_KEY)
+    if version is None:
+        cache.add(PLUGIN_CONFIGURATIONS_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(PLUGIN_CONFIGURATIONS_VERSION_KEY)
+    return version
+
+
+def invalidate_plugin_configurations(using=None, **_kwargs):
+    """Drop cached plugin configurations in every process after commit.
+
+    Used as a receiver of model signals, hence the keyword arguments. Bumping the
+    version before commit would let other processes cache the old rows again
+    under the new version.
+    """
+    transaction.on_commit(_bump_plugin_configurations_version, using=using)
+
+
+def _bump_plugin_configurations_version():
+    cache.set(PLUGIN_CONFIGURATIONS_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+    clear_plugin_configurations_cache()
+
+
+def clear_plugin_configurations_cache():
+    """Drop cached plugin configurations in the current process only."""
+    _cached_configurations.clear()
+
+
+def _get_values(instance: Model) -> tuple:
+    return tuple(
+        getattr(instance, field.attname) for field in instance._meta.concrete_fields
+    )
+
+
+def _from_values(model: type[Model], database: str, values: tuple):
+    field_names = [field.attname for field in model._meta.concrete_fields]
+    return model.from_db(database, field_names, copy.deepcopy(values))
+
+
+def get_plugin_configurations(
+    channel_slug: str | None,
+    *,
+    version: str,
+    database: str,
+    channel: Channel | None = None,
+) -> tuple[Channel | None, dict[str, PluginConfiguration]] | None:
+    """Return the channel and its plugin configurations mapped by identifier.
+
+    Global configurations are returned when `channel_slug` is `None`. Returns
+    `None` when the channel does not exist. Instances are built from cached
+    values on every call, so callers are free to modify them.
+    """
+    entry = _cached_configurations.get(channel_slug)
+    if entry is None or entry.version != version or entry.expires_at < time.monotonic():
+        if channel_slug is not None and channel is None:
+            channel = Channel.objects.using(database).filter(slug=channel_slug).first()
+            if channel is None:
+                return None
+        configurations = PluginConfiguration.objects.using(database).filter(
+            channel=channel
+        )
+        entry = CachedPluginConfigurations(
+            version=version,
+            expires_at=time.monotonic() + PLUGIN_CONFIGURATIONS_CACHE_TIMEOUT,
+            channel_values=_get_values(channel) if channel is not None else None,
+            configurations_values=[
+                _get_values(configuration)
+                for configuration in configurations.iterator(chunk_size=1000)
+            ],
+        )
+        _cached_configurations[channel_slug] = entry
+
+    if channel is None and entry.channel_values is not None:
+        channel = _from_values(Channel, database, entry.channel_values)
+    configs = {}
+    for values in entry.configurations_values:
+        configuration = _from_values(PluginConfiguration, database, values)
+        if channel is not None:
+            configuration.channel = channel
+        configs[configuration.identifier] = configuration
+    return channel, configs
@@ -1,3 +1,4 @@
+import time
 from collections import defaultdict
 from collections.abc import Callable, Iterable
 from decimal import Decimal
@@ -5,7 +6,6 @@ from typing import TYPE_CHECKING, Any, Optional, Union
 
 from django.conf import settings
 from django.http import HttpResponse, HttpResponseNotFound
-from django.utils.module_loading import import_string
 from prices import TaxedMoney
 
 from ..channel.models import Channel
@@ -17,6 +17,11 @@ from ..core.prices import quantize_price
 from ..core.taxes import TaxData, TaxDataError, TaxType, zero_money, zero_taxed_money
 from ..core.telemetry import tracer
 from ..graphql.core import SaleorContext
+from ..graphql.response_cache import (
+    RESPONSE_CACHE_INVALIDATING_EVENTS,
+    invalidate_response_cache,
+    is_response_cache_enabled,
+)
 from ..order import base_calculations as base_order_calculations
 from ..order.base_calculations import (
     base_order_line_total,
@@ -50,6 +55,12 @@ from ..payment.interface import (
 )
 from ..tax.utils import calculate_tax_rate
 from .base_plugin import ExcludedShippingMethod, ExternalAccessTokens
+from .cache import (
+    get_plugin_configurations,
+    get_plugin_configurations_version,
+    import_plugin_class,
+)
+from .metrics import record_plugin_method_duration
 from .models import PluginConfiguration
 
 if TYPE_CHECKING:
@@ -140,6 +151,8 @@ class PluginsManager(PaymentInterface):
             self.loaded_channels: set[str] = set()
             self.loaded_global = False
             self.requestor_getter = requestor_getter
+            self._configurations_version: str | None = None
+            self._plugins_by_method: dict[tuple[str | None, str], list[BasePlugin]] = {}
 
     def __del__(self) -> None:
         # remove references to plugins
@@ -148,16 +161,17 @@ class PluginsManager(PaymentInterface):
         for c in self.plugins_per_channel.values():
             c.clear()
         self.loaded_channels.clear()
+        self._plugins_by_method.clear()
 
     def _ensure_channel_plugins_loaded(
         self, channel_slug: str | None, channel: Channel | None = None
     ):
         if channel_slug is None and not self.loaded_global:
-            global_db_config = self._get_db_plugin_configs(None)
+            _, global_db_config = self._get_db_plugin_configs(None)
 
             for plugin_path in self.plugins:
                 with tracer.start_as_current_span(f"{plugin_path}"):
-                    PluginClass = import_string(plugin_path)
+                    PluginClass = import_plugin_class(plugin_path)
                     if not getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False):
                         plugin = self._load_plugin(
                             PluginClass,
@@ -170,20 +184,14 @@ class PluginsManager(PaymentInterface):
             self.loaded_global = True
 
         if channel_slug is not None and channel_slug not in self.loaded_channels:
-            if channel is None:
-                channel = (
-                    Channel.objects.using(self.database)
-                    .filter(slug=channel_slug)
-                    .first()
-                )
-                if not channel:
-                    return
-
-            channel_db_config = self._get_db_plugin_configs(channel)
+            loaded = self._get_db_plugin_configs(channel_slug, channel=channel)
+            if loaded is None:
+                return
+            channel, channel_db_config = loaded
 
             for plugin_path in self.plugins:
                 with tracer.start_as_current_span(f"{plugin_path}"):
-                    PluginClass = import_string(plugin_path)
+                    PluginClass = import_plugin_class(plugin_path)
                     if getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False):
                         plugin = self._load_plugin(
                             PluginClass,
@@ -198,16 +206,21 @@ class PluginsManager(PaymentInterface):
             self._ensure_channel_plugins_loaded(None)
             self.plugins_per_channel[channel_slug].extend(self.global_plugins)
             self.loaded_channels.add(channel_slug)
+            # Plugins of the new channel are part of the global plugin list.
+            self._plugins_by_method.clear()
 
-    def _get_db_plugin_configs(self, channel: Channel | None):
+    def _get_db_plugin_configs(
+        self, channel_slug: str | None, channel: Channel | None = None
+    ):
         with tracer.start_as_current_span("_get_db_plugin_configs"):
-            plugin_manager_configs = PluginConfiguration.objects.using(
-                self.database
-            ).filter(channel=channel)
-            configs = {}
-            for db_plugin_config in plugin_manager_configs.iterator(chunk_size=1000):
-                configs[db_plugin_config.identifier] = db_plugin_config
-            return configs
+            if self._configurations_version is None:
+                self._configurations_version = get_plugin_configurations_version()
+            return get_plugin_configurations(
+                channel_slug,
+                version=self._configurations_version,
+                database=self.database,
+                channel=channel,
+            )
 
     def __run_method_on_plugins(
         self,
@@ -219,11 +232,14 @@ class PluginsManager(PaymentInterface):
         **kwargs,
     ):
         """Try to run a method with the given name on each declared active plugin."""
+        if (
+            method_name in RESPONSE_CACHE_INVALIDATING_EVENTS
+            and is_response_cache_enabled()
+        ):
+            invalidate_response_cache()
         value = default_value
-        plugins = self.get_plugins(
-            channel_slug=channel_slug,
-            active_only=True,
-            plugin_ids=plugin_ids,
+        plugins = self._get_plugins_implementing(
+            method_name, channel_slug=channel_slug, plugin_ids=plugin_ids
         )
         for plugin in plugins:
             value = self.__run_method_on_single_plugin(
@@ -231,6 +247,32 @@ class PluginsManager(PaymentInterface):
             )
         return value
 
+    def _get_plugins_implementing(
+        self,
+        method_name: str,
+        *,
+        channel_slug: str | None,
+        plugin_ids: list[str] | None = None,
+    ) -> list["BasePlugin"]:
+        """Return active plugins that implement the given method.
+
+        Plugins implementing each method are looked up once per channel; the
+        table is rebuilt when plugins of another channel are loaded.
+        """
+        key = (channel_slug, method_name)
+        plugins = self._plugins_by_method.get(key)
+        if plugins is None:
+            plugins = [
+                plugin
+                for plugin in self.get_plugins(channel_slug=channel_slug)
+                if hasattr(type(plugin), method_name)
+            ]
+            self._plugins_by_method[key] = plugins
+        plugins = [plugin for plugin in plugins if plugin.active]
+        if plugin_ids:
+            plugins = [plugin for plugin in plugins if plugin.PLUGIN_ID in plugin_ids]
+        return plugins
+
     def __run_method_on_single_plugin(
         self,
         plugin: Optional["BasePlugin"],
@@ -250,7 +292,15 @@ class PluginsManager(PaymentInterface):
             return previous_value
         if not callable(plugin_method):
             raise ValueError(f"Method {method_name} is not callable")
-        returned_value = plugin_method(*args, **kwargs, previous_value=previous_value)
+        start = time.monotonic_ns()
+        try:
+            returned_value = plugin_method(
+                *args, **kwargs, previous_value=previous_value
+            )
+        finally:
+            record_plugin_method_duration(
+                plugin.PLUGIN_ID, method_name, time.monotonic_ns() - start
+            )
         if returned_value == NotImplemented:
             return previous_value
         return returned_value
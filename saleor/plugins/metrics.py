@@ -0,0 +1,23 @@
+from ..core.telemetry import DEFAULT_DURATION_BUCKETS, MetricType, Scope, Unit, meter
+
+# Initialize metrics
+METRIC_PLUGIN_METHOD_DURATION = meter.create_metric(
+    "saleor.plugins.method.duration",
+    scope=Scope.CORE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.SECOND,
+    description="Duration of plugin method calls.",
+    bucket_boundaries=DEFAULT_DURATION_BUCKETS,
+)
+
+
+def record_plugin_method_duration(
+    plugin_id: str, method_name: str, duration: int
+) -> None:
+    attributes = {"plugin.id": plugin_id, "plugin.method": method_name}
+    meter.record(
+        METRIC_PLUGIN_METHOD_DURATION,
+        duration,
+        unit=Unit.NANOSECOND,
+        attributes=attributes,
+    )
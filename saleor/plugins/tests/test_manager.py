@@ -13,6 +13,7 @@ from ...channel import TransactionFlowStrategy
 from ...checkout.fetch import fetch_checkout_info, fetch_checkout_lines
 from ...core.prices import quantize_price
 from ...core.taxes import TaxType, zero_money, zero_taxed_money
+from ...core.telemetry import Scope
 from ...graphql.discount.utils import convert_migrated_sale_predicate_to_catalogue_info
 from ...payment import TokenizedPaymentFlow
 from ...payment.interface import (
@@ -35,8 +36,11 @@ from ...payment.interface import (
 )
 from ...product.models import Product
 from ...shipping.interface import ShippingMethodData
+from ...tests.utils import get_metric_data_point
 from ..base_plugin import ExternalAccessTokens
+from ..cache import get_plugin_configurations_version
 from ..manager import PluginsManager, get_plugins_manager
+from ..metrics import METRIC_PLUGIN_METHOD_DURATION
 from ..models import PluginConfiguration
 from ..tests.sample_plugins import (
     ACTIVE_PLUGINS,
@@ -955,7 +959,7 @@ def test_run_method_on_plugins_only_on_active_ones(
     mocked_method, channel_USD, all_plugins_manager
 ):
     all_plugins_manager._PluginsManager__run_method_on_plugins(
-        method_name="test_method_name",
+        method_name="token_is_required_as_payment_input",
         default_value="default_value",
         channel_slug=channel_USD.slug,
     )
@@ -1002,7 +1006,7 @@ def test_run_method_on_plugins_only_for_given_channel(
 
     # when
     plugins_manager._PluginsManager__run_method_on_plugins(
-        method_name="test_method",
+        method_name="token_is_required_as_payment_input",
         default_value=default_value,
         channel_slug=channel_USD.slug,
     )
@@ -1015,6 +1019,74 @@ def test_run_method_on_plugins_only_for_given_channel(
     assert called_plugins_id == {usd_plugin_1.PLUGIN_ID, usd_plugin_2.PLUGIN_ID}
 
 
+@mock.patch(
+    "saleor.plugins.manager.PluginsManager._PluginsManager__run_method_on_single_plugin"
+)
+def test_run_method_on_plugins_skips_plugins_not_implementing_method(
+    mocked_run_on_single_plugin, channel_USD, all_plugins_manager
+):
+    # when
+    all_plugins_manager._PluginsManager__run_method_on_plugins(
+        method_name="process_payment",
+        default_value=None,
+        channel_slug=channel_USD.slug,
+    )
+
+    # then
+    called_plugins_id = {
+        arg.args[0].PLUGIN_ID for arg in mocked_run_on_single_plugin.call_args_list
+    }
+    assert called_plugins_id == {
+        ActivePaymentGateway.PLUGIN_ID,
+        ActiveDummyPaymentGateway.PLUGIN_ID,
+    }
+
+
+def test_run_method_on_plugins_dispatch_table_reused(channel_USD, all_plugins_manager):
+    # given
+    all_plugins_manager._PluginsManager__run_method_on_plugins(
+        method_name="get_supported_currencies",
+        default_value=None,
+        channel_slug=channel_USD.slug,
+    )
+
+    # when
+    with mock.patch.object(all_plugins_manager, "get_plugins") as mocked_get_plugins:
+        value = all_plugins_manager._PluginsManager__run_method_on_plugins(
+            method_name="get_supported_currencies",
+            default_value=None,
+            channel_slug=channel_USD.slug,
+        )
+
+    # then
+    mocked_get_plugins.assert_not_called()
+    assert value == ActiveDummyPaymentGateway.SUPPORTED_CURRENCIES
+
+
+def test_run_method_on_plugins_records_duration(channel_USD, get_test_metrics_data):
+    # given
+    manager = PluginsManager(
+        plugins=["saleor.plugins.tests.sample_plugins.ActivePaymentGateway"]
+    )
+
+    # when
+    manager._PluginsManager__run_method_on_plugins(
+        method_name="get_supported_currencies",
+        default_value=None,
+        channel_slug=channel_USD.slug,
+    )
+
+    # then
+    data_point = get_metric_data_point(
+        get_test_metrics_data(), METRIC_PLUGIN_METHOD_DURATION, scope=Scope.CORE
+    )
+    assert data_point.count == 1
+    assert data_point.attributes == {
+        "plugin.id": ActivePaymentGateway.PLUGIN_ID,
+        "plugin.method": "get_supported_currencies",
+    }
+
+
 def test_run_method_on_single_plugin_method_does_not_exist(plugins_manager):
     default_value = "default_value"
     method_name = "method_does_not_exist"
@@ -1553,6 +1625,72 @@ def test_loaded_all_channels(channel_USD, channel_PLN, django_assert_num_queries
         assert plugins
 
 
+def test_plugin_configurations_cached_between_managers(
+    channel_USD, django_assert_num_queries
+):
+    # given
+    plugins = [
+        "saleor.plugins.tests.sample_plugins.ChannelPluginSample",
+        "saleor.plugins.tests.sample_plugins.PluginSample",
+    ]
+    PluginsManager(plugins=plugins).get_plugins(channel_slug=channel_USD.slug)
+    manager = PluginsManager(plugins=plugins)
+
+    # when
+    with django_assert_num_queries(0):
+        plugins = manager.get_plugins(channel_slug=channel_USD.slug)
+
+    # then
+    assert len(plugins) == 2
+    channel_plugin = next(plugin for plugin in plugins if plugin.channel)
+    assert channel_plugin.channel == channel_USD
+
+
+def test_plugin_configurations_cache_invalidated_on_configuration_save(
+    channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    plugin_path = "saleor.plugins.tests.sample_plugins.ChannelPluginSample"
+    PluginsManager(plugins=[plugin_path]).get_plugins(channel_slug=channel_USD.slug)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        PluginConfiguration.objects.create(
+            identifier=ChannelPluginSample.PLUGIN_ID,
+            channel=channel_USD,
+            active=False,
+            configuration=[],
+        )
+    plugins = PluginsManager(plugins=[plugin_path]).get_plugins(
+        channel_slug=channel_USD.slug
+    )
+
+    # then
+    assert len(plugins) == 1
+    assert plugins[0].active is False
+    assert plugins[0].db_config is not None
+
+
+def test_plugin_configurations_cache_not_invalidated_before_commit(
+    channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    version = get_plugin_configurations_version()
+
+    # when
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        PluginConfiguration.objects.create(
+            identifier=ChannelPluginSample.PLUGIN_ID,
+            channel=channel_USD,
+            active=False,
+            configuration=[],
+        )
+
+    # then
+    assert get_plugin_configurations_version() == version
+    assert len(callbacks) == 1
+
+
 def test_get_plugin_invalid_channel():
     # given
     plugins = [
@@ -8,6 +8,24 @@ class ProductMediaTypes:
     ]
 
 
+class ProductSearchMode:
+    WEBSEARCH = "websearch"
+    FUZZY = "fuzzy"
+
+    CHOICES = [
+        (WEBSEARCH, "Full-text search supporting the web search syntax."),
+        (FUZZY, "Full-text search with prefix and typo-tolerant name matching."),
+    ]
+
+
+class ProductSearchVisibility:
+    """Set of products visible to the requestor, used to scope cached search ranks."""
+
+    ALL = "all"
+    CHANNEL = "channel"
+    PUBLISHED = "published"
+
+
 class ProductTypeKind:
     NORMAL = "normal"
     GIFT_CARD = "gift_card"
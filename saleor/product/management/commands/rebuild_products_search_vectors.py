@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from ...tasks import start_products_search_vector_rebuild
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the search vectors of all products in parallel Celery tasks. "
+        "An interrupted rebuild is resumed from its last checkpoint."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Discard the checkpoint of a previous rebuild and start over.",
+        )
+
+    def handle(self, *args, **options):
+        state = start_products_search_vector_rebuild(restart=options["restart"])
+        self.stdout.write(
+            f"Rebuilding search vectors of {state['total']} products, "
+            f"{state['dispatched']} already dispatched."
+        )
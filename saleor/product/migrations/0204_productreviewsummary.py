@@ -0,0 +1,70 @@
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Avg, Count, Q
+
+
+def populate_review_summaries(apps, _schema_editor):
+    ProductReview = apps.get_model("product", "ProductReview")
+    ProductReviewSummary = apps.get_model("product", "ProductReviewSummary")
+
+    aggregates = (
+        ProductReview.objects.filter(is_published=True)
+        .values("product_id")
+        .annotate(
+            review_count=Count("id"),
+            rating_avg=Avg("rating"),
+            **{
+                f"rating_{rating}_count": Count("id", filter=Q(rating=rating))
+                for rating in range(1, 6)
+            },
+        )
+    )
+    summaries = []
+    for aggregate in aggregates.iterator():
+        aggregate["rating_avg"] = Decimal(aggregate["rating_avg"]).quantize(
+            Decimal("0.01")
+        )
+        summaries.append(ProductReviewSummary(**aggregate))
+    ProductReviewSummary.objects.bulk_create(summaries, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("product", "0203_productreview"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductReviewSummary",
+            fields=[
+                (
+                    "product",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="review_summary",
+                        serialize=False,
+                        to="product.product",
+                    ),
+                ),
+                ("review_count", models.PositiveIntegerField(default=0)),
+                (
+                    "rating_avg",
+                    models.DecimalField(
+                        blank=True, decimal_places=2, max_digits=3, null=True
+                    ),
+                ),
+                ("rating_1_count", models.PositiveIntegerField(default=0)),
+                ("rating_2_count", models.PositiveIntegerField(default=0)),
+                ("rating_3_count", models.PositiveIntegerField(default=0)),
+                ("rating_4_count", models.PositiveIntegerField(default=0)),
+                ("rating_5_count", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(
+            populate_review_summaries, reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,24 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("product", "0204_productreviewsummary"),
+    ]
+
+    atomic = False
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="productreview",
+            options={"ordering": ["-created_at", "-pk"]},
+        ),
+        AddIndexConcurrently(
+            model_name="productreview",
+            index=models.Index(
+                fields=["is_published", "created_at"],
+                name="product_review_pub_created_idx",
+            ),
+        ),
+    ]
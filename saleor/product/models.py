@@ -832,11 +832,45 @@ class ProductReview(models.Model):
     image_2 = models.ImageField(upload_to="product_reviews/", null=True, blank=True)
 
     class Meta:
-        ordering = ["-created_at"]
+        ordering = ["-created_at", "-pk"]
         indexes = [
             models.Index(fields=["product", "is_published"]),
             models.Index(fields=["user"]),
+            models.Index(
+                fields=["is_published", "created_at"],
+                name="product_review_pub_created_idx",
+            ),
         ]
 
     def __str__(self):
         return f"Review for {self.product.name} by {self.user.email}"
+
+
+class ProductReviewSummary(models.Model):
+    """Агрегаты опубликованных отзывов товара.
+
+    Обновляются при создании и модерации отзывов, чтобы списки товаров могли
+    показывать рейтинг без обращения к таблице отзывов.
+    """
+
+    product = models.OneToOneField(
+        Product,
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name="review_summary",
+    )
+    review_count = models.PositiveIntegerField(default=0)
+    rating_avg = models.DecimalField(
+        max_digits=3, decimal_places=2, null=True, blank=True
+    )
+    rating_1_count = models.PositiveIntegerField(default=0)
+    rating_2_count = models.PositiveIntegerField(default=0)
+    rating_3_count = models.PositiveIntegerField(default=0)
+    rating_4_count = models.PositiveIntegerField(default=0)
+    rating_5_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def get_rating_histogram(self) -> dict[int, int]:
+        return {
+            rating: getattr(self, f"rating_{rating}_count") for rating in range(1, 6)
+        }
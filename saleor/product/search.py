@@ -1,17 +1,43 @@
+import hashlib
+import re
 from collections import defaultdict
 from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 from django.conf import settings
-from django.contrib.postgres.search import SearchQuery, SearchRank
-from django.db.models import F, Q, Value, prefetch_related_objects
-
-from ..attribute.models import AssignedProductAttributeValue, AttributeValue
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.core.cache import cache
+from django.db.models import (
+    Case,
+    Exists,
+    F,
+    FloatField,
+    OuterRef,
+    Q,
+    Value,
+    When,
+    prefetch_related_objects,
+)
+
+from .. import __version__ as saleor_version
+from ..attribute.models import (
+    AssignedProductAttributeValue,
+    AssignedVariantAttribute,
+    AssignedVariantAttributeValue,
+    Attribute,
+    AttributeProduct,
+    AttributeValue,
+)
 from ..attribute.search import get_search_vectors_for_attribute_values
 from ..core.postgres import FlatConcatSearchVector, NoValidationSearchVector
 from ..core.utils.batches import queryset_in_batches
 from ..page.models import Page
-from ..product.models import Product
+from ..product import ProductSearchMode
+from ..product.models import Product, ProductChannelListing, ProductVariant
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -25,54 +51,217 @@ PRODUCT_FIELDS_TO_PREFETCH = [
 ]
 
 PRODUCTS_BATCH_SIZE = 100
-# Setting threshold to 100 results in about 766.98MB of memory usage
-# when testing locally with multiple attributes of different types assigned to product
-# and product variants.
+# Batches are prepared from `.values()` rows, so memory usage depends on the number
+# of indexed values rather than on the size of the model instances.
+
+ATTRIBUTE_VALUE_SEARCH_FIELDS = [
+    "id",
+    "attribute_id",
+    "name",
+    "rich_text",
+    "plain_text",
+    "date_time",
+    "reference_page_id",
+]
 
 
-def _prep_product_search_vector_index(
-    products, page_id_to_title_map: dict[int, str] | None = None
-):
-    prefetch_related_objects(products, *PRODUCT_FIELDS_TO_PREFETCH)
+def update_products_search_vector(product_ids: Iterable[int]) -> int:
+    db_conn = settings.DATABASE_CONNECTION_REPLICA_NAME
+    product_ids = list(product_ids)
+    products = Product.objects.using(db_conn).filter(pk__in=product_ids)
+    updated_count = 0
+    for product_pks in queryset_in_batches(products, PRODUCTS_BATCH_SIZE):
+        updated_count += update_products_search_vector_batch(product_pks)
+    return updated_count
 
-    for product in products:
-        product.search_vector = FlatConcatSearchVector(
-            *prepare_product_search_vector_value(
-                product,
-                already_prefetched=True,
-                page_id_to_title_map=page_id_to_title_map,
-            )
+
+def update_products_search_vector_batch(product_pks: list[int]) -> int:
+    """Rebuild `search_vector` of the given products and return their number."""
+    db_conn = settings.DATABASE_CONNECTION_REPLICA_NAME
+    search_vectors = prepare_products_search_vector_values(product_pks, db_conn)
+    products = [
+        Product(
+            pk=product_pk,
+            search_vector=FlatConcatSearchVector(*vectors),
+            search_index_dirty=False,
         )
-        product.search_index_dirty = False
+        for product_pk, vectors in search_vectors.items()
+    ]
+    Product.objects.bulk_update(products, ["search_vector", "search_index_dirty"])
+    return len(products)
 
-    Product.objects.bulk_update(
-        products, ["search_vector", "updated_at", "search_index_dirty"]
-    )
 
+def prepare_products_search_vector_values(
+    product_pks: list[int], db_conn: str
+) -> dict[int, list[NoValidationSearchVector]]:
+    """Prepare `search_vector` values for a batch of products.
 
-def update_products_search_vector(product_ids: Iterable[int]):
-    db_conn = settings.DATABASE_CONNECTION_REPLICA_NAME
-    product_ids = list(product_ids)
-    products = Product.objects.using(db_conn).filter(pk__in=product_ids).order_by("pk")
-    for product_pks in queryset_in_batches(products, PRODUCTS_BATCH_SIZE):
-        value_ids = (
-            AssignedProductAttributeValue.objects.using(db_conn)
-            .filter(product_id__in=product_pks)
-            .values_list("value_id", flat=True)
+    Produces the same vectors as `prepare_product_search_vector_value`, but fetches
+    only the indexed columns with a fixed number of queries instead of prefetching
+    model instances.
+    """
+    products = list(
+        Product.objects.using(db_conn)
+        .filter(pk__in=product_pks)
+        .values_list("id", "name", "description_plaintext", "product_type_id")
+    )
+
+    type_attribute_ids: dict[int, list[int]] = defaultdict(list)
+    for product_type_id, attribute_id in (
+        AttributeProduct.objects.using(db_conn)
+        .filter(product_type_id__in={product[3] for product in products})
+        .order_by("sort_order", "pk")
+        .values_list("product_type_id", "attribute_id")
+    ):
+        type_attribute_ids[product_type_id].append(attribute_id)
+
+    product_value_ids: dict[int, list[int]] = defaultdict(list)
+    for product_id, value_id in (
+        AssignedProductAttributeValue.objects.using(db_conn)
+        .filter(product_id__in=product_pks)
+        .order_by("sort_order", "pk")
+        .values_list("product_id", "value_id")
+    ):
+        product_value_ids[product_id].append(value_id)
+
+    product_variants: dict[int, list[tuple[int, str | None, str]]] = defaultdict(list)
+    for variant_id, product_id, sku, name in (
+        ProductVariant.objects.using(db_conn)
+        .filter(product_id__in=product_pks)
+        .order_by("sort_order", "sku")
+        .values_list("id", "product_id", "sku", "name")
+    ):
+        variants = product_variants[product_id]
+        if len(variants) < settings.PRODUCT_MAX_INDEXED_VARIANTS:
+            variants.append((variant_id, sku, name))
+
+    variant_assignments: dict[int, list[tuple[int, int]]] = defaultdict(list)
+    for assignment_id, variant_id, attribute_id in (
+        AssignedVariantAttribute.objects.using(db_conn)
+        .filter(
+            variant_id__in=[
+                variant[0]
+                for variants in product_variants.values()
+                for variant in variants
+            ]
         )
-        value_to_page_id = (
-            AttributeValue.objects.using(db_conn)
-            .filter(id__in=value_ids, reference_page_id__isnull=False)
-            .values_list("id", "reference_page_id")
+        .order_by("pk")
+        .values_list("id", "variant_id", "assignment__attribute_id")
+    ):
+        assignments = variant_assignments[variant_id]
+        if len(assignments) < settings.PRODUCT_MAX_INDEXED_ATTRIBUTES:
+            assignments.append((assignment_id, attribute_id))
+
+    assignment_value_ids: dict[int, list[int]] = defaultdict(list)
+    for assignment_id, value_id in (
+        AssignedVariantAttributeValue.objects.using(db_conn)
+        .filter(
+            assignment_id__in=[
+                assignment[0]
+                for assignments in variant_assignments.values()
+                for assignment in assignments
+            ]
         )
-        page_id_to_title_map = dict(
-            Page.objects.using(db_conn)
-            .filter(id__in=[page_id for _, page_id in value_to_page_id])
-            .values_list("id", "title")
+        .order_by("value__sort_order", "value_id")
+        .values_list("assignment_id", "value_id")
+    ):
+        assignment_value_ids[assignment_id].append(value_id)
+
+    value_ids = {
+        value_id for value_ids in product_value_ids.values() for value_id in value_ids
+    }
+    value_ids.update(
+        value_id
+        for value_ids in assignment_value_ids.values()
+        for value_id in value_ids
+    )
+    values = {
+        row["id"]: AttributeValue(**row)
+        for row in AttributeValue.objects.using(db_conn)
+        .filter(id__in=value_ids)
+        .values(*ATTRIBUTE_VALUE_SEARCH_FIELDS)
+    }
+
+    attribute_ids = {
+        attribute_id
+        for attribute_ids in type_attribute_ids.values()
+        for attribute_id in attribute_ids
+    }
+    attribute_ids.update(
+        assignment[1]
+        for assignments in variant_assignments.values()
+        for assignment in assignments
+    )
+    attributes = {
+        row["id"]: Attribute(**row)
+        for row in Attribute.objects.using(db_conn)
+        .filter(id__in=attribute_ids)
+        .values("id", "input_type", "unit")
+    }
+
+    page_id_to_title_map = dict(
+        Page.objects.using(db_conn)
+        .filter(
+            id__in={
+                value.reference_page_id
+                for value in values.values()
+                if value.reference_page_id is not None
+            }
         )
+        .values_list("id", "title")
+    )
+
+    search_vectors = {}
+    for product_id, name, description_plaintext, product_type_id in products:
+        product_vectors = [
+            NoValidationSearchVector(Value(name), config="simple", weight="A"),
+            NoValidationSearchVector(
+                Value(description_plaintext), config="simple", weight="C"
+            ),
+        ]
+
+        values_map = defaultdict(list)
+        for value_id in product_value_ids[product_id]:
+            value = values[value_id]
+            values_map[value.attribute_id].append(value)
+        for attribute_id in type_attribute_ids[product_type_id][
+            : settings.PRODUCT_MAX_INDEXED_ATTRIBUTES
+        ]:
+            product_vectors += get_search_vectors_for_attribute_values(
+                attributes[attribute_id],
+                values_map[attribute_id][
+                    : settings.PRODUCT_MAX_INDEXED_ATTRIBUTE_VALUES
+                ],
+                page_id_to_title_map=page_id_to_title_map,
+                weight="B",
+            )
 
-        products_batch = list(Product.objects.using(db_conn).filter(id__in=product_pks))
-        _prep_product_search_vector_index(products_batch, page_id_to_title_map)
+        variants = product_variants[product_id]
+        variant_vectors = [
+            NoValidationSearchVector(
+                Value(sku), Value(name), config="simple", weight="A"
+            )
+            if sku
+            else NoValidationSearchVector(Value(name), config="simple", weight="A")
+            for _, sku, name in variants
+            if sku or name
+        ]
+        if variant_vectors:
+            for variant_id, _, _ in variants:
+                for assignment_id, attribute_id in variant_assignments[variant_id]:
+                    variant_vectors += get_search_vectors_for_attribute_values(
+                        attributes[attribute_id],
+                        [
+                            values[value_id]
+                            for value_id in assignment_value_ids[assignment_id][
+                                : settings.PRODUCT_MAX_INDEXED_ATTRIBUTE_VALUES
+                            ]
+                        ],
+                        page_id_to_title_map=page_id_to_title_map,
+                        weight="B",
+                    )
+        search_vectors[product_id] = product_vectors + variant_vectors
+    return search_vectors
 
 
 def prepare_product_search_vector_value(
@@ -173,11 +362,108 @@ def generate_attributes_search_vector_value_with_assignment(
     return search_vectors
 
 
-def search_products(qs, value):
-    if value:
-        query = SearchQuery(value, search_type="websearch", config="simple")
-        lookup = Q(search_vector=query)
-        qs = qs.filter(lookup).annotate(
-            search_rank=SearchRank(F("search_vector"), query)
+def search_products(
+    qs,
+    value,
+    *,
+    mode=ProductSearchMode.WEBSEARCH,
+    channel_slug: str | None = None,
+    visibility: str | None = None,
+):
+    if not value:
+        return qs
+    if mode == ProductSearchMode.FUZZY:
+        return search_products_fuzzy(
+            qs, value, channel_slug=channel_slug, visibility=visibility
+        )
+    query = SearchQuery(value, search_type="websearch", config="simple")
+    lookup = Q(search_vector=query)
+    return qs.filter(lookup).annotate(search_rank=SearchRank(F("search_vector"), query))
+
+
+def search_products_fuzzy(
+    qs, value: str, *, channel_slug: str | None = None, visibility: str | None = None
+):
+    """Search products matching the value by full text, prefixes or similar names.
+
+    Matching products are ranked by `get_product_search_ranks` and the result
+    is annotated with `search_rank`.
+    """
+    ranks = get_product_search_ranks(qs, value, channel_slug, visibility)
+    if not ranks:
+        return qs.none().annotate(search_rank=Value(0.0, output_field=FloatField()))
+    return qs.filter(pk__in=ranks.keys()).annotate(
+        search_rank=Case(
+            *[When(pk=pk, then=Value(rank)) for pk, rank in ranks.items()],
+            output_field=FloatField(),
+        )
+    )
+
+
+def get_product_search_ranks(
+    qs: "QuerySet[Product]",
+    value: str,
+    channel_slug: str | None = None,
+    visibility: str | None = None,
+) -> dict[int, float]:
+    """Return search ranks of the products from the queryset matching the value.
+
+    The candidates are products available in the given channel whose search
+    vector matches the value, or all of its words as prefixes, and products with
+    a name similar to the value, which uses the trigram index of product names.
+    Only the `PRODUCT_SEARCH_MAX_CANDIDATES` best ranked candidates are returned.
+
+    When `visibility` (one of `ProductSearchVisibility`) describes the products
+    of the queryset, results are cached per value, channel and visibility for
+    `PRODUCT_SEARCH_CACHE_TIMEOUT` seconds, which matches the fact that search
+    vectors themselves are updated in the background.
+    """
+    value = " ".join(value.split())
+    use_cache = bool(settings.PRODUCT_SEARCH_CACHE_TIMEOUT and visibility)
+    cache_key = _get_product_search_cache_key(value, channel_slug, visibility)
+    if use_cache:
+        cached_ranks = cache.get(cache_key)
+        if cached_ranks is not None:
+            return dict(cached_ranks)
+
+    query = SearchQuery(value, search_type="websearch", config="simple")
+    lookup = Q(search_vector=query) | Q(name__trigram_word_similar=value)
+    rank = SearchRank(F("search_vector"), query) + TrigramWordSimilarity(value, "name")
+    if prefix_query := _get_prefix_search_query(value):
+        lookup |= Q(search_vector=prefix_query)
+        rank += SearchRank(F("search_vector"), prefix_query)
+
+    candidates = qs.filter(lookup)
+    if channel_slug:
+        listings = ProductChannelListing.objects.using(qs.db).filter(
+            channel__slug=channel_slug
+        )
+        candidates = candidates.filter(
+            Exists(listings.filter(product_id=OuterRef("pk")))
         )
-    return qs
+    ranks = dict(
+        candidates.annotate(search_rank=rank)
+        .order_by("-search_rank", "pk")
+        .values_list("pk", "search_rank")[: settings.PRODUCT_SEARCH_MAX_CANDIDATES]
+    )
+
+    if use_cache:
+        cache.set(cache_key, list(ranks.items()), settings.PRODUCT_SEARCH_CACHE_TIMEOUT)
+    return ranks
+
+
+def _get_prefix_search_query(value: str) -> SearchQuery | None:
+    words = re.findall(r"\w+", value)
+    if not words:
+        return None
+    return SearchQuery(
+        " & ".join(f"{word}:*" for word in words), search_type="raw", config="simple"
+    )
+
+
+def _get_product_search_cache_key(
+    value: str, channel_slug: str | None, visibility: str | None
+) -> str:
+    key = f"{visibility}:{channel_slug or ''}:{value.lower()}"
+    key_hash = hashlib.sha256(key.encode()).hexdigest()
+    return f"{saleor_version}-product-search-{key_hash}"
@@ -1,10 +1,12 @@
 import logging
+import time
 from collections import defaultdict
 from collections.abc import Iterable
 from uuid import UUID
 
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
 from django.db.models import Exists, OuterRef, Q, QuerySet
@@ -22,7 +24,10 @@ from ..webhook.event_types import WebhookEventAsyncType
 from ..webhook.utils import get_webhooks_for_event
 from .lock_objects import product_qs_select_for_update
 from .models import Product, ProductChannelListing, ProductType, ProductVariant
-from .search import update_products_search_vector
+from .search import (
+    update_products_search_vector,
+    update_products_search_vector_batch,
+)
 from .utils.product import mark_products_in_channels_as_dirty
 from .utils.variant_prices import update_discounted_prices_for_promotion
 from .utils.variants import (
@@ -41,6 +46,16 @@ DISCOUNTED_PRODUCT_BATCH = 2000
 # Results in update time ~2s when 600 channels exist
 PROMOTION_RULE_BATCH_SIZE = 50
 
+SEARCH_VECTOR_REBUILD_BATCH_SIZE = 100
+# Number of batches dispatched to the workers by a single run of the rebuild task.
+SEARCH_VECTOR_REBUILD_BATCHES_PER_STEP = 20
+# The rebuild task postpones dispatching new batches when more products than
+# this are still waiting to be processed by the workers.
+SEARCH_VECTOR_REBUILD_MAX_PENDING = 20000
+SEARCH_VECTOR_REBUILD_RETRY_DELAY = 5
+SEARCH_VECTOR_REBUILD_STATE_KEY = "product-search-vector-rebuild"
+SEARCH_VECTOR_REBUILD_PROCESSED_KEY = "product-search-vector-rebuild-processed"
+
 
 def _variants_in_batches(variants_qs):
     """Slice a variants queryset into batches."""
@@ -319,6 +334,108 @@ def update_products_search_vector_task():
         update_products_search_vector(products)
 
 
+def start_products_search_vector_rebuild(restart: bool = False) -> dict:
+    """Schedule rebuilding of the search vectors of all products.
+
+    The rebuild continues from the last checkpoint when one exists, unless
+    `restart` is set.
+    """
+    state = cache.get(SEARCH_VECTOR_REBUILD_STATE_KEY)
+    if state is None or restart:
+        state = {
+            "cursor": 0,
+            "total": Product.objects.using(
+                settings.DATABASE_CONNECTION_REPLICA_NAME
+            ).count(),
+            "dispatched": 0,
+            "all_dispatched": False,
+            "started_at": time.time(),
+        }
+        cache.set(SEARCH_VECTOR_REBUILD_STATE_KEY, state, timeout=None)
+        cache.set(SEARCH_VECTOR_REBUILD_PROCESSED_KEY, 0, timeout=None)
+    rebuild_products_search_vector_task.delay()
+    return state
+
+
+def _finish_search_vector_rebuild_if_done(state: dict, processed: int):
+    if not state["all_dispatched"] or processed < state["dispatched"]:
+        return
+    if cache.delete(SEARCH_VECTOR_REBUILD_STATE_KEY):
+        elapsed = time.time() - state["started_at"]
+        task_logger.info(
+            "Rebuilt search vectors of %d products in %.1fs.", processed, elapsed
+        )
+        cache.delete(SEARCH_VECTOR_REBUILD_PROCESSED_KEY)
+
+
+@app.task(queue=settings.UPDATE_SEARCH_VECTOR_INDEX_QUEUE_NAME)
+def rebuild_products_search_vector_task():
+    """Dispatch the next products to the search vector batch workers.
+
+    Products are walked in primary key order. The last dispatched primary key is
+    stored as a checkpoint, so an interrupted rebuild can be resumed with
+    `start_products_search_vector_rebuild`.
+    """
+    state = cache.get(SEARCH_VECTOR_REBUILD_STATE_KEY)
+    if state is None or state["all_dispatched"]:
+        return
+    processed = cache.get(SEARCH_VECTOR_REBUILD_PROCESSED_KEY, 0)
+    if state["dispatched"] - processed > SEARCH_VECTOR_REBUILD_MAX_PENDING:
+        rebuild_products_search_vector_task.apply_async(
+            countdown=SEARCH_VECTOR_REBUILD_RETRY_DELAY
+        )
+        return
+
+    product_ids = list(
+        Product.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        .filter(pk__gt=state["cursor"])
+        .order_by("pk")
+        .values_list("pk", flat=True)[
+            : SEARCH_VECTOR_REBUILD_BATCH_SIZE * SEARCH_VECTOR_REBUILD_BATCHES_PER_STEP
+        ]
+    )
+    if not product_ids:
+        state["all_dispatched"] = True
+        cache.set(SEARCH_VECTOR_REBUILD_STATE_KEY, state, timeout=None)
+        _finish_search_vector_rebuild_if_done(
+            state, cache.get(SEARCH_VECTOR_REBUILD_PROCESSED_KEY, 0)
+        )
+        return
+
+    for i in range(0, len(product_ids), SEARCH_VECTOR_REBUILD_BATCH_SIZE):
+        update_products_search_vector_batch_task.delay(
+            product_ids[i : i + SEARCH_VECTOR_REBUILD_BATCH_SIZE]
+        )
+
+    state["cursor"] = product_ids[-1]
+    state["dispatched"] += len(product_ids)
+    cache.set(SEARCH_VECTOR_REBUILD_STATE_KEY, state, timeout=None)
+    rebuild_products_search_vector_task.delay()
+
+
+@app.task(queue=settings.UPDATE_SEARCH_VECTOR_INDEX_QUEUE_NAME)
+@allow_writer()
+def update_products_search_vector_batch_task(product_ids: list[int]):
+    updated_count = update_products_search_vector_batch(product_ids)
+
+    state = cache.get(SEARCH_VECTOR_REBUILD_STATE_KEY)
+    if state is None:
+        return
+    try:
+        processed = cache.incr(SEARCH_VECTOR_REBUILD_PROCESSED_KEY, len(product_ids))
+    except ValueError:
+        return
+    elapsed = max(time.time() - state["started_at"], 1e-3)
+    task_logger.info(
+        "Rebuilt search vectors of %d products, %d/%d processed (%.1f products/s).",
+        updated_count,
+        processed,
+        state["total"],
+        processed / elapsed,
+    )
+    _finish_search_vector_rebuild_if_done(state, processed)
+
+
 @app.task(queue=settings.COLLECTION_PRODUCT_UPDATED_QUEUE_NAME)
 @allow_writer()
 def collection_product_updated_task(product_ids):
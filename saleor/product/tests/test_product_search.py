@@ -1,5 +1,14 @@
+from django.core.cache import cache
+
+from ...core.postgres import FlatConcatSearchVector
+from .. import ProductSearchMode, ProductSearchVisibility
 from ..models import Product
-from ..search import update_products_search_vector
+from ..search import (
+    get_product_search_ranks,
+    prepare_product_search_vector_value,
+    search_products,
+    update_products_search_vector,
+)
 
 
 def test_update_products_search_vector(product_list):
@@ -15,3 +24,105 @@ def test_update_products_search_vector(product_list):
     for product in product_list:
         product.refresh_from_db()
         assert product.search_vector
+
+
+def test_update_products_search_vector_matches_single_product_value(product):
+    # given
+    product.search_vector = FlatConcatSearchVector(
+        *prepare_product_search_vector_value(product)
+    )
+    product.save(update_fields=["search_vector"])
+    product.refresh_from_db(fields=["search_vector"])
+    expected_search_vector = product.search_vector
+    Product.objects.filter(pk=product.pk).update(search_vector=None)
+
+    # when
+    updated_count = update_products_search_vector([product.pk])
+
+    # then
+    product.refresh_from_db(fields=["search_vector"])
+    assert updated_count == 1
+    assert product.search_vector == expected_search_vector
+
+
+def test_search_products_fuzzy_matches_prefix(product_list, channel_USD, settings):
+    # given
+    settings.PRODUCT_SEARCH_CACHE_TIMEOUT = 0
+
+    # when
+    result = search_products(
+        Product.objects.all(),
+        "smal",
+        mode=ProductSearchMode.FUZZY,
+        channel_slug=channel_USD.slug,
+    )
+
+    # then
+    assert list(result) == [product_list[2]]
+    assert result.get().search_rank > 0
+
+
+def test_search_products_fuzzy_matches_name_with_typo(product_list, settings):
+    # given
+    settings.PRODUCT_SEARCH_CACHE_TIMEOUT = 0
+
+    # when
+    result = search_products(
+        Product.objects.all(), "prodct", mode=ProductSearchMode.FUZZY
+    )
+
+    # then
+    assert set(result) == set(product_list)
+
+
+def test_get_product_search_ranks_cached(
+    product_list, channel_USD, settings, django_assert_num_queries
+):
+    # given
+    settings.PRODUCT_SEARCH_CACHE_TIMEOUT = 60
+    cache.clear()
+    ranks = get_product_search_ranks(
+        Product.objects.all(), "big", channel_USD.slug, ProductSearchVisibility.ALL
+    )
+
+    # when
+    with django_assert_num_queries(0):
+        cached_ranks = get_product_search_ranks(
+            Product.objects.all(),
+            " BIG ",
+            channel_USD.slug,
+            ProductSearchVisibility.ALL,
+        )
+
+    # then
+    assert cached_ranks == ranks
+    assert set(ranks) == {product_list[0].pk, product_list[1].pk}
+
+
+def test_get_product_search_ranks_not_cached_without_visibility(
+    product_list, channel_USD, settings, django_assert_num_queries
+):
+    # given
+    settings.PRODUCT_SEARCH_CACHE_TIMEOUT = 60
+    cache.clear()
+    get_product_search_ranks(Product.objects.all(), "big", channel_USD.slug)
+
+    # when
+    with django_assert_num_queries(1):
+        ranks = get_product_search_ranks(Product.objects.all(), "big", channel_USD.slug)
+
+    # then
+    assert set(ranks) == {product_list[0].pk, product_list[1].pk}
+
+
+def test_get_product_search_ranks_limits_filtered_candidates(product_list, settings):
+    # given
+    settings.PRODUCT_SEARCH_CACHE_TIMEOUT = 0
+    settings.PRODUCT_SEARCH_MAX_CANDIDATES = 1
+    qs = Product.objects.exclude(pk=product_list[0].pk)
+
+    # when
+    ranks = get_product_search_ranks(qs, "big")
+
+    # then
+    assert set(ranks) == {product_list[1].pk}
@@ -4,6 +4,7 @@ from decimal import Decimal
 from unittest.mock import patch
 
 import pytest
+from django.core.cache import cache
 from django.utils import timezone
 from faker import Faker
 
@@ -11,9 +12,12 @@ from ...discount import PromotionType, RewardValueType
 from ...discount.models import Promotion, PromotionRule
 from ..models import Product, ProductChannelListing, ProductVariantChannelListing
 from ..tasks import (
+    SEARCH_VECTOR_REBUILD_STATE_KEY,
     _get_preorder_variants_to_clean,
     mark_products_search_vector_as_dirty,
+    rebuild_products_search_vector_task,
     recalculate_discounted_price_for_products_task,
+    start_products_search_vector_rebuild,
     update_products_search_vector_task,
     update_variant_relations_for_active_promotion_rules_task,
     update_variants_names,
@@ -297,6 +301,43 @@ def test_update_products_search_vector_task(product):
     assert product.search_index_dirty is False
 
 
+def test_start_products_search_vector_rebuild(product_list):
+    # given
+    Product.objects.update(search_vector=None, search_index_dirty=True)
+
+    # when
+    start_products_search_vector_rebuild(restart=True)
+
+    # then
+    for product in Product.objects.all():
+        assert product.search_vector
+        assert product.search_index_dirty is False
+    assert cache.get(SEARCH_VECTOR_REBUILD_STATE_KEY) is None
+
+
+@patch("saleor.product.tasks.SEARCH_VECTOR_REBUILD_BATCH_SIZE", 1)
+@patch("saleor.product.tasks.SEARCH_VECTOR_REBUILD_BATCHES_PER_STEP", 1)
+def test_rebuild_products_search_vector_task_resumes_from_checkpoint(product_list):
+    # given
+    Product.objects.update(search_vector=None, search_index_dirty=True)
+    first_product, *other_products = Product.objects.order_by("pk")
+    with patch.object(rebuild_products_search_vector_task, "delay"):
+        start_products_search_vector_rebuild(restart=True)
+        rebuild_products_search_vector_task()
+    Product.objects.filter(pk=first_product.pk).update(search_index_dirty=True)
+
+    # when
+    start_products_search_vector_rebuild()
+
+    # then
+    first_product.refresh_from_db()
+    assert first_product.search_index_dirty is True
+    for product in other_products:
+        product.refresh_from_db()
+        assert product.search_index_dirty is False
+    assert cache.get(SEARCH_VECTOR_REBUILD_STATE_KEY) is None
+
+
 @pytest.mark.parametrize("dirty_products_number", [0, 1, 2, 3])
 def test_update_products_search_vector_task_with_static_number_of_queries(
     product, product_list, dirty_products_number, django_assert_num_queries
@@ -309,7 +350,7 @@ def test_update_products_search_vector_task_with_static_number_of_queries(
         product_list[i].save(update_fields=["search_index_dirty"])
 
     # when & # then
-    with django_assert_num_queries(16):
+    with django_assert_num_queries(12):
         update_products_search_vector_task()
 
 
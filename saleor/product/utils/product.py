@@ -1,12 +1,13 @@
 from collections import defaultdict
+from decimal import Decimal
 
 from django.conf import settings
 from django.db import transaction
-from django.db.models import Exists, OuterRef, QuerySet
+from django.db.models import Avg, Count, Exists, OuterRef, Q, QuerySet
 
 from ...discount.models import PromotionRule
 from ...product.models import ProductChannelListing
-from ..models import ProductVariant
+from ..models import ProductReview, ProductReviewSummary, ProductVariant
 
 
 def get_channel_to_products_map_from_rules(
@@ -163,3 +164,28 @@ def user_purchased_product(user, product):
         ],
         variant__product=product,
     ).exists()
+
+
+def update_product_review_summary(product_id: int) -> ProductReviewSummary:
+    """Пересчитывает агрегаты опубликованных отзывов товара.
+
+    Агрегаты считаются одним запросом по отзывам товара. `Product.rating` не
+    изменяется, так как его задает мерчант через productCreate/productUpdate.
+    """
+    aggregates = ProductReview.objects.filter(
+        product_id=product_id, is_published=True
+    ).aggregate(
+        review_count=Count("id"),
+        rating_avg=Avg("rating"),
+        **{
+            f"rating_{rating}_count": Count("id", filter=Q(rating=rating))
+            for rating in range(1, 6)
+        },
+    )
+    rating_avg = aggregates.pop("rating_avg")
+    if rating_avg is not None:
+        rating_avg = Decimal(rating_avg).quantize(Decimal("0.01"))
+    summary, _ = ProductReviewSummary.objects.update_or_create(
+        product_id=product_id, defaults={"rating_avg": rating_avg, **aggregates}
+    )
+    return summary
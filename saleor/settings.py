@@ -614,6 +614,11 @@ EXPORT_FILES_TIMEDELTA = datetime.timedelta(
     seconds=parse(os.environ.get("EXPORT_FILES_TIMEDELTA", "30 days"))
 )
 
+# Number of products exported by a single task. When set, product exports are split
+# into shards of this size, exported concurrently and merged into the final file.
+# Exports run in a single task when set to 0.
+EXPORT_PRODUCTS_SHARD_SIZE = int(os.environ.get("EXPORT_PRODUCTS_SHARD_SIZE", 0))
+
 # CELERY SETTINGS
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_BROKER_URL = (
@@ -745,6 +750,20 @@ EVENT_PAYLOAD_DELETE_PERIOD = datetime.timedelta(
 EVENT_PAYLOAD_DELETE_TASK_TIME_LIMIT = datetime.timedelta(
     seconds=parse(os.environ.get("EVENT_PAYLOAD_DELETE_TASK_TIME_LIMIT", "1 hour"))
 )
+
+# Event payloads smaller than this number of bytes are stored in the database
+# instead of the private storage.
+EVENT_PAYLOAD_INLINE_SIZE_LIMIT = int(
+    os.environ.get("EVENT_PAYLOAD_INLINE_SIZE_LIMIT", 0)
+)
+# Compress event payload files with zstd; requires the zstandard package.
+EVENT_PAYLOAD_COMPRESSION = get_bool_from_env("EVENT_PAYLOAD_COMPRESSION", False)
+# Unreferenced event payload files are deleted only when older than this period;
+# existing files are reused by identical payloads during its first half.
+EVENT_PAYLOAD_FILE_GRACE_PERIOD = datetime.timedelta(
+    seconds=parse(os.environ.get("EVENT_PAYLOAD_FILE_GRACE_PERIOD", "1 hour"))
+)
+
 EVENT_DELIVERY_ATTEMPT_RESPONSE_SIZE_LIMIT = int(
     os.environ.get("EVENT_DELIVERY_ATTEMPT_RESPONSE_SIZE_LIMIT", 1024)
 )
@@ -772,6 +791,12 @@ OBSERVABILITY_BUFFER_SIZE_LIMIT = int(
 OBSERVABILITY_BUFFER_BATCH_SIZE = int(
     os.environ.get("OBSERVABILITY_BUFFER_BATCH_SIZE", 100)
 )
+# Max number of observability events kept in the process memory before they are
+# written to the buffer in batches by a background thread. Events are dropped when
+# the queue is full. Events are written to the buffer right away when set to 0.
+OBSERVABILITY_EVENT_QUEUE_SIZE = int(
+    os.environ.get("OBSERVABILITY_EVENT_QUEUE_SIZE", 0)
+)
 OBSERVABILITY_REPORT_PERIOD = datetime.timedelta(
     seconds=parse(os.environ.get("OBSERVABILITY_REPORT_PERIOD", "20 seconds"))
 )
@@ -960,6 +985,14 @@ PRODUCT_MAX_INDEXED_ATTRIBUTES = 1000
 PRODUCT_MAX_INDEXED_ATTRIBUTE_VALUES = 100
 PRODUCT_MAX_INDEXED_VARIANTS = 1000
 
+# Fuzzy product search ranks at most this many matching products
+PRODUCT_SEARCH_MAX_CANDIDATES = int(
+    os.environ.get("PRODUCT_SEARCH_MAX_CANDIDATES", 500)
+)
+# Timeout in seconds of the cached fuzzy product search results; set to 0 to
+# disable the cache
+PRODUCT_SEARCH_CACHE_TIMEOUT = int(os.environ.get("PRODUCT_SEARCH_CACHE_TIMEOUT", 60))
+
 # Maximum related objects that can be indexed in a page
 PAGE_MAX_INDEXED_ATTRIBUTES = 1000
 PAGE_MAX_INDEXED_ATTRIBUTE_VALUES = 100
@@ -1043,6 +1076,19 @@ WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT = 18
 WEBHOOK_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT)
 WEBHOOK_SYNC_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT)
 
+# Time (sec) for which an expired cached response of a sync webhook is still returned
+# to concurrent requests while a single worker refreshes it. Disabled when set to 0.
+WEBHOOK_SYNC_CACHE_STALE_TTL = int(os.environ.get("WEBHOOK_SYNC_CACHE_STALE_TTL", 0))
+
+# Deliver async webhooks with a single worker task per app, which sends pending
+# deliveries in batches instead of scheduling a task per delivery.
+WEBHOOK_ASYNC_BATCH_DELIVERY = get_bool_from_env("WEBHOOK_ASYNC_BATCH_DELIVERY", False)
+
+# The max number of concurrent requests sent by the per app delivery worker.
+WEBHOOK_ASYNC_DELIVERY_CONCURRENCY = int(
+    os.environ.get("WEBHOOK_ASYNC_DELIVERY_CONCURRENCY", 10)
+)
+
 # The max number of rules with order_predicate defined
 ORDER_RULES_LIMIT = os.environ.get("ORDER_RULES_LIMIT", 100)
 
@@ -1104,6 +1150,31 @@ TELEMETRY_SLOW_GRAPHQL_OPERATION_THRESHOLD = float(
 # For development envs, where schema may change often, it may be convenient to set it to e.g. commit hash value.
 GRAPHQL_CACHE_SUFFIX = os.environ.get("GRAPHQL_CACHE_SUFFIX", "")
 
+# Automatic persisted queries allow clients to send only a sha256 hash of a query
+# (`extensions.persistedQuery.sha256Hash`). Validated documents are shared between
+# workers through the cache for the given timeout.
+GRAPHQL_PERSISTED_QUERIES_ENABLED = get_bool_from_env(
+    "GRAPHQL_PERSISTED_QUERIES_ENABLED", True
+)
+GRAPHQL_PERSISTED_QUERIES_TIMEOUT = parse(
+    os.environ.get("GRAPHQL_PERSISTED_QUERIES_TIMEOUT", "7 days")
+)
+
+# Timeout in seconds of the response cache for anonymous catalog queries. Cached
+# responses are invalidated by product, collection and category events.
+# Set to 0 to disable the cache.
+GRAPHQL_RESPONSE_CACHE_TIMEOUT = int(
+    os.environ.get("GRAPHQL_RESPONSE_CACHE_TIMEOUT", 0)
+)
+
+# Serve the GraphQL API with an async view when running under ASGI. Requests are
+# executed in a shared pool of up to GRAPHQL_EXECUTOR_THREADS threads instead of a
+# new thread per request. Threads are started only when needed, so the default
+# does not limit concurrency in practice; requests above the limit wait for a free
+# thread. Lower it to cap the number of threads and database connections.
+GRAPHQL_ASYNC_VIEW_ENABLED = get_bool_from_env("GRAPHQL_ASYNC_VIEW_ENABLED", False)
+GRAPHQL_EXECUTOR_THREADS = int(os.environ.get("GRAPHQL_EXECUTOR_THREADS", 1000))
+
 # Library `google-i18n-address` use `AddressValidationMetadata` form Google to provide address validation rules.
 # Patch `i18n` module to allows to override the default address rules.
 i18n_rules_override()
@@ -29,6 +29,7 @@ from ..discount.models import (
 )
 from ..payment.interface import AddressData
 from ..permission.enums import get_permissions
+from ..plugins.cache import clear_plugin_configurations_cache
 from ..product.models import (
     CategoryTranslation,
     CollectionTranslation,
@@ -587,6 +588,12 @@ def private_media_setting(private_media_root, settings):
     return private_media_root
 
 
+@pytest.fixture(autouse=True)
+def plugin_configurations_cache():
+    # Cached rows would outlive the rolled back transaction of the previous test.
+    clear_plugin_configurations_cache()
+
+
 @pytest.fixture
 def description_json():
     return {
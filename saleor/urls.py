@@ -6,7 +6,7 @@ from django.views.decorators.csrf import csrf_exempt
 
 from .core.views import jwks
 from .graphql.api import backend, schema
-from .graphql.views import GraphQLView
+from .graphql.views import AsyncGraphQLView, GraphQLView
 from .plugins.views import (
     handle_global_plugin_webhook,
     handle_plugin_per_channel_webhook,
@@ -15,10 +15,14 @@ from .plugins.views import (
 from .product.views import digital_product
 from .thumbnail.views import handle_thumbnail
 
+graphql_view_class = (
+    AsyncGraphQLView if settings.GRAPHQL_ASYNC_VIEW_ENABLED else GraphQLView
+)
+
 urlpatterns = [
     re_path(
         r"^graphql/$",
-        csrf_exempt(GraphQLView.as_view(backend=backend, schema=schema)),
+        csrf_exempt(graphql_view_class.as_view(backend=backend, schema=schema)),
         name="api",
     ),
     re_path(
@@ -0,0 +1,30 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class WarehouseAppConfig(AppConfig):
+    name = "saleor.warehouse"
+
+    def ready(self):
+        from .cache import (
+            handle_channel_warehouse_change,
+            handle_warehouse_channels_change,
+        )
+        from .models import ChannelWarehouse, Warehouse
+
+        # preventing duplicate signals
+        post_save.connect(
+            handle_channel_warehouse_change,
+            sender=ChannelWarehouse,
+            dispatch_uid="save_channel_warehouse_priority",
+        )
+        post_delete.connect(
+            handle_channel_warehouse_change,
+            sender=ChannelWarehouse,
+            dispatch_uid="delete_channel_warehouse_priority",
+        )
+        m2m_changed.connect(
+            handle_warehouse_channels_change,
+            sender=Warehouse.channels.through,
+            dispatch_uid="change_channel_warehouse_priority",
+        )
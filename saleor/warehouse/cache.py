@@ -0,0 +1,70 @@
+"""Cache of the warehouse priority within channels.
+
+The `PRIORITIZE_SORTING_ORDER` allocation strategy sorts stocks by the position
+of their warehouse in the channel. The positions change rarely, so they are kept
+in the cache and dropped whenever the channel warehouses are added, removed or
+reordered.
+"""
+
+from collections.abc import Iterable
+from uuid import UUID
+
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import ChannelWarehouse
+
+CHANNEL_WAREHOUSE_PRIORITY_CACHE_KEY = "channel-warehouse-priority-{channel_id}"
+CHANNEL_WAREHOUSE_PRIORITY_CACHE_TIMEOUT = 60 * 60
+
+
+def _get_cache_key(channel_id: int) -> str:
+    return CHANNEL_WAREHOUSE_PRIORITY_CACHE_KEY.format(channel_id=channel_id)
+
+
+def get_channel_warehouse_priority(channel_id: int) -> dict[UUID, int]:
+    """Return the position of each channel warehouse mapped by warehouse ID."""
+    cache_key = _get_cache_key(channel_id)
+    priority = cache.get(cache_key)
+    if priority is None:
+        warehouse_ids = (
+            ChannelWarehouse.objects.filter(channel_id=channel_id)
+            .order_by("sort_order", "pk")
+            .values_list("warehouse_id", flat=True)
+        )
+        priority = {
+            warehouse_id: position
+            for position, warehouse_id in enumerate(warehouse_ids)
+        }
+        cache.set(cache_key, priority, timeout=CHANNEL_WAREHOUSE_PRIORITY_CACHE_TIMEOUT)
+    return priority
+
+
+def invalidate_channel_warehouse_priority(channel_ids: Iterable[int]):
+    """Drop the cached warehouse priority of the given channels.
+
+    The entries are dropped again when the transaction is committed, in case
+    they were cached from not yet committed data in the meantime.
+    """
+    cache_keys = [_get_cache_key(channel_id) for channel_id in channel_ids]
+    if not cache_keys:
+        return
+    cache.delete_many(cache_keys)
+    transaction.on_commit(lambda: cache.delete_many(cache_keys))
+
+
+def handle_channel_warehouse_change(instance: ChannelWarehouse, **_kwargs):
+    invalidate_channel_warehouse_priority([instance.channel_id])
+
+
+def handle_warehouse_channels_change(instance, action, reverse, pk_set, **_kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if reverse:
+        # the change was made through `Channel.warehouses`
+        channel_ids = [instance.pk]
+    elif pk_set is not None:
+        channel_ids = list(pk_set)
+    else:
+        channel_ids = list(instance.channels.values_list("pk", flat=True))
+    invalidate_channel_warehouse_priority(channel_ids)
@@ -23,14 +23,15 @@ from ..order.fetch import OrderLineInfo
 from ..order.models import OrderLine
 from ..plugins.manager import PluginsManager
 from ..product.models import ProductVariant, ProductVariantChannelListing
+from .cache import get_channel_warehouse_priority
 from .lock_objects import (
     allocation_with_stock_qs_select_for_update,
     stock_qs_select_for_update,
     stock_select_for_update_for_existing_qs,
 )
+from .metrics import record_stock_lock_duration_on_commit
 from .models import (
     Allocation,
-    ChannelWarehouse,
     PreorderAllocation,
     PreorderReservation,
     Reservation,
@@ -124,7 +125,8 @@ def allocate_stocks(
         .filter(**filter_lookup)
         .values("id", "product_variant", "pk", "quantity", "warehouse_id")
     )
-    stocks_id = (stock.pop("id") for stock in stocks)
+    record_stock_lock_duration_on_commit("allocate_stocks")
+    stocks_id = [stock.pop("id") for stock in stocks]
 
     quantity_reservation_for_stocks: dict = _prepare_stock_to_reserved_quantity_map(
         checkout_lines, check_reservations, stocks_id
@@ -177,29 +179,30 @@ def allocate_stocks(
     if allocations:
         Allocation.objects.bulk_create(allocations)
 
-        stocks_to_update_map = {alloc.stock_id: alloc.stock for alloc in allocations}
         quantity_from_allocations: dict[int, int] = defaultdict(int)
-
         for alloc in allocations:
             quantity_from_allocations[alloc.stock_id] += alloc.quantity_allocated
 
-        for stock_id, quantity in quantity_from_allocations.items():
-            stock = stocks_to_update_map[stock_id]
-            stock.quantity_allocated = F("quantity_allocated") + quantity
+        # Stock rows are locked, so the stocks and their availability after the
+        # allocation can be computed from the values fetched in this transaction.
+        stocks_to_update = Stock.objects.in_bulk(quantity_from_allocations.keys())
+        out_of_stock = []
+        for stock_id in sorted(quantity_from_allocations):
+            stock = stocks_to_update[stock_id]
+            quantity = quantity_from_allocations[stock_id]
+            stock.quantity_allocated += quantity
+            allocated_stock = quantity_allocation_for_stocks[stock_id] + quantity
+            if stock.quantity - allocated_stock <= 0:
+                out_of_stock.append(stock)
+        Stock.objects.bulk_update(stocks_to_update.values(), ["quantity_allocated"])
 
-        Stock.objects.bulk_update(stocks_to_update_map.values(), ["quantity_allocated"])
+        if out_of_stock:
+            transaction.on_commit(lambda: _notify_out_of_stock(out_of_stock, manager))
 
-        for allocation in allocations:
-            allocated_stock = (
-                Allocation.objects.filter(stock_id=allocation.stock_id).aggregate(
-                    Sum("quantity_allocated")
-                )["quantity_allocated__sum"]
-                or 0
-            )
-            if not max(allocation.stock.quantity - allocated_stock, 0):
-                transaction.on_commit(
-                    lambda: manager.product_variant_out_of_stock(allocation.stock)
-                )
+
+def _notify_out_of_stock(stocks: list[Stock], manager: PluginsManager):
+    for stock in stocks:
+        manager.product_variant_out_of_stock(stock)
 
 
 def _prepare_stock_to_reserved_quantity_map(
@@ -234,10 +237,9 @@ def sort_stocks(
     quantity_allocation_for_stocks: dict[int, int],
     collection_point_pk: UUID | None = None,
 ):
-    warehouse_ids = [stock_data["warehouse_id"] for stock_data in stocks]
-    channel_warehouse_ids = ChannelWarehouse.objects.filter(
-        channel_id=channel.id, warehouse_id__in=warehouse_ids
-    ).values_list("warehouse_id", flat=True)
+    warehouse_priority: dict[UUID, int] = {}
+    if allocation_strategy == AllocationStrategy.PRIORITIZE_SORTING_ORDER:
+        warehouse_priority = get_channel_warehouse_priority(channel.id)
 
     def sort_stocks_by_highest_stocks(stock_data):
         """Sort the stocks by the highest quantity available."""
@@ -251,15 +253,12 @@ def sort_stocks(
 
     def sort_stocks_by_warehouse_sorting_order(stock_data):
         """Sort the stocks based on the warehouse within channel order."""
-        # get the sort order for stocks warehouses within the channel
-        sorted_warehouse_list = list(channel_warehouse_ids)
-
         warehouse_id = stock_data.pop("warehouse_id")
         # in case of click and collect order we should allocate stocks from
         # collection point warehouse at the first place
         if warehouse_id == collection_point_pk:
             return -math.inf
-        return sorted_warehouse_list.index(warehouse_id)
+        return warehouse_priority.get(warehouse_id, math.inf)
 
     allocation_strategy_to_sort_method_and_reverse_option = {
         AllocationStrategy.PRIORITIZE_HIGH_STOCK: (sort_stocks_by_highest_stocks, True),
@@ -0,0 +1,34 @@
+import time
+
+from django.db import transaction
+
+from ..core.telemetry import DEFAULT_DURATION_BUCKETS, MetricType, Scope, Unit, meter
+
+# Initialize metrics
+METRIC_STOCK_LOCK_DURATION = meter.create_metric(
+    "saleor.warehouse.stock_lock.duration",
+    scope=Scope.CORE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.SECOND,
+    description="Time for which stock rows are locked while allocating stocks.",
+    bucket_boundaries=DEFAULT_DURATION_BUCKETS,
+)
+
+
+def record_stock_lock_duration_on_commit(operation: str) -> None:
+    """Record the time from now until the current transaction is committed.
+
+    Should be called right after the stock rows are locked; the locks are released
+    when the transaction is committed.
+    """
+    start = time.monotonic_ns()
+
+    def record():
+        meter.record(
+            METRIC_STOCK_LOCK_DURATION,
+            time.monotonic_ns() - start,
+            unit=Unit.NANOSECOND,
+            attributes={"operation": operation},
+        )
+
+    transaction.on_commit(record)
@@ -0,0 +1,67 @@
+import pytest
+
+from ....channel import AllocationStrategy
+from ...management import sort_stocks
+from ...models import ChannelWarehouse, Warehouse
+
+WAREHOUSES_COUNT = 300
+
+
+@pytest.fixture
+def channel_with_many_warehouses(channel_USD, address):
+    warehouses = Warehouse.objects.bulk_create(
+        [
+            Warehouse(
+                address=address,
+                name=f"Warehouse {index}",
+                slug=f"warehouse-{index}",
+                email=f"warehouse-{index}@example.com",
+            )
+            for index in range(WAREHOUSES_COUNT)
+        ]
+    )
+    # reverse the warehouse priority to make the sorting do actual work
+    ChannelWarehouse.objects.bulk_create(
+        [
+            ChannelWarehouse(
+                channel=channel_USD,
+                warehouse=warehouse,
+                sort_order=WAREHOUSES_COUNT - index,
+            )
+            for index, warehouse in enumerate(warehouses)
+        ]
+    )
+    channel_USD.allocation_strategy = AllocationStrategy.PRIORITIZE_SORTING_ORDER
+    channel_USD.save(update_fields=["allocation_strategy"])
+    return channel_USD, warehouses
+
+
+def _get_stocks_data(warehouses):
+    return [
+        {"pk": index, "quantity": 10, "warehouse_id": warehouse.pk}
+        for index, warehouse in enumerate(warehouses)
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_sort_stocks_prioritize_sorting_order(
+    channel_with_many_warehouses, django_assert_num_queries, count_queries
+):
+    # given
+    channel, warehouses = channel_with_many_warehouses
+
+    # when
+    with django_assert_num_queries(1):
+        first_stocks = sort_stocks(
+            channel.allocation_strategy, _get_stocks_data(warehouses), channel, {}
+        )
+    with django_assert_num_queries(0):
+        stocks = sort_stocks(
+            channel.allocation_strategy, _get_stocks_data(warehouses), channel, {}
+        )
+
+    # then
+    expected_pks = list(reversed(range(WAREHOUSES_COUNT)))
+    assert [stock_data["pk"] for stock_data in first_stocks] == expected_pks
+    assert [stock_data["pk"] for stock_data in stocks] == expected_pks
@@ -0,0 +1,64 @@
+from ..cache import get_channel_warehouse_priority
+from ..models import ChannelWarehouse
+
+
+def test_get_channel_warehouse_priority(channel_USD, warehouses):
+    # given
+    channel_warehouse_1, channel_warehouse_2 = channel_USD.channelwarehouse.all()
+    channel_warehouse_1.sort_order = 1
+    channel_warehouse_2.sort_order = 0
+    ChannelWarehouse.objects.bulk_update(
+        [channel_warehouse_1, channel_warehouse_2], ["sort_order"]
+    )
+
+    # when
+    priority = get_channel_warehouse_priority(channel_USD.pk)
+
+    # then
+    assert priority == {
+        channel_warehouse_2.warehouse_id: 0,
+        channel_warehouse_1.warehouse_id: 1,
+    }
+
+
+def test_get_channel_warehouse_priority_cached(
+    channel_USD, warehouses, django_assert_num_queries
+):
+    # given
+    priority = get_channel_warehouse_priority(channel_USD.pk)
+
+    # when
+    with django_assert_num_queries(0):
+        cached_priority = get_channel_warehouse_priority(channel_USD.pk)
+
+    # then
+    assert cached_priority == priority
+
+
+def test_get_channel_warehouse_priority_invalidated_on_channel_warehouses_change(
+    channel_USD, warehouses, warehouse
+):
+    # given
+    warehouse.channels.remove(channel_USD)
+    assert warehouse.pk not in get_channel_warehouse_priority(channel_USD.pk)
+
+    # when
+    warehouse.channels.add(channel_USD)
+
+    # then
+    priority = get_channel_warehouse_priority(channel_USD.pk)
+    assert priority[warehouse.pk] == len(warehouses)
+
+
+def test_get_channel_warehouse_priority_invalidated_on_channel_warehouse_delete(
+    channel_USD, warehouses
+):
+    # given
+    warehouse_to_delete, warehouse_to_keep = warehouses
+    assert warehouse_to_delete.pk in get_channel_warehouse_priority(channel_USD.pk)
+
+    # when
+    channel_USD.warehouses.remove(warehouse_to_delete)
+
+    # then
+    assert get_channel_warehouse_priority(channel_USD.pk) == {warehouse_to_keep.pk: 0}
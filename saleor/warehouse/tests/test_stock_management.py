@@ -88,6 +88,56 @@ def test_allocate_stocks_multiple_lines_the_highest_stock_strategy(
     assert allocation.quantity_allocated == stock_2.quantity_allocated == quantity_2
 
 
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_out_of_stock")
+def test_allocate_stocks_multiple_lines_out_of_stock_webhooks(
+    product_variant_out_of_stock_webhook_mock,
+    order_line,
+    product,
+    stock,
+    channel_USD,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    stock.quantity = 10
+    stock.save(update_fields=["quantity"])
+
+    variant_2 = product.variants.first()
+    stock_2 = Stock.objects.get(product_variant=variant_2)
+    stock_2.quantity = 5
+    stock_2.save(update_fields=["quantity"])
+
+    order_line_2 = OrderLine.objects.get(pk=order_line.pk)
+    order_line_2.pk = None
+    order_line_2.variant = variant_2
+    order_line_2.save()
+
+    line_data_1 = OrderLineInfo(
+        line=order_line, variant=order_line.variant, quantity=10
+    )
+    line_data_2 = OrderLineInfo(line=order_line_2, variant=variant_2, quantity=5)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        allocate_stocks(
+            [line_data_1, line_data_2],
+            COUNTRY_CODE,
+            channel_USD,
+            manager=get_plugins_manager(allow_replica=False),
+        )
+
+    # then
+    stock.refresh_from_db()
+    stock_2.refresh_from_db()
+    assert stock.quantity_allocated == 10
+    assert stock_2.quantity_allocated == 5
+    assert product_variant_out_of_stock_webhook_mock.call_count == 2
+    notified_stocks = {
+        call.args[0].pk
+        for call in product_variant_out_of_stock_webhook_mock.call_args_list
+    }
+    assert notified_stocks == {stock.pk, stock_2.pk}
+
+
 def test_allocate_stock_many_stocks_the_highest_stock_strategy(
     order_line, variant_with_many_stocks, channel_USD
 ):
@@ -38,6 +38,10 @@ BREAKER_BOARD_SUCCESS_COUNT_RECOVERY: int = 50
 # Time to keep circuit breaker in opened state before starting recovery (half-open state).
 BREAKER_BOARD_COOLDOWN_SECONDS: int = 2 * 60
 
+# Time to reuse the circuit breaker state known to the process before reading it from
+# the storage again.
+BREAKER_BOARD_STATE_CACHE_SECONDS: int = 1
+
 
 class BreakerBoard:
     """Base class for breaker board implementations.
@@ -57,6 +61,7 @@ class BreakerBoard:
         success_count_recovery: int,
         cooldown_seconds: int,
         ttl_seconds: int,
+        state_cache_seconds: int = 0,
     ):
         self.validate_sync_events()
         self.storage = storage
@@ -67,6 +72,9 @@ class BreakerBoard:
         self.failure_threshold_recovery = failure_threshold_recovery
         self.cooldown_seconds = cooldown_seconds
         self.ttl_seconds = ttl_seconds
+        self.state_cache_seconds = state_cache_seconds
+        # app ID -> (state, changed at, expiration time of the entry)
+        self._cached_states: dict[int, tuple[str, int, float]] = {}
 
     def validate_sync_events(self):
         if not settings.BREAKER_BOARD_SYNC_EVENTS:
@@ -106,11 +114,30 @@ class BreakerBoard:
     def reached_half_open_target_success_count(self, total: int, errors: int) -> bool:
         return total - errors >= self.success_count_recovery
 
+    def cache_breaker_state(self, app_id: int, state: str, changed_at: int):
+        if self.state_cache_seconds:
+            expires_at = time.monotonic() + self.state_cache_seconds
+            self._cached_states[app_id] = (state, changed_at, expires_at)
+
+    def get_cached_breaker_state(self, app_id: int) -> str | None:
+        if cached_state := self._cached_states.get(app_id):
+            state, changed_at, expires_at = cached_state
+            if expires_at < time.monotonic():
+                return None
+            # the cooldown has passed, the breaker should enter the half-open state
+            if state == CircuitBreakerState.OPEN and changed_at < (
+                time.time() - self.cooldown_seconds
+            ):
+                return None
+            return state
+        return None
+
     def set_breaker_state(self, app: "App", state: str, total: int, errors: int) -> str:
         self.storage.clear_state_for_app(app.id)
 
         changed_at = int(time.time())
         self.storage.set_app_state(app.id, state, changed_at)
+        self.cache_breaker_state(app.id, state, changed_at)
 
         logger.info(
             "[App ID: %r] Circuit breaker changed state to %s.",
@@ -125,11 +152,11 @@ class BreakerBoard:
         )
         return state
 
-    def update_breaker_state(self, app: "App") -> str:
-        state, changed_at = self.storage.get_app_state(app.id)
-
-        total = self.storage.get_event_count(app.id, "total") or 1
-        errors = self.storage.get_event_count(app.id, "error")
+    def evaluate_breaker_state(
+        self, app: "App", state: str, changed_at: int, counts: dict[str, int]
+    ) -> str:
+        total = counts.get("total") or 1
+        errors = counts.get("error", 0)
         # CLOSED to OPEN
         if state == CircuitBreakerState.CLOSED and self.exceeded_error_threshold(
             state, total, errors
@@ -152,8 +179,29 @@ class BreakerBoard:
                 return self.set_breaker_state(
                     app, CircuitBreakerState.CLOSED, total, errors
                 )
+        self.cache_breaker_state(app.id, state, changed_at)
         return state
 
+    def update_breaker_state(self, app: "App") -> str:
+        state, changed_at, counts = self.storage.get_app_state_with_event_counts(
+            app.id, self.ttl_seconds
+        )
+        return self.evaluate_breaker_state(app, state, changed_at, counts)
+
+    def get_breaker_state(self, app: "App") -> str:
+        """Return the breaker state, reusing the state cached by the process."""
+        if state := self.get_cached_breaker_state(app.id):
+            return state
+        return self.update_breaker_state(app)
+
+    def register_result(self, app: "App", success: bool) -> str:
+        """Register the webhook call result and return the updated breaker state."""
+        names = ["total"] if success else ["error", "total"]
+        state, changed_at, counts = self.storage.register_events(
+            app.id, names, self.ttl_seconds
+        )
+        return self.evaluate_breaker_state(app, state, changed_at, counts)
+
     def register_error(self, app_id: int):
         self.storage.register_event(app_id, "error", self.ttl_seconds)
         self.storage.register_event(app_id, "total", self.ttl_seconds)
@@ -171,7 +219,7 @@ class BreakerBoard:
                 return func(*args, **kwargs)
 
             app = webhook.app
-            state = self.update_breaker_state(app)
+            state = self.get_breaker_state(app)
             if state == CircuitBreakerState.OPEN:
                 if event_type not in settings.BREAKER_BOARD_DRY_RUN_SYNC_EVENTS:
                     # Skip func execution to prevent sending webhooks
@@ -181,10 +229,7 @@ class BreakerBoard:
                     return func(*args, **kwargs)
 
             response = func(*args, **kwargs)
-            if response is None:
-                self.register_error(app.id)
-            else:
-                self.register_success(app.id)
+            self.register_result(app, success=response is not None)
 
             return response
 
@@ -207,4 +252,5 @@ def initialize_breaker_board() -> BreakerBoard | None:
         success_count_recovery=BREAKER_BOARD_SUCCESS_COUNT_RECOVERY,
         cooldown_seconds=BREAKER_BOARD_COOLDOWN_SECONDS,
         ttl_seconds=BREAKER_BOARD_TTL_SECONDS,
+        state_cache_seconds=BREAKER_BOARD_STATE_CACHE_SECONDS,
     )
@@ -11,6 +11,8 @@ logger = logging.getLogger(__name__)
 
 
 class Storage:
+    EVENT_KEYS = ["error", "total"]
+
     def set_app_state(self, app_id: int, state: CircuitBreakerState, changed_at: int):
         pass
 
@@ -26,6 +28,22 @@ class Storage:
     def clear_state_for_app(self, app_id: int):
         pass
 
+    def get_app_state_with_event_counts(
+        self, app_id: int, ttl_seconds: int
+    ) -> tuple[str, int, dict[str, int]]:
+        """Return the app state and the counts of events registered within TTL."""
+        state, changed_at = self.get_app_state(app_id)
+        counts = {name: self.get_event_count(app_id, name) for name in self.EVENT_KEYS}
+        return state, changed_at, counts
+
+    def register_events(
+        self, app_id: int, names: list[str], ttl_seconds: int
+    ) -> tuple[str, int, dict[str, int]]:
+        """Register events and return the app state with the updated event counts."""
+        for name in names:
+            self.register_event(app_id, name, ttl_seconds)
+        return self.get_app_state_with_event_counts(app_id, ttl_seconds)
+
     class Meta:
         abstract = True
 
@@ -43,7 +61,6 @@ def deserialize_breaker_state(data) -> tuple[str, int]:
 class RedisStorage(Storage):
     WARNING_MESSAGE = "An error occurred when interacting with Redis"
     KEY_PREFIX = "bbrs"  # as in "breaker board redis storage"
-    EVENT_KEYS = ["error", "total"]
     STATE_KEY = "state"
 
     def __init__(self, client=None):
@@ -120,3 +137,58 @@ class RedisStorage(Storage):
             logger.warning(self.WARNING_MESSAGE, exc_info=True)
             error = 1
             return error
+
+    def _add_state_with_event_counts(
+        self, pipeline, app_id: int, now: int, ttl_seconds
+    ):
+        base_key = self.get_base_storage_key()
+        pipeline.get(f"{base_key}-{app_id}-{self.STATE_KEY}")
+        for name in self.EVENT_KEYS:
+            # Count only the events registered within TTL, as expired events are
+            # removed from the set when a new event of the same name is registered.
+            pipeline.zcount(
+                f"{base_key}-{app_id}-{name}", f"({now - ttl_seconds}", "+inf"
+            )
+
+    def _parse_state_with_event_counts(
+        self, results: list
+    ) -> tuple[str, int, dict[str, int]]:
+        data, *counts = results
+        state, changed_at = (
+            deserialize_breaker_state(data) if data else (CircuitBreakerState.CLOSED, 0)
+        )
+        return state, changed_at, dict(zip(self.EVENT_KEYS, counts, strict=True))
+
+    def get_app_state_with_event_counts(
+        self, app_id: int, ttl_seconds: int
+    ) -> tuple[str, int, dict[str, int]]:
+        now = int(time.time())
+        try:
+            p = self._client.pipeline()
+            self._add_state_with_event_counts(p, app_id, now, ttl_seconds)
+            results = p.execute()
+        except RedisError:
+            logger.warning(self.WARNING_MESSAGE, exc_info=True)
+            return CircuitBreakerState.CLOSED, 0, dict.fromkeys(self.EVENT_KEYS, 0)
+        return self._parse_state_with_event_counts(results)
+
+    def register_events(
+        self, app_id: int, names: list[str], ttl_seconds: int
+    ) -> tuple[str, int, dict[str, int]]:
+        """Register events and read the app state in a single Redis round-trip."""
+        base_key = self.get_base_storage_key()
+        now = int(time.time())
+        try:
+            p = self._client.pipeline()
+            for name in names:
+                key = f"{base_key}-{app_id}-{name}"
+                p.zremrangebyscore(key, "-inf", now - ttl_seconds)
+                p.zadd(key, {uuid.uuid4().bytes: now})
+                # Drop the whole set once the app stops sending webhooks.
+                p.expire(key, ttl_seconds)
+            self._add_state_with_event_counts(p, app_id, now, ttl_seconds)
+            results = p.execute()
+        except RedisError:
+            logger.warning(self.WARNING_MESSAGE, exc_info=True)
+            return CircuitBreakerState.CLOSED, 0, dict.fromkeys(self.EVENT_KEYS, 0)
+        return self._parse_state_with_event_counts(results[len(names) * 3 :])
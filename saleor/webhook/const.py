@@ -4,6 +4,8 @@ SYNC_WEBHOOK_FAILURE_CACHE_TTL: int = 1  # 1 second
 SYNC_WEBHOOK_FAILURE_SENTINEL = (
     "WEBHOOK_FAILURE"  # Arbitrary value to indicate webhook failure in cache
 )
+# How often to check for the response of a sync webhook sent by another worker.
+SYNC_WEBHOOK_CACHE_LOCK_POLL_INTERVAL: float = 0.05  # 50 milliseconds
 APP_ID_PREFIX = "app"
 
 MAX_FILTERABLE_CHANNEL_SLUGS_LIMIT = 500
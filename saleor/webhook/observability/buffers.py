@@ -1,5 +1,10 @@
 import math
+import os
+import queue
+import threading
 import zlib
+from collections import defaultdict
+from collections.abc import Callable
 
 from asgiref.local import Local
 from django.conf import settings
@@ -188,6 +193,70 @@ class RedisBuffer(BaseBuffer):
         return self.client.llen(self.key)
 
 
+class EventQueue:
+    """Bounded in-process queue of events written to the buffer in batches.
+
+    Events are put without blocking and rejected when the queue is full. A daemon
+    thread takes up to `batch_size` queued events at once and passes them to
+    `flush`, which is expected to write them with a single buffer call.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        batch_size: int,
+        flush: Callable[[dict[KEY_TYPE, list[bytes]]], None],
+    ):
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush = flush
+        self._queue: queue.Queue[tuple[KEY_TYPE, bytes]] = queue.Queue(max_size)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+
+    def put(self, key: KEY_TYPE, event: bytes) -> bool:
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait((key, event))
+        except queue.Full:
+            return False
+        return True
+
+    def get_batch(self, timeout: float | None = None) -> dict[KEY_TYPE, list[bytes]]:
+        """Wait for the next event and return it with other already queued events."""
+        events: dict[KEY_TYPE, list[bytes]] = defaultdict(list)
+        key, event = self._queue.get(timeout=timeout)
+        events[key].append(event)
+        for _i in range(self.batch_size - 1):
+            try:
+                key, event = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            events[key].append(event)
+        return events
+
+    def _ensure_worker(self):
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        with self._lock:
+            if self._pid == pid:
+                return
+            # Threads are not copied to forked processes, so each process needs
+            # its own queue and worker.
+            self._queue = queue.Queue(self.max_size)
+            self._thread = threading.Thread(
+                target=self._run, name="observability-event-queue", daemon=True
+            )
+            self._thread.start()
+            self._pid = pid
+
+    def _run(self):
+        while True:
+            self.flush(self.get_batch())
+
+
 def get_buffer(
     key: KEY_TYPE, connection_timeout=DEFAULT_CONNECTION_TIMEOUT
 ) -> BaseBuffer:
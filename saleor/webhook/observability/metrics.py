@@ -0,0 +1,19 @@
+from ...core.telemetry import MetricType, Scope, Unit, meter
+
+# Initialize metrics
+METRIC_OBSERVABILITY_DROPPED_EVENTS = meter.create_metric(
+    "saleor.observability.dropped_events",
+    scope=Scope.SERVICE,
+    type=MetricType.COUNTER,
+    unit=Unit.EVENT,
+    description="Number of observability events dropped before they were buffered.",
+)
+
+
+def record_dropped_events(count: int, reason: str) -> None:
+    meter.record(
+        METRIC_OBSERVABILITY_DROPPED_EVENTS,
+        count,
+        Unit.EVENT,
+        attributes={"reason": reason},
+    )
@@ -1,10 +1,11 @@
 import datetime
+import threading
 
 import pytest
 from django.utils import timezone
 from freezegun import freeze_time
 
-from ..buffers import RedisBuffer, get_buffer
+from ..buffers import EventQueue, RedisBuffer, get_buffer
 from ..exceptions import ConnectionNotConfigured
 from ..tests.conftest import BATCH_SIZE, BROKER_URL_HOST, KEY, MAX_SIZE
 
@@ -156,3 +157,69 @@ def test_pop_expired_events(buffer):
     with freeze_time(push_time + datetime.timedelta(seconds=buffer.timeout + 1)):
         popped_events = buffer.pop_events()
     assert popped_events == []
+
+
+def test_event_queue_flushes_events_in_batches():
+    # given
+    flushed = []
+    done = threading.Event()
+
+    def flush(events):
+        flushed.append(events)
+        if (
+            sum(len(key_events) for batch in flushed for key_events in batch.values())
+            == 3
+        ):
+            done.set()
+
+    event_queue = EventQueue(max_size=10, batch_size=BATCH_SIZE, flush=flush)
+
+    # when
+    assert event_queue.put(KEY, b"event-1")
+    assert event_queue.put(KEY, b"event-2")
+    assert event_queue.put("other-key", b"event-3")
+
+    # then
+    assert done.wait(timeout=5)
+    events = {}
+    for batch in flushed:
+        for key, key_events in batch.items():
+            events.setdefault(key, []).extend(key_events)
+    assert events == {KEY: [b"event-1", b"event-2"], "other-key": [b"event-3"]}
+
+
+def test_event_queue_drops_events_when_full():
+    # given
+    flush_started = threading.Event()
+    release_flush = threading.Event()
+
+    def flush(events):
+        flush_started.set()
+        release_flush.wait(timeout=5)
+
+    event_queue = EventQueue(max_size=1, batch_size=BATCH_SIZE, flush=flush)
+    assert event_queue.put(KEY, b"event-1")
+    assert flush_started.wait(timeout=5)
+
+    # when
+    queued = event_queue.put(KEY, b"event-2")
+    dropped = event_queue.put(KEY, b"event-3")
+    release_flush.set()
+
+    # then
+    assert queued is True
+    assert dropped is False
+
+
+def test_event_queue_get_batch():
+    # given
+    event_queue = EventQueue(max_size=10, batch_size=2, flush=lambda events: None)
+    for i in range(3):
+        event_queue._queue.put_nowait((KEY, f"event-{i}".encode()))
+
+    # when
+    batch = event_queue.get_batch()
+
+    # then
+    assert batch == {KEY: [b"event-0", b"event-1"]}
+    assert event_queue._queue.qsize() == 1
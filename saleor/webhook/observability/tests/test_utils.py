@@ -12,10 +12,12 @@ from ..payload_schema import JsonTruncText
 from ..payloads import CustomJsonEncoder
 from ..utils import (
     ApiCall,
+    get_buffer_name,
     get_webhooks,
     get_webhooks_clear_mem_cache,
     pop_events_with_remaining_size,
     put_event,
+    put_events_batch,
     report_api_call,
     report_event_delivery_attempt,
     report_gql_operation,
@@ -273,6 +275,51 @@ def test_put_event_catch_exceptions(patch_get_buffer, buffer, error):
     assert buffer.size() == 0
 
 
+@patch("saleor.webhook.observability.utils.get_event_queue")
+def test_put_event_with_event_queue(
+    mocked_get_event_queue, patch_get_buffer, buffer, event_data, settings
+):
+    # given
+    settings.OBSERVABILITY_EVENT_QUEUE_SIZE = 10
+
+    # when
+    put_event(lambda: event_data)
+
+    # then
+    mocked_get_event_queue.return_value.put.assert_called_once_with(
+        get_buffer_name(), event_data
+    )
+    assert buffer.size() == 0
+
+
+@patch("saleor.webhook.observability.utils.record_dropped_events")
+@patch("saleor.webhook.observability.utils.get_event_queue")
+def test_put_event_with_full_event_queue(
+    mocked_get_event_queue,
+    mocked_record_dropped_events,
+    patch_get_buffer,
+    event_data,
+    settings,
+):
+    # given
+    settings.OBSERVABILITY_EVENT_QUEUE_SIZE = 10
+    mocked_get_event_queue.return_value.put.return_value = False
+
+    # when
+    put_event(lambda: event_data)
+
+    # then
+    mocked_record_dropped_events.assert_called_once_with(1, "queue_full")
+
+
+def test_put_events_batch(patch_get_buffer, buffer, event_data):
+    # when
+    put_events_batch({buffer.key: [event_data, event_data]})
+
+    # then
+    assert buffer.size() == 2
+
+
 def test_pop_events_with_remaining_size(patch_get_buffer, buffer):
     payloads_count = BATCH_SIZE + (BATCH_SIZE // 2)
     payloads = [f"event-data-{i}".encode() for i in range(payloads_count)]
@@ -16,10 +16,12 @@ from graphql import GraphQLDocument
 from pytimeparse import parse
 
 from ...core.utils import get_domain
+from ...core.utils.cache import CacheDict
 from ..event_types import WebhookEventAsyncType
 from ..utils import get_webhooks_for_event
-from .buffers import get_buffer
+from .buffers import KEY_TYPE, EventQueue, get_buffer
 from .exceptions import TruncationError
+from .metrics import record_dropped_events
 from .payloads import generate_api_call_payload, generate_event_delivery_attempt_payload
 from .tracing import otel_trace
 
@@ -49,7 +51,7 @@ def get_buffer_name() -> str:
     return cache.make_key(BUFFER_KEY, version=2)
 
 
-_webhooks_mem_cache: dict[str, tuple[list[WebhookData], float]] = {}
+_webhooks_mem_cache: CacheDict = CacheDict(16, name="observability_webhooks")
 
 
 def get_webhooks_clear_mem_cache():
@@ -90,16 +92,52 @@ def task_next_retry_date(retry_error: "Retry") -> datetime.datetime | None:
     return None
 
 
+def put_events_batch(events: dict[KEY_TYPE, list[bytes]]):
+    events_count = sum(len(key_events) for key_events in events.values())
+    try:
+        with otel_trace("put_events", "buffer"):
+            dropped = get_buffer(get_buffer_name()).put_multi_key_events(events)
+    except Exception:
+        logger.exception("Observability events dropped.")
+        record_dropped_events(events_count, "error")
+        return
+    if dropped_count := sum(dropped.values()):
+        logger.warning(
+            "Observability buffer full, %s/%s events dropped.",
+            dropped_count,
+            events_count,
+        )
+        record_dropped_events(dropped_count, "buffer_full")
+
+
+@functools.cache
+def get_event_queue() -> EventQueue:
+    return EventQueue(
+        settings.OBSERVABILITY_EVENT_QUEUE_SIZE,
+        settings.OBSERVABILITY_BUFFER_BATCH_SIZE,
+        flush=put_events_batch,
+    )
+
+
 def put_event(generate_payload: Callable[[], bytes]):
     try:
         payload = generate_payload()
+        if settings.OBSERVABILITY_EVENT_QUEUE_SIZE:
+            # Don't wait for the buffer on the request path, the event is written
+            # by the queue worker or dropped under pressure.
+            if not get_event_queue().put(get_buffer_name(), payload):
+                record_dropped_events(1, "queue_full")
+            return
         with otel_trace("put_event", "buffer"):
             if get_buffer(get_buffer_name()).put_event(payload):
                 logger.warning("Observability buffer full, event dropped.")
+                record_dropped_events(1, "buffer_full")
     except TruncationError as err:
         logger.warning("Observability event dropped. %s", err, extra=err.extra)
+        record_dropped_events(1, "truncated")
     except Exception:
         logger.exception("Observability event dropped.")
+        record_dropped_events(1, "error")
 
 
 def pop_events_with_remaining_size() -> tuple[list[bytes], int]:
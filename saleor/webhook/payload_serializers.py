@@ -1,3 +1,4 @@
+import json
 from collections import OrderedDict
 from collections.abc import Iterable
 from typing import Any
@@ -35,6 +36,14 @@ class PythonSerializer(PythonBaseSerializer):
         return data
 
 
+class RawJSON(str):
+    """JSON encoded value written to the serialized payload as is.
+
+    Allows embedding payloads generated by other serializers without decoding and
+    encoding them again.
+    """
+
+
 class PayloadSerializer(JSONSerializer):
     def __init__(self, extra_model_fields=None):
         super().__init__()
@@ -44,6 +53,10 @@ class PayloadSerializer(JSONSerializer):
         self.obj_id_name = "id"
         self.pk_field_name = "id"
         self.dump_type_name = True
+        self._python_serializer = PythonSerializer(
+            extra_model_fields=self.extra_model_fields
+        )
+        self._python_objects: list[dict] | None = None
 
     def serialize(self, queryset, **options):
         self.additional_fields = options.pop("additional_fields", {})
@@ -63,6 +76,64 @@ class PayloadSerializer(JSONSerializer):
             **options,
         )
 
+    def to_python(self, queryset, **options) -> list[dict]:
+        """Serialize the objects to Python data instead of JSON.
+
+        Used for payloads that are embedded in other payloads.
+        """
+        self._python_objects = []
+        try:
+            self.serialize(queryset, **options)
+            return self._python_objects
+        finally:
+            self._python_objects = None
+
+    def end_object(self, obj):
+        data = self.get_dump_object(obj)
+        self._current = None
+        if self._python_objects is not None:
+            self._python_objects.append(
+                {
+                    key: json.loads(value) if isinstance(value, RawJSON) else value
+                    for key, value in data.items()
+                }
+            )
+            return
+
+        indent = self.options.get("indent")
+        if not self.first:
+            self.stream.write(",")
+            if not indent:
+                self.stream.write(" ")
+        if indent:
+            self.stream.write("\n")
+        self.write_dump_object(data, indent)
+
+    def write_dump_object(self, data: dict, indent):
+        json_kwargs = self.json_kwargs
+        raw_keys = [key for key, value in data.items() if isinstance(value, RawJSON)]
+        if not raw_keys:
+            json.dump(data, self.stream, **json_kwargs)
+            return
+        if indent:
+            for key in raw_keys:
+                data[key] = json.loads(data[key])
+            json.dump(data, self.stream, **json_kwargs)
+            return
+        # Write the object the same way as `json.dump` does with the default
+        # separators, but with the raw values as is.
+        self.stream.write("{")
+        for index, (key, value) in enumerate(data.items()):
+            if index:
+                self.stream.write(", ")
+            self.stream.write(json.dumps(key, **json_kwargs))
+            self.stream.write(": ")
+            if isinstance(value, RawJSON):
+                self.stream.write(value)
+            else:
+                json.dump(value, self.stream, **json_kwargs)
+        self.stream.write("}")
+
     def get_dump_object(self, obj):
         obj_id = graphene.Node.to_global_id(
             obj._meta.object_name, getattr(obj, self.pk_field_name)
@@ -73,7 +144,7 @@ class PayloadSerializer(JSONSerializer):
         data[self.obj_id_name] = obj_id
 
         # Evaluate and add the "additional fields"
-        python_serializer = PythonSerializer(extra_model_fields=self.extra_model_fields)
+        python_serializer = self._python_serializer
         for field_name, (qs, fields) in self.additional_fields.items():
             data_to_serialize = qs(obj)
             if not data_to_serialize:
@@ -5,6 +5,7 @@ from collections.abc import Iterable
 from dataclasses import asdict
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Optional, Union
+from uuid import UUID
 
 import graphene
 from django.db.models import F, QuerySet, Sum
@@ -40,10 +41,10 @@ from ..shipping.interface import ShippingMethodData
 from ..tax.models import TaxClassCountryRate
 from ..tax.utils import get_charge_taxes_for_order
 from ..thumbnail.models import Thumbnail
-from ..warehouse.models import Stock, Warehouse
+from ..warehouse.models import Allocation, Stock, Warehouse
 from . import traced_payload_generator
 from .event_types import WebhookEventAsyncType
-from .payload_serializers import PayloadSerializer
+from .payload_serializers import PayloadSerializer, RawJSON
 from .serializers import (
     serialize_checkout_lines,
     serialize_checkout_lines_for_tax_calculation,
@@ -159,17 +160,23 @@ def generate_metadata_updated_payload(
     )
 
 
-def prepare_order_lines_allocations_payload(line):
-    warehouse_id_quantity_allocated_map = list(
-        line.allocations.values(
-            "quantity_allocated", warehouse_id=F("stock__warehouse_id")
-        )
+def prepare_order_lines_allocations_payload(
+    lines: Iterable[OrderLine],
+) -> dict[UUID, list[dict]]:
+    """Return the allocations payload of the order lines, mapped by the line ID."""
+    allocations = Allocation.objects.filter(
+        order_line_id__in=[line.pk for line in lines]
+    ).values(
+        "order_line_id", "quantity_allocated", warehouse_id=F("stock__warehouse_id")
     )
-    for item in warehouse_id_quantity_allocated_map:
+    line_id_to_allocations: dict[UUID, list[dict]] = defaultdict(list)
+    for item in allocations:
+        line_id = item.pop("order_line_id")
         item["warehouse_id"] = graphene.Node.to_global_id(
             "Warehouse", item["warehouse_id"]
         )
-    return warehouse_id_quantity_allocated_map
+        line_id_to_allocations[line_id].append(item)
+    return line_id_to_allocations
 
 
 @allow_writer()
@@ -213,6 +220,8 @@ def generate_order_lines_payload(lines: Iterable[OrderLine]):
     for line in lines:
         quantize_price_fields(line, line_price_fields, line.currency)
 
+    line_id_to_allocations = prepare_order_lines_allocations_payload(lines)
+
     serializer = PayloadSerializer()
     return serializer.serialize(
         lines,
@@ -221,7 +230,7 @@ def generate_order_lines_payload(lines: Iterable[OrderLine]):
             "product_variant_id": (lambda line: line.product_variant_id),
             "total_price_net_amount": (lambda line: line.total_price.net.amount),
             "total_price_gross_amount": (lambda line: line.total_price.gross.amount),
-            "allocations": (lambda line: prepare_order_lines_allocations_payload(line)),
+            "allocations": (lambda line: line_id_to_allocations.get(line.pk, [])),
         },
     )
 
@@ -234,12 +243,11 @@ def _generate_collection_point_payload(warehouse: "Warehouse"):
         "click_and_collect_option",
         "is_private",
     )
-    collection_point_data = serializer.serialize(
+    return serializer.to_python(
         [warehouse],
         fields=collection_point_fields,
         additional_fields={"address": (lambda w: w.address, ADDRESS_FIELDS)},
-    )
-    return collection_point_data
+    )[0]
 
 
 def _generate_shipping_method_payload(shipping_method, channel):
@@ -256,7 +264,7 @@ def _generate_shipping_method_payload(shipping_method, channel):
     serializer = PayloadSerializer()
     shipping_method_fields = ("name", "type")
 
-    payload = serializer.serialize(
+    return serializer.to_python(
         [shipping_method],
         fields=shipping_method_fields,
         extra_dict_data={
@@ -266,9 +274,7 @@ def _generate_shipping_method_payload(shipping_method, channel):
                 shipping_method_channel_listing.currency,
             ),
         },
-    )
-
-    return json.loads(payload)[0]
+    )[0]
 
 
 @allow_writer()
@@ -278,6 +284,29 @@ def generate_order_payload(
     requestor: Optional["RequestorOrLazyObject"] = None,
     with_meta: bool = True,
 ):
+    serializer = PayloadSerializer()
+    return serializer.serialize(
+        [order], **_get_order_payload_options(order, requestor, with_meta)
+    )
+
+
+def _generate_order_data(
+    order: "Order",
+    requestor: Optional["RequestorOrLazyObject"] = None,
+    with_meta: bool = True,
+) -> dict:
+    """Return the order payload data, to be embedded in another payload."""
+    serializer = PayloadSerializer()
+    return serializer.to_python(
+        [order], **_get_order_payload_options(order, requestor, with_meta)
+    )[0]
+
+
+def _get_order_payload_options(
+    order: "Order",
+    requestor: Optional["RequestorOrLazyObject"],
+    with_meta: bool,
+) -> dict:
     serializer = PayloadSerializer()
     fulfillment_fields = (
         "status",
@@ -318,7 +347,7 @@ def generate_order_payload(
         fulfillments,
         fields=fulfillment_fields,
         extra_dict_data={
-            "lines": lambda f: json.loads(generate_fulfillment_lines_payload(f)),
+            "lines": lambda f: RawJSON(generate_fulfillment_lines_payload(f)),
             "created": lambda f: f.created_at,
         },
     )
@@ -330,14 +359,14 @@ def generate_order_payload(
         "user_email": order.get_customer_email(),
         "created": order.created_at,
         "original": graphene.Node.to_global_id("Order", order.original_id),
-        "lines": json.loads(generate_order_lines_payload(lines)),
-        "fulfillments": json.loads(fulfillments_data),
+        "lines": RawJSON(generate_order_lines_payload(lines)),
+        "fulfillments": RawJSON(fulfillments_data),
         "collection_point": (
-            json.loads(_generate_collection_point_payload(order.collection_point))[0]
+            _generate_collection_point_payload(order.collection_point)
             if order.collection_point
             else None
         ),
-        "payments": json.loads(_generate_order_payment_payload(payments)),
+        "payments": RawJSON(_generate_order_payment_payload(payments)),
         "shipping_method": _generate_shipping_method_payload(
             order.shipping_method, order.channel
         ),
@@ -347,18 +376,16 @@ def generate_order_payload(
             requestor_data=generate_requestor(requestor)
         )
 
-    order_data = serializer.serialize(
-        [order],
-        fields=ORDER_FIELDS,
-        additional_fields={
+    return {
+        "fields": ORDER_FIELDS,
+        "additional_fields": {
             "channel": (lambda o: o.channel, CHANNEL_FIELDS),
             "shipping_address": (lambda o: o.shipping_address, ADDRESS_FIELDS),
             "billing_address": (lambda o: o.billing_address, ADDRESS_FIELDS),
             "discounts": (lambda _: discounts, discount_fields),
         },
-        extra_dict_data=extra_dict_data,
-    )
-    return order_data
+        "extra_dict_data": extra_dict_data,
+    }
 
 
 def _generate_order_payment_payload(payments: Iterable["Payment"]):
@@ -576,9 +603,7 @@ def generate_checkout_payload(
             ),
             "lines": list(lines_dict_data),
             "collection_point": (
-                json.loads(
-                    _generate_collection_point_payload(checkout.collection_point)
-                )[0]
+                _generate_collection_point_payload(checkout.collection_point)
                 if checkout.collection_point
                 else None
             ),
@@ -750,12 +775,12 @@ def generate_product_payload(
                 for media_obj in product.media.all()
             ],
             "charge_taxes": _get_charge_taxes_for_product(product),
-            "channel_listings": json.loads(
+            "channel_listings": RawJSON(
                 serialize_product_channel_listing_payload(
                     product.channel_listings.all()
                 )
             ),
-            "variants": lambda x: json.loads(
+            "variants": lambda x: RawJSON(
                 generate_product_variant_payload(x, with_meta=False)
             ),
         },
@@ -869,7 +894,7 @@ def generate_product_variant_payload(
         "attributes": lambda v: serialize_variant_attributes(v),
         "product_id": lambda v: graphene.Node.to_global_id("Product", v.product_id),
         "media": lambda v: generate_product_variant_media_payload(v),
-        "channel_listings": lambda v: json.loads(
+        "channel_listings": lambda v: RawJSON(
             generate_product_variant_listings_payload(v.channel_listings.all())
         ),
     }
@@ -1007,10 +1032,8 @@ def generate_fulfillment_payload(
             "warehouse_address": (lambda f: warehouse.address, ADDRESS_FIELDS),
         },
         extra_dict_data={
-            "order": json.loads(
-                generate_order_payload(fulfillment.order, with_meta=False)
-            )[0],
-            "lines": json.loads(generate_fulfillment_lines_payload(fulfillment)),
+            "order": _generate_order_data(fulfillment.order, with_meta=False),
+            "lines": RawJSON(generate_fulfillment_lines_payload(fulfillment)),
             "meta": generate_meta(requestor_data=generate_requestor(requestor)),
         },
     )
@@ -1256,9 +1279,8 @@ def generate_excluded_shipping_methods_for_order_payload(
     order: "Order",
     available_shipping_methods: list[ShippingMethodData],
 ):
-    order_data = json.loads(generate_order_payload(order))[0]
     payload = {
-        "order": order_data,
+        "order": _generate_order_data(order),
         "shipping_methods": [
             _generate_payload_for_shipping_method(shipping_method)
             for shipping_method in available_shipping_methods
@@ -1463,9 +1485,7 @@ def generate_order_payload_for_tax_calculation(order: "Order"):
             "included_taxes_in_prices": prices_entered_with_tax,
             "shipping_amount": shipping_method_amount,
             "shipping_name": shipping_method_name,
-            "lines": json.loads(
-                _generate_order_lines_payload_for_tax_calculation(lines)
-            ),
+            "lines": RawJSON(_generate_order_lines_payload_for_tax_calculation(lines)),
         },
     )
     return order_data
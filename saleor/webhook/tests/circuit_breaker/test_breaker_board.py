@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 from django.core.exceptions import ImproperlyConfigured
 
@@ -159,6 +161,68 @@ def test_breaker_board_clear_state_for_app(
     assert changed_at == 0
 
 
+def test_breaker_board_reuses_cached_state(
+    settings, breaker_storage, app_with_webhook, success_response_function_mock
+):
+    # given
+    settings.BREAKER_BOARD_SYNC_EVENTS = ["shipping_list_methods_for_checkout"]
+    breaker_board = create_breaker_board(breaker_storage, state_cache_seconds=60)
+    app, webhook = app_with_webhook
+    wrapped_function_mock = breaker_board(success_response_function_mock)
+
+    # when
+    with patch.object(
+        breaker_storage,
+        "get_app_state_with_event_counts",
+        wraps=breaker_storage.get_app_state_with_event_counts,
+    ) as get_state_mock:
+        for _ in range(3):
+            wrapped_function_mock(
+                WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+                "",
+                webhook,
+                False,
+            )
+
+    # then
+    assert success_response_function_mock.call_count == 3
+    get_state_mock.assert_called_once_with(app.id, breaker_board.ttl_seconds)
+    _, _, counts = breaker_storage.get_app_state_with_event_counts(
+        app.id, breaker_board.ttl_seconds
+    )
+    assert counts == {"error": 0, "total": 3}
+
+
+def test_breaker_board_cached_open_state_skips_calls(
+    settings, breaker_storage, app_with_webhook, failed_response_function_mock
+):
+    # given
+    settings.BREAKER_BOARD_SYNC_EVENTS = ["shipping_list_methods_for_checkout"]
+    breaker_board = create_breaker_board(breaker_storage, state_cache_seconds=60)
+    app, webhook = app_with_webhook
+    wrapped_function_mock = breaker_board(failed_response_function_mock)
+
+    # when
+    with patch.object(
+        breaker_storage,
+        "get_app_state_with_event_counts",
+        wraps=breaker_storage.get_app_state_with_event_counts,
+    ) as get_state_mock:
+        for _ in range(3):
+            wrapped_function_mock(
+                WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+                "",
+                webhook,
+                False,
+            )
+
+    # then the breaker opened after the first failure and the state was read once
+    assert failed_response_function_mock.call_count == 1
+    get_state_mock.assert_called_once()
+    status, _ = breaker_storage.get_app_state(app.id)
+    assert status == CircuitBreakerState.OPEN
+
+
 def test_breaker_board_configuration_invalid_events(settings, breaker_storage):
     # given
     event_name = "invalid"
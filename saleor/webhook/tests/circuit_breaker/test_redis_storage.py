@@ -58,6 +58,49 @@ def test_register_event(breaker_storage):
         assert breaker_storage.get_event_count(APP_ID, NAME) == 2
 
 
+def test_register_events(breaker_storage):
+    # given
+    breaker_storage.set_app_state(APP_ID, CircuitBreakerState.HALF_OPEN, 100)
+    with freeze_time(datetime.datetime.fromtimestamp(NOW, tz=datetime.UTC)):
+        breaker_storage.register_events(APP_ID, ["error", "total"], TTL_SECONDS)
+
+    # when
+    with freeze_time(
+        datetime.datetime.fromtimestamp(NOW + TTL_SECONDS - 1, tz=datetime.UTC)
+    ):
+        state, changed_at, counts = breaker_storage.register_events(
+            APP_ID, ["total"], TTL_SECONDS
+        )
+
+    # then
+    assert state == CircuitBreakerState.HALF_OPEN
+    assert changed_at == 100
+    assert counts == {"error": 1, "total": 2}
+
+
+def test_get_app_state_with_event_counts_skips_expired_events(breaker_storage):
+    # given
+    with freeze_time(datetime.datetime.fromtimestamp(NOW, tz=datetime.UTC)):
+        breaker_storage.register_events(APP_ID, ["error", "total"], TTL_SECONDS)
+    with freeze_time(
+        datetime.datetime.fromtimestamp(NOW + TTL_SECONDS - 1, tz=datetime.UTC)
+    ):
+        breaker_storage.register_events(APP_ID, ["total"], TTL_SECONDS)
+
+    # when
+    with freeze_time(
+        datetime.datetime.fromtimestamp(NOW + TTL_SECONDS, tz=datetime.UTC)
+    ):
+        state, changed_at, counts = breaker_storage.get_app_state_with_event_counts(
+            APP_ID, TTL_SECONDS
+        )
+
+    # then
+    assert state == CircuitBreakerState.CLOSED
+    assert changed_at == 0
+    assert counts == {"error": 0, "total": 1}
+
+
 def test_get_app_state_does_not_crash_on_redis_error(breaker_not_connected_storage):
     status, changed_at = breaker_not_connected_storage.get_app_state(APP_ID)
     assert status == CircuitBreakerState.CLOSED
@@ -77,3 +120,14 @@ def test_register_event_does_not_crash_on_redis_error(
     breaker_not_connected_storage,
 ):
     breaker_not_connected_storage.register_event(APP_ID, NAME, 5)
+
+
+def test_register_events_does_not_crash_on_redis_error(
+    breaker_not_connected_storage,
+):
+    state, changed_at, counts = breaker_not_connected_storage.register_events(
+        APP_ID, [NAME], 5
+    )
+    assert state == CircuitBreakerState.CLOSED
+    assert changed_at == 0
+    assert counts == {"error": 0, "total": 0}
@@ -1,4 +1,8 @@
-from ..payload_serializers import PythonSerializer
+import json
+
+import graphene
+
+from ..payload_serializers import PayloadSerializer, PythonSerializer, RawJSON
 
 
 def test_python_serializer_extra_model_fields(product_with_single_variant):
@@ -32,3 +36,47 @@ def test_python_serializer_extra_model_fields_incorrect_fields(
     result = serializer.get_dump_object(annotated_variant)
     assert result["type"] == "ProductVariant"
     assert result["test_item"] == "test_value"
+
+
+def test_payload_serializer_raw_json_value(product_list):
+    # given
+    product = product_list[0]
+    nested_payload = PayloadSerializer().serialize(product_list, fields=["name"])
+
+    # when
+    raw_payload = PayloadSerializer().serialize(
+        [product],
+        fields=["name"],
+        extra_dict_data={"products": RawJSON(nested_payload)},
+    )
+    payload = PayloadSerializer().serialize(
+        [product],
+        fields=["name"],
+        extra_dict_data={"products": json.loads(nested_payload)},
+    )
+
+    # then
+    assert raw_payload == payload
+    assert json.loads(raw_payload)[0]["products"] == json.loads(nested_payload)
+
+
+def test_payload_serializer_to_python(product):
+    # given
+    serializer = PayloadSerializer()
+
+    # when
+    data = serializer.to_python(
+        [product],
+        fields=["name"],
+        extra_dict_data={"variants": RawJSON('[{"sku": "123"}]')},
+    )
+
+    # then
+    assert data == [
+        {
+            "type": "Product",
+            "id": graphene.Node.to_global_id("Product", product.id),
+            "variants": [{"sku": "123"}],
+            "name": product.name,
+        }
+    ]
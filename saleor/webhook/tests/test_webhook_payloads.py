@@ -45,6 +45,7 @@ from ..payloads import (
     generate_excluded_shipping_methods_for_checkout_payload,
     generate_excluded_shipping_methods_for_order_payload,
     generate_fulfillment_lines_payload,
+    generate_fulfillment_payload,
     generate_invoice_payload,
     generate_list_gateways_payload,
     generate_meta,
@@ -62,6 +63,7 @@ from ..payloads import (
     generate_thumbnail_payload,
     generate_transaction_action_request_payload,
     generate_translation_payload,
+    prepare_order_lines_allocations_payload,
 )
 from ..serializers import serialize_checkout_lines
 from ..transport.utils import from_payment_app_id
@@ -1674,6 +1676,15 @@ def test_generate_collection_point_payload(order_with_lines_for_cc):
     )
 
 
+def test_generate_fulfillment_payload_embeds_order_payload(fulfillment):
+    # when
+    payload = json.loads(generate_fulfillment_payload(fulfillment))[0]
+
+    # then
+    order_payload = generate_order_payload(fulfillment.order, with_meta=False)
+    assert payload["order"] == json.loads(order_payload)[0]
+
+
 def test_generate_sale_payload_no_previous_and_current_has_empty_catalogue_lists(
     promotion_converted_from_sale,
 ):
@@ -2553,9 +2564,9 @@ def test_generate_checkout_payload(
             ),
         },
         "lines": serialize_checkout_lines(checkout),
-        "collection_point": json.loads(
-            _generate_collection_point_payload(checkout.collection_point)
-        )[0],
+        "collection_point": _generate_collection_point_payload(
+            checkout.collection_point
+        ),
         "meta": generate_meta(requestor_data=generate_requestor(customer_user)),
         "warehouse_address": ANY,
     }
@@ -2869,3 +2880,27 @@ def test_generate_product_media_payload(product_media_image):
 
     # then
     assert payload == expected_payload
+
+
+def test_prepare_order_lines_allocations_payload(
+    order_with_lines, django_assert_num_queries
+):
+    # given
+    lines = list(order_with_lines.lines.all())
+    assert len(lines) > 1
+
+    # when
+    with django_assert_num_queries(1):
+        payload = prepare_order_lines_allocations_payload(lines)
+
+    # then
+    for line in lines:
+        assert payload[line.pk] == [
+            {
+                "quantity_allocated": allocation.quantity_allocated,
+                "warehouse_id": graphene.Node.to_global_id(
+                    "Warehouse", allocation.stock.warehouse_id
+                ),
+            }
+            for allocation in line.allocations.all()
+        ]
@@ -10,11 +10,13 @@ from .....checkout.calculations import fetch_checkout_data
 from .....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
 from .....core import EventDeliveryStatus
 from .....core.models import EventDelivery
+from .....webhook.models import Webhook
 from ....event_types import WebhookEventAsyncType
 from ....utils import get_webhooks_for_event
 from ..transport import (
     DeferredPayloadData,
     generate_deferred_payloads,
+    generate_payload_promise_from_subscription,
     trigger_webhooks_async,
 )
 
@@ -129,6 +131,72 @@ def test_generate_deferred_payload(
     assert call_kwargs["kwargs"]["event_delivery_id"] == delivery.pk
 
 
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.generate_payload_promise_from_subscription",
+    wraps=generate_payload_promise_from_subscription,
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.apply_async"
+)
+def test_generate_deferred_payload_shares_execution_for_equivalent_queries(
+    mocked_send_webhook_request_async,
+    mocked_generate_payload_promise,
+    checkout_with_item,
+    setup_checkout_webhooks,
+    staff_user,
+    fetch_kwargs,
+):
+    # given
+    checkout = checkout_with_item
+    fetch_checkout_data(**fetch_kwargs)
+    event_type = WebhookEventAsyncType.CHECKOUT_UPDATED
+    _, _, _, checkout_updated_webhook = setup_checkout_webhooks(event_type)
+
+    # same query of the same app, formatted differently
+    second_webhook = Webhook.objects.create(
+        name="Second checkout webhook",
+        app=checkout_updated_webhook.app,
+        target_url="http://127.0.0.1/test-2",
+        subscription_query=" ".join(
+            checkout_updated_webhook.subscription_query.split()
+        ),
+    )
+    deferred_payload_data = DeferredPayloadData(
+        model_name="checkout.checkout",
+        object_id=checkout.pk,
+        requestor_model_name="account.user",
+        requestor_object_id=staff_user.pk,
+        request_time=None,
+    )
+    deliveries = EventDelivery.objects.bulk_create(
+        [
+            EventDelivery(
+                event_type=event_type,
+                webhook=webhook,
+                status=EventDeliveryStatus.PENDING,
+            )
+            for webhook in [checkout_updated_webhook, second_webhook]
+        ]
+    )
+
+    # when
+    generate_deferred_payloads.delay(
+        event_delivery_ids=[delivery.pk for delivery in deliveries],
+        deferred_payload_data=asdict(deferred_payload_data),
+    )
+
+    # then
+    assert mocked_generate_payload_promise.call_count == 1
+    first_delivery, second_delivery = EventDelivery.objects.filter(
+        pk__in=[delivery.pk for delivery in deliveries]
+    ).order_by("pk")
+    assert first_delivery.payload_id
+    assert first_delivery.payload_id == second_delivery.payload_id
+    data = json.loads(first_delivery.payload.get_payload())
+    assert data["issuingPrincipal"]["email"] == staff_user.email
+    assert mocked_send_webhook_request_async.call_count == 2
+
+
 def test_generate_deferred_payload_model_pk_does_not_exist(
     checkout_with_item, setup_checkout_webhooks, staff_user, fetch_kwargs
 ):
@@ -1,8 +1,15 @@
+import datetime
 from unittest.mock import ANY, patch
 
+from django.core.cache import cache
+from django.utils import timezone
+
 from .....core.models import EventDelivery, EventDeliveryAttempt, EventDeliveryStatus
 from ..transport import (
+    WEBHOOK_ASYNC_RETRY_DELAYS,
     WebhookResponse,
+    get_app_delivery_worker_lock_key,
+    schedule_deliveries,
     send_webhooks_async_for_app,
 )
 
@@ -18,6 +25,7 @@ def test_send_webhooks_async_for_app(
     mock_send_webhook_using_scheme_method,
     app,
     event_delivery,
+    settings,
 ):
     # given
     assert EventDelivery.objects.filter(status=EventDeliveryStatus.PENDING).exists()
@@ -31,7 +39,15 @@ def test_send_webhooks_async_for_app(
     # then
     mock_send_webhook_using_scheme_method.assert_called_once()
     mock_send_webhooks_async_for_app_apply_async.assert_called_once_with(
-        kwargs={"app_id": app.id, "telemetry_context": ANY},
+        kwargs={
+            "app_id": app.id,
+            "telemetry_context": ANY,
+            "queue": settings.WEBHOOK_CELERY_QUEUE_NAME,
+            "message_group_id": ANY,
+        },
+        queue=settings.WEBHOOK_CELERY_QUEUE_NAME,
+        MessageGroupId=ANY,
+        countdown=None,
     )
 
     # deliveries should be cleared
@@ -98,13 +114,8 @@ def test_send_webhooks_async_for_app_no_payload(
     deliveries = EventDelivery.objects.all()
     assert len(deliveries) == 1
     assert deliveries[0].status == EventDeliveryStatus.PENDING
-    assert EventDeliveryAttempt.objects.filter(
-        status=EventDeliveryStatus.FAILED
-    ).exists()
-
-    mock_send_webhooks_async_for_app_apply_async.assert_called_once_with(
-        kwargs={"app_id": app.id, "telemetry_context": ANY},
-    )
+    assert not EventDeliveryAttempt.objects.exists()
+    mock_send_webhooks_async_for_app_apply_async.assert_not_called()
 
 
 @patch(
@@ -118,6 +129,7 @@ def test_send_webhooks_async_for_app_failed_status(
     mock_send_webhook_using_scheme_method,
     app,
     event_delivery,
+    settings,
 ):
     # given
     assert EventDelivery.objects.filter(status=EventDeliveryStatus.PENDING).exists()
@@ -138,7 +150,15 @@ def test_send_webhooks_async_for_app_failed_status(
     ).exists()
 
     mock_send_webhooks_async_for_app_apply_async.assert_called_once_with(
-        kwargs={"app_id": app.id, "telemetry_context": ANY},
+        kwargs={
+            "app_id": app.id,
+            "telemetry_context": ANY,
+            "queue": settings.WEBHOOK_CELERY_QUEUE_NAME,
+            "message_group_id": ANY,
+        },
+        queue=settings.WEBHOOK_CELERY_QUEUE_NAME,
+        MessageGroupId=ANY,
+        countdown=None,
     )
 
 
@@ -153,6 +173,7 @@ def test_send_multiple_webhooks_async_for_app(
     mock_send_webhook_using_scheme_method,
     app,
     event_deliveries,
+    settings,
 ):
     # given
     assert len(EventDelivery.objects.filter(status=EventDeliveryStatus.PENDING)) == 3
@@ -166,7 +187,15 @@ def test_send_multiple_webhooks_async_for_app(
     # then
     assert mock_send_webhook_using_scheme_method.call_count == 3
     mock_send_webhooks_async_for_app_apply_async.assert_called_once_with(
-        kwargs={"app_id": app.id, "telemetry_context": ANY},
+        kwargs={
+            "app_id": app.id,
+            "telemetry_context": ANY,
+            "queue": settings.WEBHOOK_CELERY_QUEUE_NAME,
+            "message_group_id": ANY,
+        },
+        queue=settings.WEBHOOK_CELERY_QUEUE_NAME,
+        MessageGroupId=ANY,
+        countdown=None,
     )
 
     # deliveries should be cleared
@@ -184,6 +213,7 @@ def test_send_webhooks_async_for_app_last_retry_failed(
     mock_send_webhook_using_scheme_method,
     app,
     event_delivery,
+    settings,
 ):
     # given
     assert EventDelivery.objects.filter(status=EventDeliveryStatus.PENDING).exists()
@@ -195,6 +225,9 @@ def test_send_webhooks_async_for_app_last_retry_failed(
             for _ in range(5)
         ]
     )
+    EventDeliveryAttempt.objects.update(
+        created_at=timezone.now() - datetime.timedelta(hours=1)
+    )
     mock_send_webhook_using_scheme_method.return_value = WebhookResponse(
         content="", status=EventDeliveryStatus.FAILED
     )
@@ -212,5 +245,187 @@ def test_send_webhooks_async_for_app_last_retry_failed(
     )
 
     mock_send_webhooks_async_for_app_apply_async.assert_called_once_with(
-        kwargs={"app_id": app.id, "telemetry_context": ANY},
+        kwargs={
+            "app_id": app.id,
+            "telemetry_context": ANY,
+            "queue": settings.WEBHOOK_CELERY_QUEUE_NAME,
+            "message_group_id": ANY,
+        },
+        queue=settings.WEBHOOK_CELERY_QUEUE_NAME,
+        MessageGroupId=ANY,
+        countdown=None,
+    )
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.apply_async"
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhooks_async_for_app.apply_async"
+)
+def test_schedule_deliveries_batch_delivery_schedules_worker_once_per_app(
+    mock_send_webhooks_async_for_app_apply_async,
+    mock_send_webhook_request_async_apply_async,
+    settings,
+    app,
+    event_deliveries,
+):
+    # given
+    settings.WEBHOOK_ASYNC_BATCH_DELIVERY = True
+    cache.delete(get_app_delivery_worker_lock_key(app.id))
+    deliveries = list(EventDelivery.objects.select_related("webhook__app"))
+
+    # when
+    schedule_deliveries(deliveries, {})
+    schedule_deliveries(deliveries, {})
+
+    # then
+    mock_send_webhooks_async_for_app_apply_async.assert_called_once_with(
+        kwargs={
+            "app_id": app.id,
+            "telemetry_context": {},
+            "queue": settings.WEBHOOK_CELERY_QUEUE_NAME,
+            "message_group_id": ANY,
+        },
+        queue=settings.WEBHOOK_CELERY_QUEUE_NAME,
+        MessageGroupId=ANY,
+        countdown=None,
+    )
+    mock_send_webhook_request_async_apply_async.assert_not_called()
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.apply_async"
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhooks_async_for_app.apply_async"
+)
+def test_schedule_deliveries_task_per_delivery(
+    mock_send_webhooks_async_for_app_apply_async,
+    mock_send_webhook_request_async_apply_async,
+    settings,
+    event_deliveries,
+):
+    # given
+    settings.WEBHOOK_ASYNC_BATCH_DELIVERY = False
+    deliveries = list(EventDelivery.objects.select_related("webhook__app"))
+
+    # when
+    schedule_deliveries(deliveries, {})
+
+    # then
+    assert mock_send_webhook_request_async_apply_async.call_count == 3
+    mock_send_webhooks_async_for_app_apply_async.assert_not_called()
+
+
+def test_send_webhooks_async_for_app_no_deliveries_releases_lock(app):
+    # given
+    lock_key = get_app_delivery_worker_lock_key(app.id)
+    cache.set(lock_key, True)
+
+    # when
+    send_webhooks_async_for_app(app_id=app.id)
+
+    # then
+    assert cache.get(lock_key) is None
+
+
+@patch("saleor.webhook.transport.asynchronous.transport.HTTPClient")
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhooks_async_for_app.apply_async"
+)
+def test_send_webhooks_async_for_app_uses_shared_session(
+    mock_send_webhooks_async_for_app_apply_async,
+    mock_send_webhook_using_scheme_method,
+    mock_http_client,
+    app,
+    event_deliveries,
+):
+    # given
+    session = mock_http_client.get_session.return_value.__enter__.return_value
+    mock_send_webhook_using_scheme_method.return_value = WebhookResponse(
+        content="", status=EventDeliveryStatus.SUCCESS
+    )
+
+    # when
+    send_webhooks_async_for_app(app_id=app.id)
+
+    # then
+    mock_http_client.get_session.assert_called_once_with()
+    assert mock_send_webhook_using_scheme_method.call_count == 3
+    for call in mock_send_webhook_using_scheme_method.call_args_list:
+        assert call.kwargs["session"] is session
+    assert not EventDelivery.objects.exists()
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhooks_async_for_app.apply_async"
+)
+def test_send_webhooks_async_for_app_waits_for_retry_delay(
+    mock_send_webhooks_async_for_app_apply_async,
+    mock_send_webhook_using_scheme_method,
+    settings,
+    app,
+    event_delivery,
+):
+    # given
+    EventDeliveryAttempt.objects.create(
+        delivery=event_delivery, status=EventDeliveryStatus.FAILED
+    )
+    lock_key = get_app_delivery_worker_lock_key(app.id)
+    cache.delete(lock_key)
+
+    # when
+    send_webhooks_async_for_app(
+        app_id=app.id,
+        queue="webhooks",
+        message_group_id="group",
+    )
+
+    # then
+    mock_send_webhook_using_scheme_method.assert_not_called()
+    mock_send_webhooks_async_for_app_apply_async.assert_called_once_with(
+        kwargs={
+            "app_id": app.id,
+            "telemetry_context": ANY,
+            "queue": "webhooks",
+            "message_group_id": "group",
+        },
+        queue="webhooks",
+        MessageGroupId="group",
+        countdown=WEBHOOK_ASYNC_RETRY_DELAYS[0].total_seconds(),
     )
+    assert cache.get(lock_key)
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhooks_async_for_app.apply_async"
+)
+def test_send_webhooks_async_for_app_inactive_webhook(
+    mock_send_webhooks_async_for_app_apply_async,
+    mock_send_webhook_using_scheme_method,
+    app,
+    event_delivery,
+):
+    # given
+    webhook = event_delivery.webhook
+    webhook.is_active = False
+    webhook.save(update_fields=["is_active"])
+
+    # when
+    send_webhooks_async_for_app(app_id=app.id)
+
+    # then
+    mock_send_webhook_using_scheme_method.assert_not_called()
+    event_delivery.refresh_from_db()
+    assert event_delivery.status == EventDeliveryStatus.FAILED
+    mock_send_webhooks_async_for_app_apply_async.assert_called_once()
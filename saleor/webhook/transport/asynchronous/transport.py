@@ -1,8 +1,10 @@
+import contextvars
 import datetime
 import json
 import logging
 from collections import defaultdict
 from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
@@ -11,12 +13,15 @@ from celery import group
 from celery.utils.log import get_task_logger
 from django.apps import apps
 from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
 from opentelemetry.trace import StatusCode
 
+from ....app.models import App
 from ....celeryconf import app
 from ....core import EventDeliveryStatus
 from ....core.db.connection import allow_writer
+from ....core.http_client import HTTPClient
 from ....core.models import EventDelivery, EventPayload
 from ....core.telemetry import (
     TelemetryTaskContext,
@@ -26,6 +31,7 @@ from ....core.telemetry import (
 from ....core.tracing import webhooks_otel_trace
 from ....core.utils import get_domain
 from ....core.utils.url import sanitize_url_for_logging
+from ....graphql.core.context import SaleorContext
 from ....graphql.core.dataloaders import DataLoader
 from ....graphql.webhook.subscription_payload import (
     generate_payload_from_subscription,
@@ -34,6 +40,7 @@ from ....graphql.webhook.subscription_payload import (
     initialize_request,
 )
 from ....graphql.webhook.subscription_types import WEBHOOK_TYPES_MAP
+from ....graphql.webhook.utils import get_normalized_subscription_query_hash
 from ... import observability
 from ...event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ...metrics import (
@@ -65,6 +72,8 @@ from ..utils import (
 )
 
 if TYPE_CHECKING:
+    from requests import Session
+
     from ....webhook.models import Webhook
 
 
@@ -76,6 +85,14 @@ MAX_WEBHOOK_EVENTS_IN_DB_BULK = 100
 
 MAX_WEBHOOK_RETRIES = 5
 WEBHOOK_ASYNC_BATCH_SIZE = 100
+# Expiry of the app delivery worker lock, refreshed with every processed batch.
+WEBHOOK_ASYNC_APP_LOCK_TIMEOUT = 600
+# Delays before the app delivery worker retries a failed delivery, doubled after
+# each attempt like the backoff of `send_webhook_request_async` retries.
+WEBHOOK_ASYNC_RETRY_DELAYS = [
+    datetime.timedelta(seconds=10 * 2**attempt)
+    for attempt in range(MAX_WEBHOOK_RETRIES)
+]
 
 
 @dataclass
@@ -432,23 +449,9 @@ def trigger_webhooks_async_for_multiple_objects(
             },
             bind=True,
         )
-    domain = get_domain()
-    for delivery in deliveries:
-        app = delivery.webhook.app
-        message_group_id = f"{domain}:{app.identifier or app.id}"
-        # TODO: switch to new `send_webhooks_async_for_app` task when we have
-        # deduplication mechanism in place.
-        send_webhook_request_async.apply_async(
-            kwargs={
-                "event_delivery_id": delivery.pk,
-                "telemetry_context": get_task_context().to_dict(),
-            },
-            queue=get_queue_name_for_webhook(
-                delivery.webhook,
-                default_queue=queue or settings.WEBHOOK_CELERY_QUEUE_NAME,
-            ),
-            MessageGroupId=message_group_id,  # for AWS SQS fair queues
-        )
+    schedule_deliveries(
+        deliveries, get_task_context().to_dict(), send_webhook_queue=queue
+    )
 
 
 def trigger_webhooks_async(
@@ -532,36 +535,57 @@ def generate_deferred_payloads(
     event_payloads_data = []
     event_deliveries_for_bulk_update = []
 
+    # Dataloaders are bound to a request, so subscriptions of the same app and
+    # event run with a single request to share the dataloaders cache.
+    requests_by_app: dict[tuple[str, int], SaleorContext] = {}
+
+    # The payload depends only on the event, the app (permissions, app-specific
+    # fields) and the subscription query, so webhooks of the same app with
+    # equivalent queries share a single execution and a single payload.
+    event_payloads_by_query: dict[tuple[str, int, str], EventPayload | None] = {}
+
     for delivery in deliveries:
         event_type = delivery.event_type
         webhook = delivery.webhook
         if not webhook.subscription_query:
             continue
 
-        request = initialize_request(
-            requestor,
-            event_type in WebhookEventSyncType.ALL,
-            event_type=event_type,
-            allow_replica=True,
-            request_time=args_obj.request_time,
-        )
-        data_promise = generate_payload_promise_from_subscription(
-            event_type=event_type,
-            subscribable_object=subscribable_object,
-            subscription_query=webhook.subscription_query,
-            request=request,
-            app=webhook.app,
+        query_key = (
+            event_type,
+            webhook.app_id,
+            get_normalized_subscription_query_hash(webhook.subscription_query),
         )
-
-        if data_promise:
-            data = data_promise.get()
-            if data:
-                data_json = json.dumps({**data})
-                event_payloads_data.append(data_json)
-                event_payload = EventPayload()
-                event_payloads.append(event_payload)
-                delivery.payload = event_payload
-                event_deliveries_for_bulk_update.append(delivery)
+        if query_key not in event_payloads_by_query:
+            event_payloads_by_query[query_key] = None
+            request_key = (event_type, webhook.app_id)
+            request = requests_by_app.get(request_key)
+            if request is None:
+                request = initialize_request(
+                    requestor,
+                    event_type in WebhookEventSyncType.ALL,
+                    event_type=event_type,
+                    allow_replica=True,
+                    request_time=args_obj.request_time,
+                )
+                requests_by_app[request_key] = request
+            data_promise = generate_payload_promise_from_subscription(
+                event_type=event_type,
+                subscribable_object=subscribable_object,
+                subscription_query=webhook.subscription_query,
+                request=request,
+                app=webhook.app,
+            )
+            if data_promise:
+                data = data_promise.get()
+                if data:
+                    event_payloads_data.append(json.dumps({**data}))
+                    event_payload = EventPayload()
+                    event_payloads.append(event_payload)
+                    event_payloads_by_query[query_key] = event_payload
+
+        if event_payload := event_payloads_by_query[query_key]:
+            delivery.payload = event_payload
+            event_deliveries_for_bulk_update.append(delivery)
 
     if event_deliveries_for_bulk_update:
         with allow_writer():
@@ -572,17 +596,42 @@ def generate_deferred_payloads(
                 EventDelivery.objects.bulk_update(
                     event_deliveries_for_bulk_update, ["payload"]
                 )
+    # Trigger webhook delivery tasks when the payloads are ready.
+    schedule_deliveries(
+        event_deliveries_for_bulk_update,
+        telemetry_context.to_dict(),
+        send_webhook_queue=send_webhook_queue,
+    )
+
+
+def schedule_deliveries(
+    deliveries: list[EventDelivery],
+    telemetry_context: dict,
+    send_webhook_queue: str | None = None,
+):
+    """Schedule sending of the event deliveries.
+
+    With `WEBHOOK_ASYNC_BATCH_DELIVERY` enabled, a single worker task is scheduled
+    for each app, otherwise each delivery is sent by a separate task.
+    """
     domain = get_domain()
-    for delivery in event_deliveries_for_bulk_update:
-        # Trigger webhook delivery task when the payload is ready.
+    if settings.WEBHOOK_ASYNC_BATCH_DELIVERY:
+        apps_to_schedule = {
+            delivery.webhook.app_id: delivery.webhook.app for delivery in deliveries
+        }
+        for app in apps_to_schedule.values():
+            schedule_webhooks_async_for_app(
+                app, telemetry_context, queue=send_webhook_queue, domain=domain
+            )
+        return
+
+    for delivery in deliveries:
         app = delivery.webhook.app
         message_group_id = f"{domain}:{app.identifier or app.id}"
-        # TODO: switch to new `send_webhooks_async_for_app` task when we have
-        # deduplication mechanism in place.
         send_webhook_request_async.apply_async(
             kwargs={
                 "event_delivery_id": delivery.pk,
-                "telemetry_context": telemetry_context.to_dict(),
+                "telemetry_context": telemetry_context,
             },
             queue=get_queue_name_for_webhook(
                 delivery.webhook,
@@ -592,6 +641,61 @@ def generate_deferred_payloads(
         )
 
 
+def get_app_delivery_worker_lock_key(app_id: int) -> str:
+    return f"webhooks-async-app-{app_id}-worker"
+
+
+def get_app_message_group_id(app: App, domain: str) -> str:
+    return f"{domain}:{app.identifier or app.id}"
+
+
+def schedule_webhooks_async_for_app(
+    app: App,
+    telemetry_context: dict,
+    queue: str | None = None,
+    domain: str | None = None,
+):
+    """Schedule the delivery worker of the app unless it is already scheduled.
+
+    The lock is held by the worker until there are no pending deliveries left, so
+    at most one worker sends deliveries of the app at a time.
+    """
+    lock_key = get_app_delivery_worker_lock_key(app.id)
+    if not cache.add(lock_key, True, timeout=WEBHOOK_ASYNC_APP_LOCK_TIMEOUT):
+        return
+    apply_webhooks_async_for_app(
+        app.id,
+        telemetry_context,
+        queue=queue or settings.WEBHOOK_CELERY_QUEUE_NAME,
+        message_group_id=get_app_message_group_id(app, domain or get_domain()),
+    )
+
+
+def apply_webhooks_async_for_app(
+    app_id: int,
+    telemetry_context: dict,
+    queue: str,
+    message_group_id: str,
+    countdown: float | None = None,
+):
+    """Send the delivery worker task of the app.
+
+    The queue and the message group are passed on to the task, so the worker
+    schedules its next batch the same way.
+    """
+    send_webhooks_async_for_app.apply_async(
+        kwargs={
+            "app_id": app_id,
+            "telemetry_context": telemetry_context,
+            "queue": queue,
+            "message_group_id": message_group_id,
+        },
+        queue=queue,
+        MessageGroupId=message_group_id,  # for AWS SQS fair queues
+        countdown=countdown,
+    )
+
+
 @app.task(
     queue=settings.WEBHOOK_CELERY_QUEUE_NAME,
     bind=True,
@@ -618,9 +722,7 @@ def send_webhook_request_async(
     if not delivery.payload:
         response.content = f"Event delivery id: %{event_delivery_id}r has no payload."
     else:
-        data = delivery.payload.get_payload()
-        # Covert payload to bytes if it's not already.
-        data = data if isinstance(data, bytes) else data.encode("utf-8")
+        data = delivery.payload.get_payload_bytes()
         # Count payload size in bytes.
         payload_size = len(data)
 
@@ -669,6 +771,39 @@ def send_webhook_request_async(
     clear_successful_delivery(delivery)
 
 
+def _send_delivery_payload(
+    delivery: EventDelivery,
+    data: bytes,
+    domain: str,
+    session: "Session",
+    span_links,
+) -> WebhookResponse:
+    webhook = delivery.webhook
+    with webhooks_otel_trace(
+        delivery.event_type,
+        len(data),
+        app=webhook.app,
+        span_links=span_links,
+    ) as span:
+        try:
+            response = send_webhook_using_scheme_method(
+                webhook.target_url,
+                domain,
+                webhook.secret_key,
+                delivery.event_type,
+                data,
+                webhook.custom_headers,
+                session=session,
+            )
+        except ValueError as e:
+            response = WebhookResponse(
+                content=str(e), status=EventDeliveryStatus.FAILED
+            )
+        if response.status == EventDeliveryStatus.FAILED:
+            span.set_status(StatusCode.ERROR)
+    return response
+
+
 @app.task(
     queue=settings.WEBHOOK_CELERY_QUEUE_NAME,
     bind=True,
@@ -679,85 +814,126 @@ def send_webhooks_async_for_app(
     self,
     app_id,
     telemetry_context: TelemetryTaskContext,
+    queue: str | None = None,
+    message_group_id: str | None = None,
 ) -> None:
+    """Send a batch of pending deliveries of the app and schedule the next batch.
+
+    Requests are sent concurrently over a shared session, which reuses connections
+    to the same host. Attempts and delivery statuses are saved in bulk. Failed
+    deliveries are retried after `WEBHOOK_ASYNC_RETRY_DELAYS`.
+    """
+    lock_key = get_app_delivery_worker_lock_key(app_id)
     domain = get_domain()
-    deliveries = get_deliveries_for_app(app_id, WEBHOOK_ASYNC_BATCH_SIZE)
+    queue = queue or settings.WEBHOOK_CELERY_QUEUE_NAME
+    if message_group_id is None:
+        app_instance = App.objects.filter(pk=app_id).first()
+        if not app_instance:
+            cache.delete(lock_key)
+            return
+        message_group_id = get_app_message_group_id(app_instance, domain)
+    deliveries, inactive_delivery_ids = get_deliveries_for_app(
+        app_id, WEBHOOK_ASYNC_BATCH_SIZE, WEBHOOK_ASYNC_RETRY_DELAYS
+    )
 
-    if not deliveries:
+    if not deliveries and not inactive_delivery_ids:
+        cache.delete(lock_key)
+        # Deliveries waiting for a retry, or created while the lock was held, did
+        # not schedule the worker.
+        pending_deliveries = EventDelivery.objects.filter(
+            webhook__app_id=app_id,
+            status=EventDeliveryStatus.PENDING,
+            payload__isnull=False,
+        )
+        if pending_deliveries.exists() and cache.add(
+            lock_key, True, timeout=WEBHOOK_ASYNC_APP_LOCK_TIMEOUT
+        ):
+            apply_webhooks_async_for_app(
+                app_id,
+                telemetry_context.to_dict(),
+                queue=queue,
+                message_group_id=message_group_id,
+                countdown=WEBHOOK_ASYNC_RETRY_DELAYS[0].total_seconds(),
+            )
         return
+    cache.set(lock_key, True, timeout=WEBHOOK_ASYNC_APP_LOCK_TIMEOUT)
 
     attempts_for_deliveries = create_attempts_for_deliveries(
         deliveries, self.request.id
     )
-    failed_deliveries_attempts = []
-    successful_deliveries = []
+    payloads: dict[int, bytes] = {}
+    for delivery_id, delivery_with_count in deliveries.items():
+        delivery = delivery_with_count.delivery
+        payloads[delivery_id] = delivery.payload.get_payload_bytes()
+        if delivery_with_count.count == 0:
+            record_first_delivery_attempt_delay(delivery)
 
+    responses: dict[int, WebhookResponse] = {}
+    if payloads:
+        with (
+            HTTPClient.get_session() as session,
+            ThreadPoolExecutor(
+                max_workers=min(
+                    settings.WEBHOOK_ASYNC_DELIVERY_CONCURRENCY, len(payloads)
+                )
+            ) as executor,
+        ):
+            futures = {
+                delivery_id: executor.submit(
+                    # Each request runs in a copy of the current context to keep
+                    # the tracing context of the task.
+                    contextvars.copy_context().run,
+                    _send_delivery_payload,
+                    deliveries[delivery_id].delivery,
+                    data,
+                    domain,
+                    session,
+                    telemetry_context.links,
+                )
+                for delivery_id, data in payloads.items()
+            }
+            for delivery_id, future in futures.items():
+                responses[delivery_id] = future.result()
+
+    failed_deliveries_attempts = []
+    processed_deliveries = []
     for delivery_id, delivery_with_count in deliveries.items():
         delivery = delivery_with_count.delivery
-        attempt_count = delivery_with_count.count
         attempt = attempts_for_deliveries[delivery_id]
-
+        response = responses[delivery_id]
         webhook = delivery.webhook
 
-        try:
-            if not delivery.payload:
-                raise ValueError(f"Event delivery id: {delivery_id} has no payload.")
-            data = delivery.payload.get_payload()
-            # Convert payload to bytes if it's not already.
-            data = data if isinstance(data, bytes) else data.encode("utf-8")
-            # Count payload size in bytes.
-            payload_size = len(data)
-
-            if attempt_count == 0:
-                record_first_delivery_attempt_delay(delivery)
-            with webhooks_otel_trace(
+        record_external_request(
+            webhook.target_url, response, len(payloads[delivery_id])
+        )
+        record_async_webhooks_count(delivery, response.status)
+        # update attempt without save, failed attempts are saved in bulk
+        attempt_update(attempt, response, with_save=False)
+        if response.status == EventDeliveryStatus.SUCCESS:
+            task_logger.info(
+                "[Webhook ID:%r] Payload sent to %r for event %r. Delivery id: %r",
+                webhook.id,
+                sanitize_url_for_logging(webhook.target_url),
                 delivery.event_type,
-                payload_size,
-                app=webhook.app,
-                span_links=telemetry_context.links,
-            ):
-                response = send_webhook_using_scheme_method(
-                    webhook.target_url,
-                    domain,
-                    webhook.secret_key,
-                    delivery.event_type,
-                    data,
-                    webhook.custom_headers,
-                )
-
-            record_async_webhooks_count(delivery, response.status)
-            if response.status == EventDeliveryStatus.FAILED:
-                attempt_update(attempt, response, with_save=False)
-                failed_deliveries_attempts.append((delivery, attempt, attempt_count))
-            elif response.status == EventDeliveryStatus.SUCCESS:
-                task_logger.info(
-                    "[Webhook ID:%r] Payload sent to %r for event %r. Delivery id: %r",
-                    webhook.id,
-                    sanitize_url_for_logging(webhook.target_url),
-                    delivery.event_type,
-                    delivery.id,
-                )
-                delivery.status = EventDeliveryStatus.SUCCESS
-                # update attempt without save to provide proper data in observability
-                attempt_update(attempt, response, with_save=False)
-        except ValueError as e:
-            response = WebhookResponse(
-                content=str(e), status=EventDeliveryStatus.FAILED
+                delivery.id,
+            )
+            delivery.status = EventDeliveryStatus.SUCCESS
+        else:
+            failed_deliveries_attempts.append(
+                (delivery, attempt, delivery_with_count.count)
             )
-            attempt_update(attempt, response, with_save=False)
-            failed_deliveries_attempts.append((delivery, attempt, attempt_count))
 
         observability.report_event_delivery_attempt(attempt)
-        successful_deliveries.append(delivery)
+        processed_deliveries.append(delivery)
 
     process_failed_deliveries(failed_deliveries_attempts, MAX_WEBHOOK_RETRIES)
-    clear_successful_deliveries(successful_deliveries)
+    clear_successful_deliveries(processed_deliveries)
 
-    send_webhooks_async_for_app.apply_async(
-        kwargs={
-            "app_id": app_id,
-            "telemetry_context": telemetry_context.to_dict(),
-        },
+    apply_webhooks_async_for_app(
+        app_id,
+        telemetry_context.to_dict(),
+        queue=queue,
+        message_group_id=message_group_id,
     )
 
 
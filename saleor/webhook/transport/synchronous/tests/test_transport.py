@@ -1,18 +1,24 @@
+import uuid
 from unittest.mock import MagicMock, patch
 
 import pytest
+from django.core.cache import cache
 from opentelemetry.trace import StatusCode
 
 from .....core.models import EventDeliveryStatus
 from .....core.telemetry import set_global_attributes
 from .....tests.utils import get_metric_data_point
+from ....event_types import WebhookEventSyncType
 from ...metrics import (
     METRIC_EXTERNAL_REQUEST_BODY_SIZE,
     METRIC_EXTERNAL_REQUEST_COUNT,
     METRIC_EXTERNAL_REQUEST_DURATION,
 )
-from ...utils import WebhookResponse
-from ..transport import _send_webhook_request_sync
+from ...utils import WebhookResponse, generate_cache_key_for_webhook
+from ..transport import (
+    _send_webhook_request_sync,
+    trigger_webhook_sync_if_not_cached,
+)
 
 
 @patch("saleor.webhook.transport.synchronous.transport.send_webhook_using_http")
@@ -257,3 +263,114 @@ def test_send_webhook_request_sync_record_external_request_with_unknown_webhook_
     assert external_request_content_length.attributes == attributes
     assert external_request_content_length.count == 1
     assert external_request_content_length.sum == payload_size
+
+
+def _get_cache_key(cache_data, webhook, event_type):
+    return generate_cache_key_for_webhook(
+        cache_data, webhook.target_url, event_type, webhook.app_id
+    )
+
+
+@patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_releases_lock(
+    mocked_trigger_webhook_sync, webhook, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_CACHE_STALE_TTL = 10
+    event_type = WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT
+    cache_data = {"id": str(uuid.uuid4())}
+    cache_key = _get_cache_key(cache_data, webhook, event_type)
+    response_data = [{"id": "method-1"}]
+    mocked_trigger_webhook_sync.return_value = response_data
+
+    # when
+    result = trigger_webhook_sync_if_not_cached(
+        event_type, "", webhook, cache_data, allow_replica=False
+    )
+
+    # then
+    assert result == response_data
+    mocked_trigger_webhook_sync.assert_called_once()
+    assert cache.get(cache_key) == response_data
+    assert cache.get(f"{cache_key}-stale") == response_data
+    assert cache.get(f"{cache_key}-lock") is None
+
+
+@patch("saleor.webhook.transport.synchronous.transport.time.sleep")
+@patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_waits_for_concurrent_request(
+    mocked_trigger_webhook_sync, mocked_sleep, webhook
+):
+    # given
+    event_type = WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT
+    cache_data = {"id": str(uuid.uuid4())}
+    cache_key = _get_cache_key(cache_data, webhook, event_type)
+    response_data = [{"id": "method-1"}]
+
+    # another worker is sending the same webhook and caches its response
+    cache.add(f"{cache_key}-lock", True, timeout=10)
+    mocked_sleep.side_effect = lambda _: cache.set(cache_key, response_data)
+
+    # when
+    result = trigger_webhook_sync_if_not_cached(
+        event_type, "", webhook, cache_data, allow_replica=False
+    )
+
+    # then
+    assert result == response_data
+    mocked_sleep.assert_called_once()
+    mocked_trigger_webhook_sync.assert_not_called()
+    cache.delete(f"{cache_key}-lock")
+
+
+@patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_returns_stale_response(
+    mocked_trigger_webhook_sync, webhook, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_CACHE_STALE_TTL = 10
+    event_type = WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT
+    cache_data = {"id": str(uuid.uuid4())}
+    cache_key = _get_cache_key(cache_data, webhook, event_type)
+    stale_response_data = [{"id": "method-1"}]
+
+    # another worker is refreshing the expired response
+    cache.add(f"{cache_key}-lock", True, timeout=10)
+    cache.set(f"{cache_key}-stale", stale_response_data, timeout=10)
+
+    # when
+    result = trigger_webhook_sync_if_not_cached(
+        event_type, "", webhook, cache_data, allow_replica=False
+    )
+
+    # then
+    assert result == stale_response_data
+    mocked_trigger_webhook_sync.assert_not_called()
+    cache.delete(f"{cache_key}-lock")
+
+
+@patch("saleor.webhook.transport.synchronous.transport.time.sleep")
+@patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_sends_request_when_lock_released(
+    mocked_trigger_webhook_sync, mocked_sleep, webhook
+):
+    # given
+    event_type = WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT
+    cache_data = {"id": str(uuid.uuid4())}
+    cache_key = _get_cache_key(cache_data, webhook, event_type)
+    response_data = [{"id": "method-1"}]
+    mocked_trigger_webhook_sync.return_value = response_data
+
+    # another worker fails without caching the response
+    cache.add(f"{cache_key}-lock", True, timeout=10)
+    mocked_sleep.side_effect = lambda _: cache.delete(f"{cache_key}-lock")
+
+    # when
+    result = trigger_webhook_sync_if_not_cached(
+        event_type, "", webhook, cache_data, allow_replica=False
+    )
+
+    # then
+    assert result == response_data
+    mocked_trigger_webhook_sync.assert_called_once()
+    assert cache.get(cache_key) == response_data
@@ -1,5 +1,6 @@
 import json
 import logging
+import time
 from collections.abc import Callable
 from json import JSONDecodeError
 from typing import TYPE_CHECKING, Any, TypeVar
@@ -105,11 +106,10 @@ def _send_webhook_request_sync(
     delivery, timeout=settings.WEBHOOK_SYNC_TIMEOUT, attempt=None
 ) -> tuple[WebhookResponse, dict[Any, Any] | None]:
     event_payload = delivery.payload
-    data = event_payload.get_payload()
+    message = event_payload.get_payload_bytes()
     webhook = delivery.webhook
     parts = urlparse(webhook.target_url)
     domain = get_domain()
-    message = data.encode("utf-8")
     payload_size = len(message)
     signature = signature_for_payload(message, webhook.secret_key)
     response = WebhookResponse(content="", status=EventDeliveryStatus.FAILED)
@@ -186,6 +186,38 @@ def send_webhook_request_sync(
     return response_data if response.status == EventDeliveryStatus.SUCCESS else None
 
 
+def _get_timeout_in_seconds(timeout) -> float:
+    # requests accept either a single timeout or a (connect, read) tuple
+    if isinstance(timeout, tuple):
+        return float(sum(timeout))
+    return float(timeout)
+
+
+def _wait_for_cached_response(
+    cache_key: str, lock_key: str, stale_cache_key: str, timeout: float
+):
+    """Wait for the response of the webhook sent by another worker.
+
+    Return the stale response right away if it's still cached. Return `None`
+    when the other worker has not cached the response before the lock expired.
+    """
+    if settings.WEBHOOK_SYNC_CACHE_STALE_TTL:
+        stale_response_data = cache.get(stale_cache_key)
+        if stale_response_data is not None:
+            return stale_response_data
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(const.SYNC_WEBHOOK_CACHE_LOCK_POLL_INTERVAL)
+        response_data = cache.get(cache_key)
+        if response_data is not None:
+            return response_data
+        if cache.get(lock_key) is None:
+            # the other worker has finished without caching the response
+            break
+    return None
+
+
 def trigger_webhook_sync_if_not_cached(
     event_type: str,
     payload: str,
@@ -203,12 +235,27 @@ def trigger_webhook_sync_if_not_cached(
 
     - Send a synchronous webhook request if cache is expired.
     - Fetch response from cache if it is still valid.
+
+    Concurrent calls with the same cache key are coalesced: only one of them sends
+    the request while the others wait for its cached response, or get the stale
+    response when `WEBHOOK_SYNC_CACHE_STALE_TTL` is set.
     """
 
     cache_key = generate_cache_key_for_webhook(
         cache_data, webhook.target_url, event_type, webhook.app_id
     )
     response_data = cache.get(cache_key)
+    if response_data is None:
+        lock_key = f"{cache_key}-lock"
+        stale_cache_key = f"{cache_key}-stale"
+        lock_timeout = _get_timeout_in_seconds(
+            request_timeout or settings.WEBHOOK_SYNC_TIMEOUT
+        )
+        is_locked = cache.add(lock_key, True, timeout=lock_timeout)
+        if not is_locked:
+            response_data = _wait_for_cached_response(
+                cache_key, lock_key, stale_cache_key, lock_timeout
+            )
     if response_data == const.SYNC_WEBHOOK_FAILURE_SENTINEL:
         # Prevent sending webhook if the previous one failed recently.
         logger.warning(
@@ -218,29 +265,36 @@ def trigger_webhook_sync_if_not_cached(
         )
         return None
     if response_data is None:
-        response_data = trigger_webhook_sync(
-            event_type,
-            payload,
-            webhook,
-            allow_replica,
-            subscribable_object=subscribable_object,
-            timeout=request_timeout,
-            request=request,
-            requestor=requestor,
-            pregenerated_subscription_payload=pregenerated_subscription_payload,
-        )
-        if response_data is not None:
-            cache.set(
-                cache_key,
-                response_data,
-                timeout=cache_timeout or const.WEBHOOK_CACHE_DEFAULT_TTL,
-            )
-        else:
-            cache.set(
-                cache_key,
-                const.SYNC_WEBHOOK_FAILURE_SENTINEL,
-                timeout=const.SYNC_WEBHOOK_FAILURE_CACHE_TTL,
+        try:
+            response_data = trigger_webhook_sync(
+                event_type,
+                payload,
+                webhook,
+                allow_replica,
+                subscribable_object=subscribable_object,
+                timeout=request_timeout,
+                request=request,
+                requestor=requestor,
+                pregenerated_subscription_payload=pregenerated_subscription_payload,
             )
+            if response_data is not None:
+                cache_timeout = cache_timeout or const.WEBHOOK_CACHE_DEFAULT_TTL
+                cache.set(cache_key, response_data, timeout=cache_timeout)
+                if settings.WEBHOOK_SYNC_CACHE_STALE_TTL:
+                    cache.set(
+                        stale_cache_key,
+                        response_data,
+                        timeout=cache_timeout + settings.WEBHOOK_SYNC_CACHE_STALE_TTL,
+                    )
+            else:
+                cache.set(
+                    cache_key,
+                    const.SYNC_WEBHOOK_FAILURE_SENTINEL,
+                    timeout=const.SYNC_WEBHOOK_FAILURE_CACHE_TTL,
+                )
+        finally:
+            if is_locked:
+                cache.delete(lock_key)
     return response_data
 
 
@@ -6,8 +6,9 @@ from collections.abc import Callable
 from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
+from functools import partial
 from time import time
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from urllib.parse import unquote, urlparse, urlunparse
 from uuid import UUID
 
@@ -17,8 +18,9 @@ from celery import Task
 from celery.exceptions import MaxRetriesExceededError, Retry
 from celery.utils.log import get_task_logger
 from django.conf import settings
-from django.db.models import Count
+from django.db.models import Count, Max, Q
 from django.urls import reverse
+from django.utils import timezone
 from google.cloud import pubsub_v1
 from requests import RequestException
 from requests_hardened.ip_filter import InvalidIPAddress
@@ -33,7 +35,7 @@ from ...core.models import (
     EventDeliveryStatus,
     EventPayload,
 )
-from ...core.tasks import delete_files_from_private_storage_task
+from ...core.tasks import delete_event_payload_files_task
 from ...core.telemetry import tracer
 from ...core.utils import build_absolute_uri
 from ...core.utils.url import sanitize_url_for_logging
@@ -42,6 +44,9 @@ from ..const import APP_ID_PREFIX
 from ..models import Webhook
 from . import signature_for_payload
 
+if TYPE_CHECKING:
+    from requests import Session
+
 logger = logging.getLogger(__name__)
 task_logger = get_task_logger(f"{__name__}.celery")
 
@@ -137,6 +142,7 @@ def send_webhook_using_http(
     event_type,
     timeout=settings.WEBHOOK_TIMEOUT,
     custom_headers: dict[str, str] | None = None,
+    session: Optional["Session"] = None,
 ) -> WebhookResponse:
     """Send a webhook request using http / https protocol.
 
@@ -147,6 +153,8 @@ def send_webhook_using_http(
     :param event_type: Webhook event type.
     :param timeout: Request timeout.
     :param custom_headers: Custom headers which will be added to request headers.
+    :param session: Session used to send the request, keeps the connections alive
+        between requests. A new session is used for each request if not provided.
 
     :return: WebhookResponse object.
     """
@@ -166,8 +174,9 @@ def send_webhook_using_http(
     if custom_headers:
         headers.update(custom_headers)
 
+    send_request = session.request if session else HTTPClient.send_request
     try:
-        response = HTTPClient.send_request(
+        response = send_request(
             "POST",
             target_url,
             data=message,
@@ -306,13 +315,19 @@ def send_webhook_using_scheme_method(
     event_type,
     data,
     custom_headers=None,
+    session: Optional["Session"] = None,
 ) -> WebhookResponse:
     parts = urlparse(target_url)
     message = data if isinstance(data, bytes) else data.encode("utf-8")
     signature = signature_for_payload(message, secret)
+    send_using_http = (
+        partial(send_webhook_using_http, session=session)
+        if session
+        else send_webhook_using_http
+    )
     scheme_matrix: dict[WebhookSchemes, Callable] = {
-        WebhookSchemes.HTTP: send_webhook_using_http,
-        WebhookSchemes.HTTPS: send_webhook_using_http,
+        WebhookSchemes.HTTP: send_using_http,
+        WebhookSchemes.HTTPS: send_using_http,
         WebhookSchemes.AWS_SQS: send_webhook_using_aws_sqs,
         WebhookSchemes.GOOGLE_CLOUD_PUBSUB: send_webhook_using_google_cloud_pubsub,
     }
@@ -407,24 +422,57 @@ def get_delivery_for_webhook(
 
 
 def get_deliveries_for_app(
-    app_id, batch_size
-) -> dict[int, "EventDeliveryWithAttemptCount"]:
+    app_id, batch_size, retry_delays: list[datetime.timedelta]
+) -> tuple[dict[int, "EventDeliveryWithAttemptCount"], set[int]]:
+    """Return pending deliveries of the app which are due to be sent.
+
+    A delivery with `n` attempts is due `retry_delays[n - 1]` after its last
+    attempt, the last delay applies to any further attempts. Deliveries of
+    inactive webhooks or apps are marked as failed and their ids are returned
+    separately.
+    """
+    now = timezone.now()
+    due_lookup = Q(attempts_count=0)
+    for attempts_count, delay in enumerate(retry_delays, start=1):
+        if attempts_count < len(retry_delays):
+            attempts_lookup = Q(attempts_count=attempts_count)
+        else:
+            attempts_lookup = Q(attempts_count__gte=attempts_count)
+        due_lookup |= attempts_lookup & Q(last_attempt_at__lte=now - delay)
+
     deliveries = (
         EventDelivery.objects.select_related("payload", "webhook__app")
-        .filter(webhook__app_id=app_id, status=EventDeliveryStatus.PENDING)
-        .order_by("created_at")
+        .filter(
+            webhook__app_id=app_id,
+            status=EventDeliveryStatus.PENDING,
+            payload__isnull=False,
+        )
         .annotate(
             attempts_count=Count("attempts", distinct=True),
-        )[:batch_size]
+            last_attempt_at=Max("attempts__created_at"),
+        )
+        .filter(due_lookup)
+        .order_by("created_at")[:batch_size]
     )
 
-    return {
-        delivery.pk: EventDeliveryWithAttemptCount(
-            delivery=delivery,
-            count=delivery.attempts_count,
+    active_deliveries = {}
+    inactive_delivery_ids = set()
+    for delivery in deliveries:
+        if delivery.webhook.is_active and delivery.webhook.app.is_active:
+            active_deliveries[delivery.pk] = EventDeliveryWithAttemptCount(
+                delivery=delivery,
+                count=delivery.attempts_count,
+            )
+        else:
+            logger.info("Event delivery id: %r app/webhook is disabled.", delivery.pk)
+            inactive_delivery_ids.add(delivery.pk)
+
+    if inactive_delivery_ids:
+        EventDelivery.objects.filter(id__in=inactive_delivery_ids).update(
+            status=EventDeliveryStatus.FAILED
         )
-        for delivery in deliveries
-    }
+
+    return active_deliveries, inactive_delivery_ids
 
 
 def get_multiple_deliveries_for_webhooks(
@@ -554,7 +602,7 @@ def clear_successful_deliveries(deliveries: list["EventDelivery"]):
             if event_payload.payload_file
         ]
         payloads_to_delete.delete()
-        delete_files_from_private_storage_task(files_to_delete)
+        delete_event_payload_files_task(files_to_delete)
 
 
 @allow_writer()